@@ -18,15 +18,386 @@ Author: [Vijay Khanna]
 Date: [11 July 2025]
 """
 
+import asyncio
+import functools
 import json
 import string
 import os
 import time
 import logging
+from collections import Counter, deque
 from datetime import datetime
+import httpx
 from google import genai
 from google.genai import types
 
+# orjson parses and serializes JSON several times faster than the standard library;
+# fall back to json when it is not installed (pip install orjson)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Use the same model as the sample file (newer version)
+GEMINI_MODEL = "gemini-2.5-pro"
+
+# Set GEMINI_USE_BATCH_API=1 to submit all letters as a single Gemini batch job
+# instead of individual streaming calls (suited to unattended regeneration runs)
+USE_BATCH_API = os.environ.get("GEMINI_USE_BATCH_API") == "1"
+# Set GEMINI_BATCH_JOB to the name of an earlier batch job to collect its results
+# instead of submitting a new job (the name is logged when a job is submitted)
+BATCH_JOB_NAME = os.environ.get("GEMINI_BATCH_JOB")
+BATCH_POLL_INTERVAL_SECONDS = 30
+# Short waits between job state checks, so Ctrl+C stops the wait promptly on every platform
+BATCH_WAIT_STEP_SECONDS = 1
+BATCH_COMPLETED_STATES = {
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+}
+
+# Instructions shared by every letter, sent as the system instruction
+WORD_LIST_INSTRUCTION = """
+You build vocabulary lists of intermediate to advanced English words suitable for
+SAT and GRE preparation. For each word, provide its definition and an example sentence.
+
+For the "complexity" field, choose either "Intermediate" or "Advanced":
+- "Intermediate": Words that are moderately difficult, suitable for high school to early college level
+- "Advanced": Words that are very difficult, suitable for college level and above (SAT/GRE level)
+"""
+
+# Complexity labels accepted in generated word data; anything else becomes "Intermediate"
+VALID_COMPLEXITY_LEVELS = frozenset({"Intermediate", "Advanced"})
+
+# Shape of the JSON response, enforced by Gemini (one object per word)
+WORD_LIST_SCHEMA = types.Schema(
+    type=types.Type.ARRAY,
+    items=types.Schema(
+        type=types.Type.OBJECT,
+        properties={
+            "word": types.Schema(type=types.Type.STRING),
+            "complexity": types.Schema(type=types.Type.STRING, enum=["Intermediate", "Advanced"]),
+            "definition": types.Schema(type=types.Type.STRING),
+            "example": types.Schema(type=types.Type.STRING),
+        },
+        required=["word", "complexity", "definition", "example"],
+    ),
+)
+
+# Per-letter prompt; the letter is the only part of a request that varies
+WORD_LIST_PROMPT = "Generate 100 intermediate to advanced English words starting with the letter '{letter}'."
+
+# Safety settings (same as sample file)
+SAFETY_SETTINGS = [
+    types.SafetySetting(
+        category="HARM_CATEGORY_HATE_SPEECH",
+        threshold="OFF"
+    ),
+    types.SafetySetting(
+        category="HARM_CATEGORY_DANGEROUS_CONTENT",
+        threshold="OFF"
+    ),
+    types.SafetySetting(
+        category="HARM_CATEGORY_SEXUALLY_EXPLICIT",
+        threshold="OFF"
+    ),
+    types.SafetySetting(
+        category="HARM_CATEGORY_HARASSMENT",
+        threshold="OFF"
+    )
+]
+
+# Thinking configuration for better reasoning (same as sample file)
+THINKING_CONFIG = types.ThinkingConfig(
+    thinking_budget=-1,
+)
+
+# Generation config shared by every letter request, built once at import time
+WORD_LIST_CONFIG = types.GenerateContentConfig(
+    temperature=0.5,  # Moderate creativity for better word variety
+    top_p=0.95,       # High diversity in word selection
+    seed=0,           # Deterministic results for consistency
+    max_output_tokens=65535,  # Large response size for comprehensive word data
+    # Shared instructions and a server-enforced output schema replace the worked
+    # example that used to be repeated in every prompt
+    system_instruction=WORD_LIST_INSTRUCTION,
+    response_mime_type="application/json",  # Request JSON directly
+    response_schema=WORD_LIST_SCHEMA,
+    safety_settings=SAFETY_SETTINGS,
+    thinking_config=THINKING_CONFIG,
+)
+
+# Bounds and starting point for the number of Gemini requests in flight at once
+MIN_CONCURRENT_REQUESTS = 1
+MAX_CONCURRENT_REQUESTS = 16
+INITIAL_CONCURRENT_REQUESTS = 8
+
+# Average call latency above which concurrency is cut back
+LATENCY_TARGET_SECONDS = 120
+
+# Retry delays: malformed JSON is a generation problem and is retried almost at once,
+# while API errors back off exponentially up to MAX_RETRY_DELAY_SECONDS
+JSON_RETRY_DELAY_SECONDS = 0.5
+MAX_RETRY_DELAY_SECONDS = 45
+
+# Consecutive 429 responses that pause every worker, and the pause used
+# when the API does not send a retry-after header
+CIRCUIT_BREAKER_THRESHOLD = 3
+CIRCUIT_BREAKER_PAUSE_SECONDS = 30
+
+# Gemini quota for the project, enforced over a sliding one-minute window
+REQUESTS_PER_MINUTE = 30
+TOKENS_PER_MINUTE = 1_000_000
+
+# Token budget reserved for a call before its real usage is known
+ESTIMATED_TOKENS_PER_REQUEST = 20_000
+
+
+class RateLimiter:
+    """
+    Sliding-window limiter for Gemini requests-per-minute and tokens-per-minute quotas.
+    
+    Every call reserves a slot (and an estimated token count) before it is sent.
+    Calls go out immediately while the last minute is under quota and wait exactly
+    until the oldest call leaves the window once it is exhausted. When the API
+    asks us to back off, pause() blocks all callers until the requested time.
+    """
+    
+    def __init__(self, requests_per_minute, tokens_per_minute, window_seconds=60):
+        """
+        Args:
+            requests_per_minute (int): Maximum requests allowed in the window
+            tokens_per_minute (int): Maximum tokens allowed in the window
+            window_seconds (float): Length of the sliding window in seconds
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.window_seconds = window_seconds
+        self.calls = deque()  # [timestamp, tokens] for each call in the window
+        self.tokens_in_window = 0
+        self.blocked_until = 0.0
+        self.throttle_delay_floor = 0.0
+        self.lock = asyncio.Lock()
+    
+    def _prune(self, now):
+        while self.calls and self.calls[0][0] <= now - self.window_seconds:
+            _, tokens = self.calls.popleft()
+            self.tokens_in_window -= tokens
+    
+    async def acquire(self, estimated_tokens=ESTIMATED_TOKENS_PER_REQUEST):
+        """
+        Wait until a call fits in the quota and reserve it.
+        
+        Args:
+            estimated_tokens (int): Tokens to reserve for this call
+        
+        Returns:
+            list: The reservation, to be passed to record_usage() once the call finishes
+        """
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self._prune(now)
+                
+                wait = self.blocked_until - now
+                if wait <= 0 and self.calls:
+                    if (len(self.calls) >= self.requests_per_minute or
+                            self.tokens_in_window + estimated_tokens > self.tokens_per_minute):
+                        wait = self.calls[0][0] + self.window_seconds - now
+                
+                if wait <= 0:
+                    reservation = [now, estimated_tokens]
+                    self.calls.append(reservation)
+                    self.tokens_in_window += estimated_tokens
+                    return reservation
+                
+                await asyncio.sleep(wait)
+    
+    def record_usage(self, reservation, actual_tokens):
+        """
+        Replace the estimated token count of a finished call with its real usage.
+        
+        Args:
+            reservation (list): Value returned by acquire()
+            actual_tokens (int): Tokens reported by the API for the call
+        """
+        if any(call is reservation for call in self.calls):
+            self.tokens_in_window += actual_tokens - reservation[1]
+        reservation[1] = actual_tokens
+    
+    def pause(self, seconds):
+        """
+        Block every caller for the given number of seconds (e.g. from a retry-after header).
+        
+        Args:
+            seconds (float): How long to stop sending requests
+        """
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+    
+    def throttle_delay(self, delay):
+        """
+        Return the retry delay to use after a 429, never shorter than any earlier one.
+        
+        Quota exhaustion tends to persist for the rest of the run, so once a long
+        delay was needed the floor stays there instead of starting over per letter.
+        
+        Args:
+            delay (float): Delay suggested for this attempt
+        
+        Returns:
+            float: The delay to wait
+        """
+        self.throttle_delay_floor = max(self.throttle_delay_floor, delay)
+        return self.throttle_delay_floor
+
+
+class AdmissionController:
+    """
+    Adaptive concurrency limit for Gemini calls using additive-increase/multiplicative-decrease.
+    
+    Each successful call that keeps the average latency under the target raises the
+    limit by half a slot; a throttled (429), failed (5xx) or slow call halves it.
+    After CIRCUIT_BREAKER_THRESHOLD consecutive 429s every worker is paused until the
+    server's retry-after delay has passed.
+    """
+    
+    def __init__(self, initial_concurrency=INITIAL_CONCURRENT_REQUESTS,
+                 min_concurrency=MIN_CONCURRENT_REQUESTS, max_concurrency=MAX_CONCURRENT_REQUESTS,
+                 latency_target=LATENCY_TARGET_SECONDS, logger=None):
+        """
+        Args:
+            initial_concurrency (int): Number of calls allowed in flight at start
+            min_concurrency (int): Lower bound for the limit
+            max_concurrency (int): Upper bound for the limit
+            latency_target (float): Average latency in seconds the controller aims to stay under
+            logger (logging.Logger, optional): Logger instance for limit changes
+        """
+        self.limit = float(initial_concurrency)
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.latency_target = latency_target
+        self.logger = logger
+        self.in_flight = 0
+        self.avg_latency = None
+        self.consecutive_throttles = 0
+        self.paused_until = 0.0
+        self.condition = asyncio.Condition()
+    
+    async def acquire(self):
+        """
+        Wait for a free slot under the current limit (and for any circuit-breaker pause to end).
+        """
+        async with self.condition:
+            while True:
+                wait = self.paused_until - time.monotonic()
+                if wait <= 0 and self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return
+                try:
+                    await asyncio.wait_for(self.condition.wait(), timeout=wait if wait > 0 else None)
+                except asyncio.TimeoutError:
+                    pass
+    
+    async def release(self, latency, error=None):
+        """
+        Free a slot and adjust the limit from the outcome of the call.
+        
+        Args:
+            latency (float): Duration of the call in seconds
+            error (Exception, optional): The API error raised by the call, if any
+        """
+        async with self.condition:
+            self.in_flight -= 1
+            status = getattr(error, "code", None)
+            
+            if self.avg_latency is None:
+                self.avg_latency = latency
+            else:
+                self.avg_latency = 0.7 * self.avg_latency + 0.3 * latency
+            
+            if status == 429:
+                self.consecutive_throttles += 1
+            else:
+                self.consecutive_throttles = 0
+            
+            previous_limit = self.limit
+            if error is None and self.avg_latency <= self.latency_target:
+                self.limit = min(self.max_concurrency, self.limit + 0.5)
+            elif error is None or status == 429 or (isinstance(status, int) and status >= 500):
+                self.limit = max(self.min_concurrency, self.limit * 0.5)
+            
+            if self.consecutive_throttles >= CIRCUIT_BREAKER_THRESHOLD:
+                pause = get_retry_after(error) or CIRCUIT_BREAKER_PAUSE_SECONDS
+                self.paused_until = max(self.paused_until, time.monotonic() + pause)
+                self.consecutive_throttles = 0
+                if self.logger:
+                    self.logger.warning("Circuit breaker tripped after %s throttled calls; "
+                                        "pausing all requests for %s seconds",
+                                        CIRCUIT_BREAKER_THRESHOLD, pause)
+            
+            if self.logger and int(self.limit) != int(previous_limit):
+                self.logger.info("Concurrency limit changed from %s to %s", int(previous_limit), int(self.limit))
+            
+            self.condition.notify_all()
+    
+    async def cancel(self):
+        """
+        Free a slot whose call was never made, leaving the limit unchanged.
+        """
+        async with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
+
+
+@functools.lru_cache(maxsize=1)
+def get_client():
+    """
+    Create the Google Gemini AI client once and reuse it for every request.
+    
+    Building the client runs credential discovery and opens a new connection pool,
+    so it is cached instead of being created per letter or per retry. The pool is
+    sized for MAX_CONCURRENT_REQUESTS calls in flight.
+    
+    Returns:
+        genai.Client: The shared Vertex AI Gemini client
+    """
+    # Note: You need to have proper authentication set up (service account key or API key)
+    return genai.Client(
+        vertexai=True,
+        project=os.environ.get("GOOGLE_CLOUD_PROJECT"),  # Replaced hardcoded project ID
+        location="global",
+        http_options=types.HttpOptions(
+            async_client_args={
+                "limits": httpx.Limits(
+                    max_connections=2 * MAX_CONCURRENT_REQUESTS,
+                    max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+                ),
+            },
+        ),
+    )
+
+
+def get_retry_after(error):
+    """
+    Extract the server-requested retry delay from a Gemini API error, if any.
+    
+    Args:
+        error (Exception): The exception raised by the API call
+    
+    Returns:
+        float: Seconds to wait, or None if the error carries no retry-after header
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
 
 # Configure logging
 def setup_logging():
@@ -37,8 +408,7 @@ def setup_logging():
         logging.Logger: Configured logger instance
     """
     # Create logs directory if it doesn't exist
-    if not os.path.exists('logs'):
-        os.makedirs('logs')
+    os.makedirs('logs', exist_ok=True)
     
     # Create a unique log filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -55,10 +425,31 @@ def setup_logging():
     )
     
     logger = logging.getLogger(__name__)
-    logger.info(f"Logging initialized. Log file: {log_filename}")
+    logger.info("Logging initialized. Log file: %s", log_filename)
     return logger
 
 
+def normalize_complexity(word, word_data, logger=None):
+    """
+    Return the word's complexity, defaulting unknown values to "Intermediate".
+    
+    Args:
+        word (str): The word being checked
+        word_data (dict): The word's details from Gemini
+        logger (logging.Logger, optional): Logger instance for logging unknown values
+    
+    Returns:
+        str: "Intermediate" or "Advanced"
+    """
+    complexity = word_data.get("complexity", "Unknown")
+    if complexity not in VALID_COMPLEXITY_LEVELS:
+        # Default to Intermediate for unknown complexity
+        complexity = "Intermediate"
+        if logger:
+            logger.warning("Unknown complexity for word '%s', defaulting to 'Intermediate'", word)
+    return complexity
+
+
 def calculate_word_statistics(word_batch, letter, logger=None):
     """
     Calculate statistics for a batch of words after receiving them from Gemini LLM.
@@ -80,218 +471,594 @@ def calculate_word_statistics(word_batch, letter, logger=None):
         }
     
     # Calculate basic statistics
+    # Counter does the counting in C, so each distribution is a single pass
     total_words = len(word_batch)
-    complexity_dist = {}
-    word_length_stats = {}
-    pos_distribution = {}
-    
-    for word, word_data in word_batch.items():
-        # Complexity distribution - ensure proper categorization
-        complexity = word_data.get("complexity", "Unknown")
-        if complexity not in ["Intermediate", "Advanced"]:
-            # Default to Intermediate for unknown complexity
-            complexity = "Intermediate"
-            if logger:
-                logger.warning(f"Unknown complexity for word '{word}', defaulting to 'Intermediate'")
-        
-        complexity_dist[complexity] = complexity_dist.get(complexity, 0) + 1
-        
-        # Word length statistics
-        word_length = len(word)
-        word_length_stats[word_length] = word_length_stats.get(word_length, 0) + 1
-        
-        # Part of speech distribution (if available)
-        if "meanings" in word_data and word_data["meanings"]:
-            for meaning in word_data["meanings"]:
-                pos = meaning.get("part_of_speech", "Unknown")
-                pos_distribution[pos] = pos_distribution.get(pos, 0) + 1
+    
+    # Complexity distribution - ensure proper categorization
+    complexity_dist = Counter(
+        normalize_complexity(word, word_data, logger) for word, word_data in word_batch.items()
+    )
+    
+    # Word length statistics
+    word_length_stats = Counter(map(len, word_batch))
+    
+    # Part of speech distribution (if available)
+    pos_distribution = Counter(
+        meaning.get("part_of_speech", "Unknown")
+        for word_data in word_batch.values()
+        for meaning in word_data.get("meanings") or ()
+    )
     
     # Log complexity distribution for debugging
     if logger:
-        logger.info(f"Complexity distribution for letter {letter}: {complexity_dist}")
+        logger.info("Complexity distribution for letter %s: %s", letter, complexity_dist)
     
     return {
         "total_words": total_words,
-        "complexity_distribution": complexity_dist,
-        "word_length_stats": word_length_stats,
-        "part_of_speech_distribution": pos_distribution
+        "complexity_distribution": dict(complexity_dist),
+        "word_length_stats": dict(word_length_stats),
+        "part_of_speech_distribution": dict(pos_distribution)
     }
 
 
-def get_words_for_alphabet_with_retry(letter, logger, max_retries=3, base_delay=2):
+def build_letter_request(letter):
+    """
+    Build the Gemini prompt contents for a single letter.
+    
+    Args:
+        letter (str): A single letter of the alphabet (A-Z)
+    
+    Returns:
+        tuple: (contents, generate_content_config) ready to send to the model
+    """
+    # Only the letter changes per call; everything else is prebuilt in WORD_LIST_CONFIG
+    contents = [
+        types.Content(
+            role="user",
+            parts=[types.Part.from_text(text=WORD_LIST_PROMPT.format(letter=letter.upper()))]
+        ),
+    ]
+    
+    return contents, WORD_LIST_CONFIG
+
+
+def parse_word_batch(full_response, letter, logger):
+    """
+    Parse and validate the raw JSON text returned by Gemini for a letter.
+    
+    Args:
+        full_response (str): The model's response text
+        letter (str): The letter the words start with
+        logger (logging.Logger): Logger instance for detailed logging
+    
+    Returns:
+        dict: Words and their details, with complexity normalized
+    
+    Raises:
+        json.JSONDecodeError: If the response is not valid JSON
+        ValueError: If the response is not a JSON list of word objects
+    """
+    # Parse the JSON response; the schema guarantees a list of word objects
+    word_list = orjson.loads(full_response.encode('utf-8')) if orjson else json.loads(full_response)
+    
+    # Validate the response structure
+    if not isinstance(word_list, list):
+        raise ValueError(f"Expected list response, got {type(word_list)}")
+    
+    # Key the words by name, as stored in the vocabulary file
+    word_data = {}
+    for entry in word_list:
+        if not isinstance(entry, dict) or not isinstance(entry.get("word"), str):
+            raise ValueError(f"Expected word object with a 'word' string, got {entry!r}")
+        word = entry.pop("word")
+        word_data[word] = entry
+    
+    # Validate and fix complexity classifications
+    complexity_fixes = 0
+    for word, word_info in word_data.items():
+        if word_info.get("complexity") not in VALID_COMPLEXITY_LEVELS:
+            # Default to Intermediate if complexity is missing or invalid
+            word_info["complexity"] = "Intermediate"
+            complexity_fixes += 1
+
+    if complexity_fixes > 0:
+        logger.warning("Fixed %s invalid complexity classifications for letter %s", complexity_fixes, letter)
+
+    word_count = len(word_data)
+    logger.info("Successfully parsed %s words for letter %s", word_count, letter)
+
+    # Log some sample words for verification
+    sample_words = list(word_data.keys())[:3]
+    logger.info("Sample words for letter %s: %s", letter, sample_words)
+
+    return word_data
+
+
+async def get_words_for_alphabet_with_retry(client, letter, limiter, controller, logger,
+                                            max_retries=3, base_delay=2, stop_event=None):
     """
     Calls the Gemini LLM to get 100 Intermediate to Advanced English words for a 
     specific alphabet letter with retry logic and backoff.
     
     Args:
+        client (genai.Client): Shared Gemini client used for every request
         letter (str): A single letter of the alphabet (A-Z)
+        limiter (RateLimiter): Shared limiter keeping calls within the Gemini quota
+        controller (AdmissionController): Shared adaptive limit on concurrent calls
         logger (logging.Logger): Logger instance for detailed logging
         max_retries (int): Maximum number of retry attempts
         base_delay (int): Base delay in seconds for exponential backoff
+        stop_event (asyncio.Event, optional): When set, no further request is made
     
     Returns:
         dict: A dictionary containing words and their detailed information, or None if error
     """
-    logger.info(f"Starting word generation for letter: {letter}")
+    logger.info("Starting word generation for letter: %s", letter)
+    
+    # The request is identical on every attempt, so build it once
+    contents, generate_content_config = build_letter_request(letter)
     
     for attempt in range(max_retries + 1):
+        if stop_event is not None and stop_event.is_set():
+            logger.info("Skipping letter '%s' because saving has been stopped.", letter)
+            return None
+        
         try:
-            logger.info(f"Attempt {attempt + 1}/{max_retries + 1} for letter {letter}")
-            
-            # Initialize the Google Gemini AI client
-            # Note: You need to have proper authentication set up (service account key or API key)
-            client = genai.Client(
-                vertexai=True,
-                project=os.environ.get("GOOGLE_CLOUD_PROJECT"),  # Replaced hardcoded project ID
-                location="global",
-            )
+            logger.info("Attempt %s/%s for letter %s", attempt + 1, max_retries + 1, letter)
 
-            # Use the same model as the sample file (newer version)
-            model = "gemini-2.5-pro"
-            
-            # Create a detailed prompt that instructs the AI to generate comprehensive word data
-            # The prompt includes an example to show the expected JSON structure
-            prompt = f"""
-            Please provide a list of 100 intermediate to Advanced English words starting with 
-            the letter '{letter.upper()}', suitable for SAT and GRE preparation. For each word, 
-            provide its definition and an example sentence. 
-            The output MUST be a valid JSON object where each key is the word and the value 
-            is an object with simplified structure.
-
-            IMPORTANT: For the "complexity" field, choose either "Intermediate" or "Advanced":
-            - "Intermediate": Words that are moderately difficult, suitable for high school to early college level
-            - "Advanced": Words that are very difficult, suitable for college level and above (SAT/GRE level)
-
-            Do not include any text or formatting before or after the JSON object.
-
-            Example for the letter 'A':
-            {{
-              "Abnegation": {{
-                "complexity": "Intermediate",
-                "definition": "The act of renouncing or rejecting something desired or valuable.",
-                "example": "Her abnegation of rich food was an act of solidarity with the poor."
-              }},
-              "Acquiesce": {{
-                "complexity": "Advanced",
-                "definition": "To accept something reluctantly but without protest.",
-                "example": "While I did not want to go to the party, I had to acquiesce because my friend insisted."
-              }}
-            }}
-            """
+            # Wait for a concurrency slot and for room in the per-minute quota
+            await controller.acquire()
+            if stop_event is not None and stop_event.is_set():
+                # Saving failed while this letter was waiting for a slot
+                await controller.cancel()
+                logger.info("Skipping letter '%s' because saving has been stopped.", letter)
+                return None
+            reservation = await limiter.acquire()
             
-            # Prepare the content for the AI model (same structure as sample)
-            contents = [
-                types.Content(
-                    role="user",
-                    parts=[types.Part.from_text(text=prompt)]
-                ),
-            ]
-
-            # Configure the AI model parameters using the same approach as sample file
-            # This includes safety settings and thinking configuration for better results
-            generate_content_config = types.GenerateContentConfig(
-                temperature=0.5,  # Moderate creativity for better word variety
-                top_p=0.95,       # High diversity in word selection
-                seed=0,           # Deterministic results for consistency
-                max_output_tokens=65535,  # Large response size for comprehensive word data
-                response_mime_type="application/json",  # Request JSON directly
-                # Safety settings (same as sample file)
-                safety_settings=[
-                    types.SafetySetting(
-                        category="HARM_CATEGORY_HATE_SPEECH",
-                        threshold="OFF"
-                    ),
-                    types.SafetySetting(
-                        category="HARM_CATEGORY_DANGEROUS_CONTENT",
-                        threshold="OFF"
-                    ),
-                    types.SafetySetting(
-                        category="HARM_CATEGORY_SEXUALLY_EXPLICIT",
-                        threshold="OFF"
-                    ),
-                    types.SafetySetting(
-                        category="HARM_CATEGORY_HARASSMENT",
-                        threshold="OFF"
-                    )
-                ],
-                # Thinking configuration for better reasoning (same as sample file)
-                thinking_config=types.ThinkingConfig(
-                    thinking_budget=-1,
-                ),
-            )
-
-            logger.info(f"Making API call to Gemini for letter {letter}")
+            logger.info("Making API call to Gemini for letter %s", letter)
             
-            # Use streaming response like the sample file for better handling
+            # Request the whole JSON document in one response; nothing is shown
+            # while it is generated, so streaming would only add per-chunk overhead
             full_response = ""
-            for chunk in client.models.generate_content_stream(
-                model=model,
-                contents=contents,
-                config=generate_content_config,
-            ):
-                if (not chunk.candidates or 
-                    not chunk.candidates[0].content or 
-                    not chunk.candidates[0].content.parts):
-                    continue
-                full_response += chunk.text
-            
-            logger.info(f"Received response for letter {letter}, length: {len(full_response)} characters")
-            
-            # Clean up the response text to ensure it's valid JSON
-            # Remove any markdown formatting that might be included
-            json_text = full_response.strip().replace("```json", "").replace("```", "")
-            
-            # Parse the JSON response and return the word data
-            word_data = json.loads(json_text)
-            
-            # Validate the response structure
-            if not isinstance(word_data, dict):
-                raise ValueError(f"Expected dictionary response, got {type(word_data)}")
-            
-            # Validate and fix complexity classifications
-            complexity_fixes = 0
-            for word, word_info in word_data.items():
-                if "complexity" not in word_info or word_info["complexity"] not in ["Intermediate", "Advanced"]:
-                    # Default to Intermediate if complexity is missing or invalid
-                    word_info["complexity"] = "Intermediate"
-                    complexity_fixes += 1
-            
-            if complexity_fixes > 0:
-                logger.warning(f"Fixed {complexity_fixes} invalid complexity classifications for letter {letter}")
+            call_started = time.monotonic()
+            try:
+                response = await client.aio.models.generate_content(
+                    model=GEMINI_MODEL,
+                    contents=contents,
+                    config=generate_content_config,
+                )
+            except Exception as e:
+                await controller.release(time.monotonic() - call_started, e)
+                raise
+            await controller.release(time.monotonic() - call_started)
+            full_response = response.text or ""
             
-            word_count = len(word_data)
-            logger.info(f"Successfully parsed {word_count} words for letter {letter}")
+            usage_metadata = response.usage_metadata
+            if usage_metadata and usage_metadata.total_token_count:
+                limiter.record_usage(reservation, usage_metadata.total_token_count)
             
-            # Log some sample words for verification
-            sample_words = list(word_data.keys())[:3]
-            logger.info(f"Sample words for letter {letter}: {sample_words}")
+            logger.info("Received response for letter %s, length: %s characters", letter, len(full_response))
             
-            return word_data
+            return parse_word_batch(full_response, letter, logger)
 
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON parsing error for letter {letter} (attempt {attempt + 1}): {e}")
-            logger.error(f"Raw response length: {len(full_response) if 'full_response' in locals() else 0}")
+        except ValueError as e:
+            # Malformed JSON (json.JSONDecodeError) or JSON that is not a list of word objects
+            logger.error("JSON parsing error for letter %s (attempt %s): %s", letter, attempt + 1, e)
+            logger.error("Raw response length: %s", len(full_response) if 'full_response' in locals() else 0)
             if attempt < max_retries:
-                delay = base_delay * (2 ** attempt)  # Exponential backoff
-                logger.info(f"Retrying in {delay} seconds...")
-                time.sleep(delay)
+                # A malformed response says nothing about API load, so ask again right away
+                logger.info("Retrying in %s seconds...", JSON_RETRY_DELAY_SECONDS)
+                await asyncio.sleep(JSON_RETRY_DELAY_SECONDS)
             else:
-                logger.error(f"Failed to parse JSON after {max_retries + 1} attempts for letter {letter}")
+                logger.error("Failed to parse JSON after %s attempts for letter %s", max_retries + 1, letter)
                 return None
                 
         except Exception as e:
-            logger.error(f"API error for letter {letter} (attempt {attempt + 1}): {e}")
+            retry_after = get_retry_after(e)
+            if getattr(e, "code", None) == 429:
+                # Rate limited: wait as long as the server asks, or back off exponentially
+                logger.error("Rate limited for letter %s (attempt %s): %s", letter, attempt + 1, e)
+                delay = limiter.throttle_delay(
+                    retry_after or min(MAX_RETRY_DELAY_SECONDS, base_delay * (2 ** attempt))
+                )
+            else:
+                # Server error or network problem: capped exponential backoff
+                logger.error("API error for letter %s (attempt %s): %s", letter, attempt + 1, e)
+                delay = min(MAX_RETRY_DELAY_SECONDS, base_delay * (2 ** attempt))
+            if retry_after:
+                # Stop every worker, not just this one, until the quota frees up
+                logger.warning("Gemini asked to retry after %s seconds; pausing all requests", retry_after)
+                limiter.pause(retry_after)
             if attempt < max_retries:
-                delay = base_delay * (2 ** attempt)  # Exponential backoff
-                logger.info(f"Retrying in {delay} seconds...")
-                time.sleep(delay)
+                logger.info("Retrying in %s seconds...", delay)
+                await asyncio.sleep(delay)
             else:
-                logger.error(f"Failed after {max_retries + 1} attempts for letter {letter}")
+                logger.error("Failed after %s attempts for letter %s", max_retries + 1, letter)
                 return None
     
     return None
 
 
+async def process_letter(client, letter, limiter, controller, queue, stop_event, logger):
+    """
+    Generate the words for a single letter and hand them to the checkpoint writer.
+    
+    Args:
+        client (genai.Client): Shared Gemini client
+        letter (str): The letter to generate words for
+        limiter (RateLimiter): Shared limiter keeping calls within the Gemini quota
+        controller (AdmissionController): Shared adaptive limit on concurrent calls
+        queue (asyncio.Queue): Queue feeding successful batches to the checkpoint writer
+        stop_event (asyncio.Event): Set by the writer when checkpoints can no longer be saved
+        logger (logging.Logger): Logger instance for detailed logging
+    """
+    if stop_event.is_set():
+        logger.info("Skipping letter '%s' because saving has been stopped.", letter)
+        return
+    
+    logger.info("Processing letter: %s", letter)
+    
+    # Generate words for the current letter using the AI with retry logic
+    word_batch = await get_words_for_alphabet_with_retry(client, letter, limiter, controller, logger,
+                                                         stop_event=stop_event)
+    
+    if word_batch:
+        await queue.put((letter, word_batch))
+    elif not stop_event.is_set():
+        logger.error("❌ Failed to generate words for letter '%s' after all retry attempts", letter)
+
+
+async def checkpoint_writer(all_words, checkpoint_file, checkpoint_filename, queue, save_lock,
+                            stop_event, logger):
+    """
+    Single consumer that merges finished letters into all_words and checkpoints them.
+    
+    Workers only enqueue their results, so a slow write never blocks an API call.
+    Each letter is appended as one line to the JSONL checkpoint file instead of
+    rewriting the whole vocabulary file; letters that finish together share one fsync.
+    A None item on the queue shuts the writer down. Once saving has failed, finished
+    letters are still merged into all_words so the final save includes them.
+    
+    Args:
+        all_words (dict): The complete vocabulary database being built
+        checkpoint_file (file): Checkpoint file opened in binary append mode
+        checkpoint_filename (str): Path of the JSONL checkpoint file
+        queue (asyncio.Queue): Queue of (letter, word_batch) tuples
+        save_lock (asyncio.Lock): Guards all_words while it is being updated and written
+        stop_event (asyncio.Event): Set when saving fails so workers stop issuing requests
+        logger (logging.Logger): Logger instance for detailed logging
+    """
+    while True:
+        # Group commit: take every letter that is already waiting so the batch
+        # shares a single write and fsync
+        items = [await queue.get()]
+        while not queue.empty():
+            items.append(queue.get_nowait())
+        done = None in items
+        
+        async with save_lock:
+            batch_letters = []
+            for item in items:
+                if item is None:
+                    continue
+                letter, word_batch = item
+                store_letter_words(all_words, letter, word_batch, logger)
+                batch_letters.append(letter)
+            
+            # Save checkpoint after each batch of letters to avoid losing progress
+            if batch_letters and not stop_event.is_set():
+                try:
+                    await asyncio.to_thread(append_checkpoint, checkpoint_file,
+                                            [all_words[letter] for letter in batch_letters])
+                    
+                    completed_count = sum(1 for l in all_words.values() 
+                                       if l['statistics']['total_words'] > 0)
+                    logger.info("  Total progress: %s/26 letters completed", completed_count)
+                    logger.info("  ✓ Checkpoint saved to %s (%s)", checkpoint_filename,
+                                ", ".join(batch_letters))
+                except Exception as e:
+                    logger.error("❌ Error saving checkpoint to %s: %s", checkpoint_filename, e)
+                    logger.error("Stopping execution to prevent data loss.")
+                    stop_event.set()  # Stop issuing requests if we can't save
+        
+        if done:
+            break
+
+
+def append_checkpoint(checkpoint_file, letter_entries):
+    """
+    Append letters' words and statistics to the JSONL checkpoint and sync it to disk.
+    
+    All entries go out in one write followed by a single fsync.
+    
+    Args:
+        checkpoint_file (file): Checkpoint file opened in binary append mode
+        letter_entries (list): Letter entries from all_words, one JSONL line each
+    """
+    lines = []
+    for letter_entry in letter_entries:
+        record = {
+            "letter": letter_entry["letter"],
+            "words": letter_entry["words"],
+            "statistics": letter_entry["statistics"],
+        }
+        if orjson:
+            lines.append(orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS))
+        else:
+            lines.append(json.dumps(record, ensure_ascii=False).encode('utf-8'))
+    checkpoint_file.write(b"\n".join(lines) + b"\n")
+    checkpoint_file.flush()
+    os.fsync(checkpoint_file.fileno())
+
+
+def load_checkpoint(all_words, checkpoint_filename, logger):
+    """
+    Replay letters saved in the JSONL checkpoint by an earlier, unfinished run.
+    
+    Args:
+        all_words (dict): The complete vocabulary database being built
+        checkpoint_filename (str): Path of the JSONL checkpoint file
+        logger (logging.Logger): Logger instance for detailed logging
+    
+    Returns:
+        int: Number of letters restored from the checkpoint
+    """
+    restored_count = 0
+    try:
+        with open(checkpoint_filename, 'rb') as checkpoint_file:
+            for line in checkpoint_file:
+                if not line.strip():
+                    continue
+                try:
+                    record = orjson.loads(line) if orjson else json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-write can leave a partial last line; skip it
+                    logger.warning("Skipping incomplete line in %s", checkpoint_filename)
+                    continue
+                letter = record["letter"]
+                all_words[letter]["words"] = record["words"]
+                all_words[letter]["statistics"] = record["statistics"]
+                restored_count += 1
+    except FileNotFoundError:
+        return 0
+    
+    if restored_count > 0:
+        logger.info("Restored %s letters from checkpoint %s", restored_count, checkpoint_filename)
+    return restored_count
+
+
+def store_letter_words(all_words, letter, word_batch, logger):
+    """
+    Put a letter's generated words into all_words and recalculate its statistics.
+    
+    Args:
+        all_words (dict): The complete vocabulary database being built
+        letter (str): The letter the words start with
+        word_batch (dict): Words and their details returned by Gemini
+        logger (logging.Logger): Logger instance for detailed logging
+    """
+    # Update the letter's words dictionary
+    all_words[letter]["words"] = word_batch
+    
+    # Calculate statistics after receiving words from Gemini
+    logger.info("Calculating word statistics...")
+    statistics = calculate_word_statistics(word_batch, letter, logger)
+    all_words[letter]["statistics"] = statistics
+    
+    # Log detailed statistics
+    logger.info("✓ Successfully generated words for letter '%s'", letter)
+    logger.info("  Total words: %s", statistics['total_words'])
+    logger.info("  Complexity distribution: %s", statistics['complexity_distribution'])
+    logger.info("  Word length stats: %s", statistics['word_length_stats'])
+    if statistics['part_of_speech_distribution']:
+        logger.info("  Part of speech distribution: %s", statistics['part_of_speech_distribution'])
+
+
+def save_all_words(all_words, output_filename):
+    """
+    Write the complete vocabulary database to disk.
+    
+    The data is written to a temporary file that then replaces the output file, so an
+    interrupted save never leaves a truncated vocabulary file behind.
+    
+    Args:
+        all_words (dict): The complete vocabulary database
+        output_filename (str): Path of the JSON file to write
+    """
+    temp_filename = f"{output_filename}.tmp"
+    if orjson:
+        with open(temp_filename, 'wb') as f:
+            f.write(orjson.dumps(all_words, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(temp_filename, 'w', encoding='utf-8') as f:
+            json.dump(all_words, f, indent=2, ensure_ascii=False)
+    os.replace(temp_filename, output_filename)
+
+
+def get_pending_letters(all_words, logger):
+    """
+    List the letters that have no generated words yet.
+    
+    Args:
+        all_words (dict): The complete vocabulary database being built
+        logger (logging.Logger): Logger instance for detailed logging
+    
+    Returns:
+        list: Letters (A-Z) still waiting for words
+    """
+    pending_letters = []
+    for letter in string.ascii_uppercase:
+        # Skip letters that have already been processed (have words)
+        total_words = all_words[letter]["statistics"]["total_words"]
+        if total_words > 0:
+            logger.info("Skipping letter '%s' as it already has %s words.", letter, total_words)
+        else:
+            pending_letters.append(letter)
+    return pending_letters
+
+
+def generate_letters_with_batch_api(all_words, pending_letters, checkpoint_filename, logger):
+    """
+    Generate all pending letters with one Gemini batch job instead of one call per letter.
+    
+    Every letter becomes an inline request in a single job, which is billed and
+    throttled separately from online calls, so no rate limiting is needed. The job
+    is polled until it finishes; the results are matched to letters by the letter
+    recorded in each request's metadata, merged into all_words and appended to the
+    JSONL checkpoint. A job that was submitted by a run that then stopped can
+    be collected by setting GEMINI_BATCH_JOB to its name.
+    
+    Note: inline batch requests are served by the Gemini Developer API, so this
+    path authenticates with the GEMINI_API_KEY environment variable.
+    
+    Args:
+        all_words (dict): The complete vocabulary database being built
+        pending_letters (list): Letters to generate
+        checkpoint_filename (str): Path of the JSONL checkpoint file
+        logger (logging.Logger): Logger instance for detailed logging
+    """
+    client = genai.Client(api_key=os.environ.get("GEMINI_API_KEY"))
+    
+    if BATCH_JOB_NAME:
+        job_name = BATCH_JOB_NAME
+        logger.info("Collecting results of batch job %s", job_name)
+    else:
+        batch_requests = []
+        for letter in pending_letters:
+            contents, generate_content_config = build_letter_request(letter)
+            # Tag each request with its letter, so the responses can be matched by key
+            batch_requests.append(types.InlinedRequest(
+                contents=contents, config=generate_content_config, metadata={"letter": letter}
+            ))
+        
+        try:
+            batch_job = client.batches.create(
+                model=GEMINI_MODEL,
+                src=batch_requests,
+                config={"display_name": f"english-words-{pending_letters[0]}-{pending_letters[-1]}"},
+            )
+        except Exception as e:
+            logger.error("❌ Could not submit batch job: %s", e)
+            return
+        job_name = batch_job.name
+        logger.info("Submitted batch job %s for %s letters", job_name, len(pending_letters))
+        logger.info("If this run stops, collect the results later with GEMINI_BATCH_JOB=%s", job_name)
+    
+    try:
+        wait_started = time.monotonic()
+        batch_job = client.batches.get(name=job_name)
+        last_poll = time.monotonic()
+        while batch_job.state.name not in BATCH_COMPLETED_STATES:
+            if time.monotonic() - last_poll < BATCH_POLL_INTERVAL_SECONDS:
+                time.sleep(BATCH_WAIT_STEP_SECONDS)
+                continue
+            batch_job = client.batches.get(name=job_name)
+            last_poll = time.monotonic()
+            logger.info("Batch job %s state: %s after %.0f minutes", job_name,
+                        batch_job.state.name, (last_poll - wait_started) / 60)
+    except KeyboardInterrupt:
+        logger.warning("Stopped waiting for batch job %s; it keeps running on the server", job_name)
+        logger.warning("Collect its results later with GEMINI_BATCH_JOB=%s", job_name)
+        return
+    except Exception as e:
+        logger.error("❌ Error checking batch job %s: %s", job_name, e)
+        logger.error("Collect its results later with GEMINI_BATCH_JOB=%s", job_name)
+        return
+    
+    if batch_job.state.name != "JOB_STATE_SUCCEEDED":
+        logger.error("❌ Batch job %s finished with state %s: %s",
+                     batch_job.name, batch_job.state.name, batch_job.error)
+        return
+    
+    # Match the responses to letters by the letter each request was tagged with; the
+    # pending letters may have changed since a resumed job was submitted
+    inlined_responses = batch_job.dest.inlined_responses
+    finished_letters = []
+    for index, inline_response in enumerate(inlined_responses):
+        letter = (getattr(inline_response, "metadata", None) or {}).get("letter")
+        if letter is None and not BATCH_JOB_NAME and len(inlined_responses) == len(pending_letters):
+            # Submitted by this run, so the responses are in request order
+            letter = pending_letters[index]
+        if letter is None:
+            logger.error("❌ Batch response %s of job %s has no letter; skipping it", index, job_name)
+            continue
+        if letter not in pending_letters:
+            logger.info("Skipping batch response for letter '%s', which already has words", letter)
+            continue
+        if inline_response.error:
+            logger.error("❌ Batch request for letter '%s' failed: %s", letter, inline_response.error)
+            continue
+        try:
+            word_batch = parse_word_batch(inline_response.response.text, letter, logger)
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.error("❌ Could not parse batch response for letter '%s': %s", letter, e)
+            continue
+        store_letter_words(all_words, letter, word_batch, logger)
+        finished_letters.append(letter)
+    
+    # Checkpoint the results so they survive a failure to write the output file
+    if finished_letters:
+        try:
+            with open(checkpoint_filename, 'ab') as checkpoint_file:
+                # Start on a fresh line in case an earlier run stopped part-way through a write
+                if checkpoint_file.seek(0, os.SEEK_END) > 0:
+                    checkpoint_file.write(b"\n")
+                append_checkpoint(checkpoint_file, [all_words[letter] for letter in finished_letters])
+            logger.info("  ✓ Checkpoint saved to %s (%s)", checkpoint_filename, ", ".join(finished_letters))
+        except Exception as e:
+            logger.error("❌ Error saving checkpoint to %s: %s", checkpoint_filename, e)
+
+
+async def generate_missing_letters(all_words, pending_letters, checkpoint_filename, logger):
+    """
+    Generate the pending letters, running the Gemini calls concurrently.
+    
+    The number of letters in flight adapts between MIN_CONCURRENT_REQUESTS and
+    MAX_CONCURRENT_REQUESTS based on how Gemini responds (see AdmissionController).
+    
+    Args:
+        all_words (dict): The complete vocabulary database being built
+        pending_letters (list): Letters to generate
+        checkpoint_filename (str): Path of the JSONL checkpoint file
+        logger (logging.Logger): Logger instance for detailed logging
+    """
+    logger.info("Generating %s letters starting with %s concurrent requests",
+                len(pending_letters), INITIAL_CONCURRENT_REQUESTS)
+    
+    client = get_client()
+    
+    limiter = RateLimiter(REQUESTS_PER_MINUTE, TOKENS_PER_MINUTE)
+    controller = AdmissionController(logger=logger)
+    queue = asyncio.Queue()
+    save_lock = asyncio.Lock()
+    stop_event = asyncio.Event()
+    
+    # Open the checkpoint before any request is made, so a file that cannot be written
+    # stops the run before API calls are spent on letters that could not be saved
+    try:
+        checkpoint_file = open(checkpoint_filename, 'ab')
+    except OSError as e:
+        logger.error("❌ Cannot open checkpoint file %s: %s", checkpoint_filename, e)
+        logger.error("Stopping execution to prevent data loss.")
+        return
+    
+    with checkpoint_file:
+        # Start on a fresh line in case an earlier run stopped part-way through a write
+        if checkpoint_file.seek(0, os.SEEK_END) > 0:
+            checkpoint_file.write(b"\n")
+        
+        writer = asyncio.create_task(
+            checkpoint_writer(all_words, checkpoint_file, checkpoint_filename, queue, save_lock,
+                              stop_event, logger)
+        )
+        await asyncio.gather(*[
+            process_letter(client, letter, limiter, controller, queue, stop_event, logger)
+            for letter in pending_letters
+        ])
+        await queue.put(None)
+        await writer
+
+
 def main():
     """
     Main function to generate the complete English vocabulary list.
@@ -299,154 +1066,111 @@ def main():
     This function:
     1. Sets up comprehensive logging
     2. Loads existing data if available (for resuming interrupted runs)
-    3. Iterates through each letter of the alphabet (A-Z)
-    4. Calls the AI to generate words for each letter with retry logic
-    5. Calculates statistics after receiving words from Gemini
-    6. Saves the data incrementally to avoid losing progress
-    7. Handles errors gracefully and provides progress updates
-    8. Adds 2-second delay between API calls
+    3. Calls the AI for every missing letter (A-Z), concurrently with retry logic
+       or as a single batch job when GEMINI_USE_BATCH_API=1
+    4. Calculates statistics after receiving words from Gemini
+    5. Checkpoints each letter to an append-only JSONL file to avoid losing progress,
+       then writes the complete JSON file once at the end
+    6. Handles errors gracefully and provides progress updates
     """
     # Set up logging
     logger = setup_logging()
     logger.info("Starting English Vocabulary Generator")
     
-    # Output file name for the complete vocabulary database
+    # Output file name for the complete vocabulary database, and the append-only
+    # checkpoint that records each finished letter until the output file is written
     output_filename = "99_01_English_Words.json"
+    checkpoint_filename = "99_01_English_Words.jsonl"
     all_words = {}
 
     # Load existing data if the file exists
     # This allows the script to resume from where it left off if interrupted
-    if os.path.exists(output_filename):
-        logger.info(f"Found existing file: {output_filename}")
-        try:
-            with open(output_filename, 'r', encoding='utf-8') as f:
-                all_words = json.load(f)
-                logger.info(f"Successfully loaded existing words from {output_filename}")
-                
-                # Update existing data to include statistics structure if missing
-                updated_count = 0
-                for letter, letter_data in all_words.items():
-                    if "statistics" not in letter_data:
-                        # Calculate statistics for existing data
-                        word_batch = letter_data.get("words", {})
-                        statistics = calculate_word_statistics(word_batch, letter, logger)
-                        letter_data["statistics"] = statistics
-                        updated_count += 1
-                
-                if updated_count > 0:
-                    logger.info(f"Updated {updated_count} letters with statistics structure")
-                
-                completed_count = sum(1 for l in all_words.values() 
-                                   if l.get('statistics', {}).get('total_words', 0) > 0)
-                logger.info(f"Current progress: {completed_count} letters completed")
-        except json.JSONDecodeError as e:
-            logger.error(f"Warning: {output_filename} is corrupted or empty. Error: {e}")
-            logger.info("Starting fresh with empty dictionary.")
-            all_words = {}
-        except Exception as e:
-            logger.error(f"Error reading existing file: {e}")
-            logger.info("Starting fresh with empty dictionary.")
-            all_words = {}
+    try:
+        with open(output_filename, 'rb') as f:
+            logger.info("Found existing file: %s", output_filename)
+            all_words = orjson.loads(f.read()) if orjson else json.load(f)
+            logger.info("Successfully loaded existing words from %s", output_filename)
+    except FileNotFoundError:
+        pass
+    except json.JSONDecodeError as e:
+        logger.error("Warning: %s is corrupted or empty. Error: %s", output_filename, e)
+        logger.info("Starting fresh with empty dictionary.")
+        all_words = {}
+    except Exception as e:
+        logger.error("Error reading existing file: %s", e)
+        logger.info("Starting fresh with empty dictionary.")
+        all_words = {}
 
-    # Initialize the structure for all letters (A-Z)
+    # Initialize the structure for all letters (A-Z) in a single pass, recalculating
+    # statistics only for letters whose saved statistics are missing or empty
+    updated_count = 0
     for letter in string.ascii_uppercase:
-        if letter not in all_words:
-            all_words[letter] = {
-                "letter": letter,
-                "description": f"Words starting with letter {letter}",
-                "words": {},
-                "statistics": {
-                    "total_words": 0,
-                    "complexity_distribution": {},
-                    "word_length_stats": {},
-                    "part_of_speech_distribution": {}
-                }
-            }
-        elif "statistics" not in all_words[letter]:
-            # Ensure existing letters have statistics structure
-            word_batch = all_words[letter].get("words", {})
-            statistics = calculate_word_statistics(word_batch, letter, logger)
-            all_words[letter]["statistics"] = statistics
-
-    # Iterate through each letter of the alphabet (A-Z)
-    # string.ascii_uppercase provides 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
-    for i, letter in enumerate(string.ascii_uppercase):
-        logger.info(f"{'='*50}")
-        logger.info(f"Processing letter: {letter} ({i+1}/26)")
-        logger.info(f"{'='*50}")
-        
-        # Skip letters that have already been processed (have words)
-        total_words = all_words[letter]["statistics"]["total_words"]
-        if total_words > 0:
-            logger.info(f"Skipping letter '{letter}' as it already has {total_words} words.")
-            continue
+        entry = all_words.setdefault(letter, {
+            "letter": letter,
+            "description": f"Words starting with letter {letter}",
+            "words": {},
+        })
+        if not entry.get("statistics", {}).get("total_words"):
+            entry["statistics"] = calculate_word_statistics(entry.get("words", {}), letter, logger)
+            if entry["statistics"]["total_words"] > 0:
+                updated_count += 1
+    
+    if updated_count > 0:
+        logger.info("Updated %s letters with statistics structure", updated_count)
+    
+    completed_count = sum(1 for letter in string.ascii_uppercase
+                          if all_words[letter]["statistics"]["total_words"] > 0)
+    logger.info("Current progress: %s letters completed", completed_count)
 
-        # Generate words for the current letter using the AI with retry logic
-        word_batch = get_words_for_alphabet_with_retry(letter, logger)
+    # Pick up letters finished by a previous run that stopped before writing the output file
+    restored_count = load_checkpoint(all_words, checkpoint_filename, logger)
 
-        if word_batch:
-            # Update the letter's words dictionary
-            all_words[letter]["words"] = word_batch
-            
-            # Calculate statistics after receiving words from Gemini
-            logger.info("Calculating word statistics...")
-            statistics = calculate_word_statistics(word_batch, letter, logger)
-            all_words[letter]["statistics"] = statistics
-            
-            # Log detailed statistics
-            logger.info(f"✓ Successfully generated words for letter '{letter}'")
-            logger.info(f"  Total words: {statistics['total_words']}")
-            logger.info(f"  Complexity distribution: {statistics['complexity_distribution']}")
-            logger.info(f"  Word length stats: {statistics['word_length_stats']}")
-            if statistics['part_of_speech_distribution']:
-                logger.info(f"  Part of speech distribution: {statistics['part_of_speech_distribution']}")
-            
-            # Save checkpoint after each letter to avoid losing progress
-            try:
-                with open(output_filename, 'w', encoding='utf-8') as f:
-                    json.dump(all_words, f, indent=2, ensure_ascii=False)
-                
-                completed_count = sum(1 for l in all_words.values() 
-                                   if l['statistics']['total_words'] > 0)
-                logger.info(f"  Total progress: {completed_count}/26 letters completed")
-                logger.info(f"  ✓ Saved to {output_filename}")
-            except Exception as e:
-                logger.error(f"❌ Error saving data to {output_filename}: {e}")
-                logger.error("Stopping execution to prevent data loss.")
-                break  # Stop execution if we can't save
-        else:
-            logger.error(f"❌ Failed to generate words for letter '{letter}' after all retry attempts")
-            logger.info("Continuing with next letter...")
+    # Generate all missing letters (A-Z), either as one batch job or concurrently
+    pending_letters = get_pending_letters(all_words, logger)
+    if pending_letters and USE_BATCH_API:
+        generate_letters_with_batch_api(all_words, pending_letters, checkpoint_filename, logger)
+    elif pending_letters:
+        asyncio.run(generate_missing_letters(all_words, pending_letters, checkpoint_filename, logger))
 
-        # Add 2-second delay between API calls (except for the last letter)
-        if i < len(string.ascii_uppercase) - 1:
-            logger.info("Waiting 2 seconds before next API call...")
-            time.sleep(2)
+    # Write the complete, indented vocabulary file once; the checkpoint is dropped only
+    # after the new file has replaced the old one
+    if pending_letters or restored_count > 0:
+        try:
+            save_all_words(all_words, output_filename)
+            logger.info("✓ Saved to %s", output_filename)
+            try:
+                os.remove(checkpoint_filename)
+            except FileNotFoundError:
+                pass
+        except Exception as e:
+            logger.error("❌ Error saving data to %s: %s", output_filename, e)
+            logger.error("Generated letters are kept in %s for the next run.", checkpoint_filename)
 
     # Final summary
-    logger.info(f"{'='*50}")
+    logger.info("=" * 50)
     logger.info("PROCESS COMPLETE")
-    logger.info(f"{'='*50}")
+    logger.info("=" * 50)
     
     completed_letters = sum(1 for letter_data in all_words.values() 
                            if letter_data['statistics']['total_words'] > 0)
     total_words_generated = sum(letter_data['statistics']['total_words'] 
                                for letter_data in all_words.values())
     
-    logger.info(f"Total letters processed: {completed_letters}/26")
-    logger.info(f"Total words generated: {total_words_generated}")
-    logger.info(f"Output file: {output_filename}")
-    
-    # Log detailed summary by letter
-    logger.info("Detailed Summary by letter:")
-    for letter, data in all_words.items():
-        if data['statistics']['total_words'] > 0:
-            stats = data['statistics']
-            logger.info(f"  {letter}: {stats['total_words']} words")
-            logger.info(f"    Complexity: {stats['complexity_distribution']}")
-            logger.info(f"    Word lengths: {stats['word_length_stats']}")
-            if stats['part_of_speech_distribution']:
-                logger.info(f"    Parts of speech: {stats['part_of_speech_distribution']}")
+    logger.info("Total letters processed: %s/26", completed_letters)
+    logger.info("Total words generated: %s", total_words_generated)
+    logger.info("Output file: %s", output_filename)
+    
+    # Log detailed summary by letter (skipped entirely when INFO logging is disabled)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Detailed Summary by letter:")
+        for letter, data in all_words.items():
+            if data['statistics']['total_words'] > 0:
+                stats = data['statistics']
+                logger.info("  %s: %s words", letter, stats['total_words'])
+                logger.info("    Complexity: %s", stats['complexity_distribution'])
+                logger.info("    Word lengths: %s", stats['word_length_stats'])
+                if stats['part_of_speech_distribution']:
+                    logger.info("    Parts of speech: %s", stats['part_of_speech_distribution'])
     
     logger.info("The vocabulary database is ready for use!")
 
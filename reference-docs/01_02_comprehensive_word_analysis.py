@@ -1,15 +1,16 @@
-import json
 import string
-from collections import defaultdict
+from collections import Counter
+
+import ijson
 
 def analyze_word_structure():
     """
     Comprehensive analysis of the 99_01_English_Words.json file structure
+
+    The file is streamed one letter at a time with ijson, so the counters are
+    updated while parsing and the whole dictionary is never held in memory.
     """
     try:
-        with open("99_01_English_Words.json", "r", encoding="utf-8") as file:
-            data = json.load(file)
-        
         print("=" * 80)
         print("COMPREHENSIVE WORD ANALYSIS - 99_01_English_Words.json")
         print("=" * 80)
@@ -17,13 +18,14 @@ def analyze_word_structure():
         # Initialize analysis variables
         total_words = 0
         letter_stats = {}
-        word_length_distribution = defaultdict(int)
-        complexity_distribution = defaultdict(int)
-        
-        # Analyze each letter
-        for letter in string.ascii_uppercase:
-            if letter in data:
-                letter_data = data[letter]
+        word_length_distribution = Counter()
+        complexity_distribution = Counter()
+        
+        # Analyze each letter as it is parsed
+        with open("99_01_English_Words.json", "rb") as file:
+            for letter, letter_data in ijson.kvitems(file, ""):
+                if letter not in string.ascii_uppercase:
+                    continue
                 word_count = 0
                 
                 # Check if it has a "words" subdirectory
@@ -31,15 +33,14 @@ def analyze_word_structure():
                     words_dict = letter_data["words"]
                     word_count = len(words_dict)
                     
-                    # Analyze word lengths and complexity
-                    for word in words_dict:
-                        word_length = len(word)
-                        word_length_distribution[word_length] += 1
-                        
-                        # Check if complexity is available
-                        if "complexity" in words_dict[word]:
-                            complexity = words_dict[word]["complexity"]
-                            complexity_distribution[complexity] += 1
+                    # Analyze word lengths and complexity (Counter.update counts in C)
+                    word_length_distribution.update(map(len, words_dict))
+                    
+                    # Check if complexity is available
+                    complexity_distribution.update(
+                        word_info["complexity"] for word_info in words_dict.values()
+                        if "complexity" in word_info
+                    )
                 
                 # Also check direct word entries (like in the current structure)
                 else:
@@ -47,10 +48,10 @@ def analyze_word_structure():
                     word_count = len(letter_data)
                     
                     # Analyze word lengths
-                    for word in letter_data:
-                        if isinstance(letter_data[word], dict):  # Skip non-word entries
-                            word_length = len(word)
-                            word_length_distribution[word_length] += 1
+                    word_length_distribution.update(
+                        len(word) for word, word_info in letter_data.items()
+                        if isinstance(word_info, dict)  # Skip non-word entries
+                    )
                 
                 letter_stats[letter] = word_count
                 total_words += word_count
@@ -128,17 +129,17 @@ def analyze_word_structure():
         for i, (letter, count) in enumerate(sorted_letters[-5:], 1):
             print(f"  {i}. Letter {letter}: {count} words")
         
-        return data, letter_stats
+        return letter_stats
         
     except FileNotFoundError:
         print("❌ Error: 99_01_English_Words.json file not found!")
-        return None, None
-    except json.JSONDecodeError as e:
+        return None
+    except ijson.JSONError as e:
         print(f"❌ Error reading JSON file: {e}")
-        return None, None
+        return None
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
-        return None, None
+        return None
 
 def create_tabular_report(letter_stats):
     """
@@ -168,6 +169,6 @@ def create_tabular_report(letter_stats):
     print(f"**Letters with <90 words:** {len([l for l in letter_stats.values() if l < 90])}")
 
 if __name__ == "__main__":
-    data, letter_stats = analyze_word_structure()
+    letter_stats = analyze_word_structure()
     if letter_stats:
         create_tabular_report(letter_stats) 
\ No newline at end of file
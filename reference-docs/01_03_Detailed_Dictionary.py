@@ -12,6 +12,7 @@ The script includes:
 - Word origins, etymology, and verb forms
 - Statistics for each alphabet letter
 - Progress tracking and error handling
+- A persistent on-disk cache so words fetched in earlier runs are not requested again
 
 Author: [Vijay Khanna]
 Date: [11 July 2025]
@@ -22,10 +23,297 @@ import string
 import os
 import time
 import logging
+import logging.handlers
 import random
+import sys
+import atexit
+import queue
+import itertools
+import functools
+import hashlib
+import importlib.util
+import sqlite3
+import threading
+import ijson
+import httpx
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from google import genai
 from google.genai import types
 
+# Faster JSON for the word cache, checkpoints and output file (pip install orjson)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Use the same model as the sample file
+GEMINI_MODEL = "gemini-2.5-pro"
+
+# Bump this whenever the prompt changes so answers cached for the old prompt are not reused
+PROMPT_VERSION = 1
+
+# SQLite file holding Gemini responses from earlier runs
+CACHE_FILENAME = os.path.join("cache", "gemini_words.db")
+
+# Append-only checkpoint (one processed word per line) replayed when resuming.
+# The pretty-printed JSON file is written once, after all letters are done.
+CHECKPOINT_FILENAME = "99_02_comprehensive_english_dict.jsonl"
+
+# Complexity labels accepted in generated word data; anything else becomes "Intermediate"
+VALID_COMPLEXITY_LEVELS = frozenset({"Intermediate", "Advanced"})
+
+# Required word detail fields: a check for a usable value and the default used otherwise
+WORD_DETAILS_FIELDS = {
+    "complexity": (lambda value: isinstance(value, str) and value in VALID_COMPLEXITY_LEVELS, "Intermediate"),
+    "phonetic_respelling": (bool, ""),
+    "ssml_phoneme": (bool, ""),
+}
+
+# Number of words fetched from Gemini at the same time
+MAX_CONCURRENT_REQUESTS = 8
+
+# Combined request rate allowed across all worker threads (Gemini per-minute quota)
+REQUESTS_PER_MINUTE = 60
+
+# Retry delays: a malformed response is retried right away once, other failures back off
+# exponentially up to MAX_RETRY_DELAY_SECONDS
+JSON_RETRY_DELAY_SECONDS = 1
+MAX_RETRY_DELAY_SECONDS = 30
+
+# A worker that sees this many failed API calls in a row rests before trying again
+CIRCUIT_BREAKER_THRESHOLD = 5
+CIRCUIT_BREAKER_PAUSE_SECONDS = 60
+
+# Per-thread count of consecutive failed API calls, used by the circuit breaker
+worker_state = threading.local()
+
+# Detailed prompt that instructs the AI to generate comprehensive word data.
+# Only {word} and {letter} are filled in per call; literal braces are doubled for str.format.
+WORD_DETAILS_PROMPT = """
+Please provide detailed information for the English word '{word}' starting with letter '{letter}'.
+The output MUST be a valid JSON object with the following structure:
+
+{{
+  "complexity": "Intermediate" or "Advanced",
+  "pronunciation": {{
+    "General_American_GA_pronunciation_us": "/pronunciation/",
+    "The_International_Phonetic_Alphabet_ipa_uk": "/pronunciation/"
+  }},
+  "phonetic_respelling": "uh-bate",
+  "ssml_phoneme": "ph=\\"əˈbeɪt\\"",
+  "meanings": [
+    {{
+      "part_of_speech": "Noun/Verb/Adjective/Adverb",
+      "definitions": [
+        {{
+          "definition": "Clear definition of the word",
+          "example": "Example sentence using the word",
+          "synonyms": ["synonym1", "synonym2", "synonym3"],
+          "antonyms": ["antonym1", "antonym2", "antonym3"]
+        }}
+      ],
+      "verb_forms": {{
+        "infinitive": "to word",
+        "present_participle": "wording",
+        "past_participle": "worded"
+      }}
+    }}
+  ],
+  "word_origin": "Etymology and origin of the word",
+  "word_roots": [
+    {{
+      "root": "root_word",
+      "meaning": "meaning of the root"
+    }}
+  ]
+}}
+
+IMPORTANT: For the "complexity" field, choose either "Intermediate" or "Advanced" based on the word's difficulty level:
+- "Intermediate": Words that are moderately difficult, suitable for high school to early college level
+- "Advanced": Words that are very difficult, suitable for college level and above (SAT/GRE level)
+
+IMPORTANT: For pronunciation fields:
+- "phonetic_respelling": Provide a simple phonetic respelling using common English sounds (e.g., "uh-bate" for "abate")
+- "ssml_phoneme": Provide the SSML phoneme tag with IPA pronunciation (e.g., ph=\\"əˈbeɪt\\" for "abate")
+
+If the word is not a verb, omit the "verb_forms" section.
+Provide accurate pronunciation, etymology, and comprehensive definitions.
+Do not include any text before or after the JSON object.
+"""
+
+# Configure the AI model parameters once; only the prompt changes between words
+WORD_DETAILS_CONFIG = types.GenerateContentConfig(
+    temperature=0.3,  # Lower temperature for more accurate information
+    top_p=0.9,
+    seed=0,
+    max_output_tokens=8192,  # Sufficient for detailed word information
+    response_mime_type="application/json",
+    safety_settings=[
+        types.SafetySetting(
+            category="HARM_CATEGORY_HATE_SPEECH",
+            threshold="OFF"
+        ),
+        types.SafetySetting(
+            category="HARM_CATEGORY_DANGEROUS_CONTENT",
+            threshold="OFF"
+        ),
+        types.SafetySetting(
+            category="HARM_CATEGORY_SEXUALLY_EXPLICIT",
+            threshold="OFF"
+        ),
+        types.SafetySetting(
+            category="HARM_CATEGORY_HARASSMENT",
+            threshold="OFF"
+        )
+    ],
+    thinking_config=types.ThinkingConfig(
+        thinking_budget=-1,
+    ),
+)
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter that spaces API calls evenly to stay within a per-minute quota.
+    
+    Each call to acquire() reserves the next free time slot and sleeps until it arrives,
+    so concurrent workers share the quota instead of each sleeping a fixed amount.
+    """
+    
+    def __init__(self, requests_per_minute=REQUESTS_PER_MINUTE):
+        """
+        Args:
+            requests_per_minute (int): Maximum number of requests started per minute
+        """
+        self.interval = 60.0 / requests_per_minute
+        self.lock = threading.Lock()
+        self.next_slot = time.monotonic()
+    
+    def acquire(self):
+        """
+        Block until the caller may start its next request.
+        """
+        with self.lock:
+            now = time.monotonic()
+            slot = max(self.next_slot, now)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+    
+    def pause(self, seconds):
+        """
+        Hold back every worker's next request for the given number of seconds.
+        
+        Args:
+            seconds (float): How long Gemini asked us to wait
+        """
+        with self.lock:
+            self.next_slot = max(self.next_slot, time.monotonic() + seconds)
+
+
+def get_retry_after(error):
+    """
+    Extract the server-requested retry delay from a Gemini API error, if any.
+    
+    Args:
+        error (Exception): The exception raised by the API call
+    
+    Returns:
+        float: Seconds to wait, or None if the error carries no retry-after header
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class WordCache:
+    """
+    Persistent exact-match cache of Gemini word details, stored in SQLite.
+    
+    Entries are keyed by model, prompt version and word, so a word that was already
+    fetched is returned from disk instead of calling the API again. The connection is
+    shared by the worker threads and guarded by a lock.
+    """
+    
+    def __init__(self, filename=CACHE_FILENAME):
+        """
+        Open (and create if needed) the cache database.
+        
+        Args:
+            filename (str): Path of the SQLite cache file
+        """
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+        self.connection = sqlite3.connect(filename, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS words (key TEXT PRIMARY KEY, json BLOB, ts INTEGER)"
+            )
+    
+    @staticmethod
+    def make_key(word, model=GEMINI_MODEL):
+        """
+        Build the cache key for a word.
+        
+        Args:
+            word (str): The word being looked up
+            model (str): The Gemini model that produced the answer
+        
+        Returns:
+            str: Hex digest identifying the (model, prompt version, word) combination
+        """
+        # Casing variants of a word share one entry
+        return hashlib.blake2b(f"{model}|{PROMPT_VERSION}|{word.lower()}".encode("utf-8")).hexdigest()
+    
+    def get(self, word):
+        """
+        Look up a word's cached details.
+        
+        Args:
+            word (str): The word to look up
+        
+        Returns:
+            dict: The cached word details, or None if the word is not cached
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT json FROM words WHERE key = ?", (self.make_key(word),)
+            ).fetchone()
+        if not row:
+            return None
+        return orjson.loads(row[0]) if orjson else json.loads(row[0])
+    
+    def set(self, word, result):
+        """
+        Store a word's details in the cache.
+        
+        Args:
+            word (str): The word that was looked up
+            result (dict): The validated word details returned by Gemini
+        """
+        if orjson:
+            payload = orjson.dumps(result)
+        else:
+            payload = json.dumps(result, ensure_ascii=False).encode("utf-8")
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO words (key, json, ts) VALUES (?, ?, ?)",
+                (self.make_key(word), payload, int(time.time()))
+            )
+    
+    def close(self):
+        """
+        Close the underlying database connection.
+        """
+        with self.lock:
+            self.connection.close()
+
 
 def calculate_detailed_statistics(word_batch, letter):
     """
@@ -50,68 +338,53 @@ def calculate_detailed_statistics(word_batch, letter):
             "ssml_stats": {}
         }
     
-    # Calculate comprehensive statistics
+    # Calculate comprehensive statistics in a single pass; Counter does the counting in C
     total_words = len(word_batch)
-    complexity_dist = {}
-    word_length_stats = {}
-    pos_distribution = {}
-    pronunciation_stats = {"has_pronunciation": 0, "no_pronunciation": 0}
-    origin_stats = {"has_origin": 0, "no_origin": 0}
-    phonetic_stats = {"has_phonetic_respelling": 0, "no_phonetic_respelling": 0}
-    ssml_stats = {"has_ssml_phoneme": 0, "no_ssml_phoneme": 0}
+    complexity_dist = Counter()
+    pos_distribution = Counter()
+    present = Counter()
     
     for word, word_data in word_batch.items():
         # Complexity distribution - ensure proper categorization
         complexity = word_data.get("complexity", "Unknown")
-        if complexity not in ["Intermediate", "Advanced"]:
+        if complexity not in VALID_COMPLEXITY_LEVELS:
             # Default to Intermediate for unknown complexity
             complexity = "Intermediate"
-            logging.warning(f"Unknown complexity for word '{word}', defaulting to 'Intermediate'")
+            logging.warning("Unknown complexity for word '%s', defaulting to 'Intermediate'", word)
         
-        complexity_dist[complexity] = complexity_dist.get(complexity, 0) + 1
-        
-        # Word length statistics
-        word_length = len(word)
-        word_length_stats[word_length] = word_length_stats.get(word_length, 0) + 1
+        complexity_dist[complexity] += 1
         
         # Part of speech distribution
-        if "meanings" in word_data and word_data["meanings"]:
-            for meaning in word_data["meanings"]:
-                pos = meaning.get("part_of_speech", "Unknown")
-                pos_distribution[pos] = pos_distribution.get(pos, 0) + 1
-        
-        # Pronunciation statistics
-        if "pronunciation" in word_data and word_data["pronunciation"]:
-            pronunciation_stats["has_pronunciation"] += 1
-        else:
-            pronunciation_stats["no_pronunciation"] += 1
-        
-        # Origin statistics
-        if "word_origin" in word_data and word_data["word_origin"]:
-            origin_stats["has_origin"] += 1
-        else:
-            origin_stats["no_origin"] += 1
-        
-        # Phonetic respelling statistics
-        if "phonetic_respelling" in word_data and word_data["phonetic_respelling"]:
-            phonetic_stats["has_phonetic_respelling"] += 1
-        else:
-            phonetic_stats["no_phonetic_respelling"] += 1
+        pos_distribution.update(
+            meaning.get("part_of_speech", "Unknown") for meaning in word_data.get("meanings") or ()
+        )
         
-        # SSML phoneme statistics
-        if "ssml_phoneme" in word_data and word_data["ssml_phoneme"]:
-            ssml_stats["has_ssml_phoneme"] += 1
-        else:
-            ssml_stats["no_ssml_phoneme"] += 1
+        # Pronunciation, origin, phonetic respelling and SSML phoneme presence
+        for field in ("pronunciation", "word_origin", "phonetic_respelling", "ssml_phoneme"):
+            if word_data.get(field):
+                present[field] += 1
+    
+    # Word length statistics
+    word_length_stats = Counter(map(len, word_batch))
+    
+    complexity_dist = dict(complexity_dist)
+    pronunciation_stats = {"has_pronunciation": present["pronunciation"],
+                           "no_pronunciation": total_words - present["pronunciation"]}
+    origin_stats = {"has_origin": present["word_origin"],
+                    "no_origin": total_words - present["word_origin"]}
+    phonetic_stats = {"has_phonetic_respelling": present["phonetic_respelling"],
+                      "no_phonetic_respelling": total_words - present["phonetic_respelling"]}
+    ssml_stats = {"has_ssml_phoneme": present["ssml_phoneme"],
+                  "no_ssml_phoneme": total_words - present["ssml_phoneme"]}
     
     # Log complexity distribution for debugging
-    logging.info(f"Complexity distribution for letter {letter}: {complexity_dist}")
+    logging.info("Complexity distribution for letter %s: %s", letter, complexity_dist)
     
     return {
         "total_words": total_words,
         "complexity_distribution": complexity_dist,
-        "word_length_stats": word_length_stats,
-        "part_of_speech_distribution": pos_distribution,
+        "word_length_stats": dict(word_length_stats),
+        "part_of_speech_distribution": dict(pos_distribution),
         "pronunciation_stats": pronunciation_stats,
         "origin_stats": origin_stats,
         "phonetic_stats": phonetic_stats,
@@ -119,7 +392,90 @@ def calculate_detailed_statistics(word_batch, letter):
     }
 
 
-def get_detailed_word_info(word, letter, max_retries=3, base_delay=5):
+def validate_word_details(word, result):
+    """
+    Replace missing or invalid required fields with their defaults, in place.
+    
+    Args:
+        word (str): The word the details belong to (used for logging)
+        result (dict): Word details parsed from the Gemini response
+    """
+    for field, (is_valid, default) in WORD_DETAILS_FIELDS.items():
+        if not is_valid(result.get(field)):
+            result[field] = default
+            logging.warning("Missing or invalid %s for word '%s', using %r", field, word, default)
+
+
+def intern_word_details(result):
+    """
+    Intern the short labels that repeat across thousands of words, in place.
+    
+    JSON parsing creates a new string for every occurrence of values such as
+    "Intermediate" or "Noun"; interning makes all words share one copy of each.
+    
+    Args:
+        result (dict): Word details parsed from the Gemini response or the cache
+    """
+    if isinstance(result.get("complexity"), str):
+        result["complexity"] = sys.intern(result["complexity"])
+    for meaning in result.get("meanings") or ():
+        if isinstance(meaning.get("part_of_speech"), str):
+            meaning["part_of_speech"] = sys.intern(meaning["part_of_speech"])
+    for root in result.get("word_roots") or ():
+        if isinstance(root.get("root"), str):
+            root["root"] = sys.intern(root["root"])
+
+
+@functools.lru_cache(maxsize=1)
+def get_client():
+    """
+    Create the Google Gemini AI client once and share it between all words and threads.
+    
+    Building the client re-reads the environment and sets up authentication and a new
+    HTTP connection pool, so it is cached instead of being created for every attempt.
+    The pool keeps a warm connection per worker thread, and uses HTTP/2 to multiplex
+    requests over fewer connections when the h2 package is installed.
+    
+    Returns:
+        genai.Client: The shared Vertex AI Gemini client
+    """
+    return genai.Client(
+        vertexai=True,
+        project=os.environ.get("GOOGLE_CLOUD_PROJECT"),  # Replaced hardcoded project ID
+        location="global",
+        http_options=types.HttpOptions(
+            client_args={
+                "http2": importlib.util.find_spec("h2") is not None,
+                "limits": httpx.Limits(
+                    max_connections=2 * MAX_CONCURRENT_REQUESTS,
+                    max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+                    keepalive_expiry=60,
+                ),
+            },
+        ),
+    )
+
+
+def update_letter_statistics(letter_data, letter):
+    """
+    Recalculate a letter's statistics unless they already cover all of its words.
+    
+    Words are only ever added, so statistics whose total matches the number of words
+    are current; this skips the full pass for letters that had nothing new this run.
+    
+    Args:
+        letter_data (dict): The letter's entry in the comprehensive data
+        letter (str): The letter being updated
+    
+    Returns:
+        dict: The letter's up-to-date statistics
+    """
+    if letter_data["statistics"].get("total_words") != len(letter_data["words"]):
+        letter_data["statistics"] = calculate_detailed_statistics(letter_data["words"], letter)
+    return letter_data["statistics"]
+
+
+def get_detailed_word_info(word, letter, max_retries=3, base_delay=5, cache=None, limiter=None):
     """
     Calls the Gemini LLM to get detailed information for a specific word with retry logic.
     
@@ -128,77 +484,34 @@ def get_detailed_word_info(word, letter, max_retries=3, base_delay=5):
         letter (str): The letter this word starts with
         max_retries (int): Maximum number of retry attempts
         base_delay (int): Base delay in seconds between retries
+        cache (WordCache): Optional cache checked before, and filled after, the API call
+        limiter (RateLimiter): Optional limiter shared by all threads, acquired before each API call
     
     Returns:
         dict: Detailed word information in the format matching 00_Final_JSON.json, or None if error
     """
-    logging.info(f"Fetching detailed info for word: {word}")
-    print(f"Fetching detailed info for word: {word}")
+    # Skip the API call entirely if this word was fetched in an earlier run
+    if cache is not None:
+        try:
+            cached = cache.get(word)
+        except (sqlite3.Error, ValueError) as e:
+            # Unreadable or corrupt cache entry: fetch the word again
+            logging.warning("Could not read cached word '%s': %s", word, e)
+            cached = None
+        if cached is not None:
+            logging.info("Cache hit for word: %s", word)
+            intern_word_details(cached)
+            return cached
+    
+    logging.info("Fetching detailed info for word: %s", word)
     
     for attempt in range(max_retries + 1):
         try:
-            # Initialize the Google Gemini AI client
-            client = genai.Client(
-                vertexai=True,
-                project=os.environ.get("GOOGLE_CLOUD_PROJECT"),  # Replaced hardcoded project ID
-                location="global",
-            )
-
-            # Use the same model as the sample file
-            model = "gemini-2.5-pro"
+            # Reuse the shared Google Gemini AI client
+            client = get_client()
             
-            # Create a detailed prompt that instructs the AI to generate comprehensive word data
-            prompt = f"""
-            Please provide detailed information for the English word '{word}' starting with letter '{letter.upper()}'.
-            The output MUST be a valid JSON object with the following structure:
-
-            {{
-              "complexity": "Intermediate" or "Advanced",
-              "pronunciation": {{
-                "General_American_GA_pronunciation_us": "/pronunciation/",
-                "The_International_Phonetic_Alphabet_ipa_uk": "/pronunciation/"
-              }},
-              "phonetic_respelling": "uh-bate",
-              "ssml_phoneme": "ph=\\"əˈbeɪt\\"",
-              "meanings": [
-                {{
-                  "part_of_speech": "Noun/Verb/Adjective/Adverb",
-                  "definitions": [
-                    {{
-                      "definition": "Clear definition of the word",
-                      "example": "Example sentence using the word",
-                      "synonyms": ["synonym1", "synonym2", "synonym3"],
-                      "antonyms": ["antonym1", "antonym2", "antonym3"]
-                    }}
-                  ],
-                  "verb_forms": {{
-                    "infinitive": "to word",
-                    "present_participle": "wording",
-                    "past_participle": "worded"
-                  }}
-                }}
-              ],
-              "word_origin": "Etymology and origin of the word",
-              "word_roots": [
-                {{
-                  "root": "root_word",
-                  "meaning": "meaning of the root"
-                }}
-              ]
-            }}
-
-            IMPORTANT: For the "complexity" field, choose either "Intermediate" or "Advanced" based on the word's difficulty level:
-            - "Intermediate": Words that are moderately difficult, suitable for high school to early college level
-            - "Advanced": Words that are very difficult, suitable for college level and above (SAT/GRE level)
-
-            IMPORTANT: For pronunciation fields:
-            - "phonetic_respelling": Provide a simple phonetic respelling using common English sounds (e.g., "uh-bate" for "abate")
-            - "ssml_phoneme": Provide the SSML phoneme tag with IPA pronunciation (e.g., ph=\\"əˈbeɪt\\" for "abate")
-
-            If the word is not a verb, omit the "verb_forms" section.
-            Provide accurate pronunciation, etymology, and comprehensive definitions.
-            Do not include any text before or after the JSON object.
-            """
+            # Fill in the prebuilt prompt template for this word
+            prompt = WORD_DETAILS_PROMPT.format(word=word, letter=letter.upper())
             
             # Prepare the content for the AI model
             contents = [
@@ -208,117 +521,112 @@ def get_detailed_word_info(word, letter, max_retries=3, base_delay=5):
                 ),
             ]
 
-            # Configure the AI model parameters
-            generate_content_config = types.GenerateContentConfig(
-                temperature=0.3,  # Lower temperature for more accurate information
-                top_p=0.9,
-                seed=0,
-                max_output_tokens=8192,  # Sufficient for detailed word information
-                response_mime_type="application/json",
-                safety_settings=[
-                    types.SafetySetting(
-                        category="HARM_CATEGORY_HATE_SPEECH",
-                        threshold="OFF"
-                    ),
-                    types.SafetySetting(
-                        category="HARM_CATEGORY_DANGEROUS_CONTENT",
-                        threshold="OFF"
-                    ),
-                    types.SafetySetting(
-                        category="HARM_CATEGORY_SEXUALLY_EXPLICIT",
-                        threshold="OFF"
-                    ),
-                    types.SafetySetting(
-                        category="HARM_CATEGORY_HARASSMENT",
-                        threshold="OFF"
-                    )
-                ],
-                thinking_config=types.ThinkingConfig(
-                    thinking_budget=-1,
-                ),
-            )
-
+            # Wait for a free slot in the shared per-minute quota
+            if limiter is not None:
+                limiter.acquire()
+            
             # Use streaming response for better handling
-            full_response = ""
+            # Collect the chunks in a list and join once; repeated += copies the string each time
+            response_parts = []
             for chunk in client.models.generate_content_stream(
-                model=model,
+                model=GEMINI_MODEL,
                 contents=contents,
-                config=generate_content_config,
+                config=WORD_DETAILS_CONFIG,
             ):
                 if (not chunk.candidates or 
                     not chunk.candidates[0].content or 
                     not chunk.candidates[0].content.parts):
                     continue
-                full_response += chunk.text
-            
-            # Clean up the response text to ensure it's valid JSON
-            json_text = full_response.strip().replace("```json", "").replace("```", "")
-            
-            # Parse the JSON response and return the word data
-            result = json.loads(json_text)
+                response_parts.append(chunk.text)
+            full_response = "".join(response_parts)
+            worker_state.failures = 0
             
-            # Validate and ensure complexity field is properly set
-            if "complexity" not in result or result["complexity"] not in ["Intermediate", "Advanced"]:
-                # Default to Intermediate if complexity is missing or invalid
-                result["complexity"] = "Intermediate"
-                logging.warning(f"Invalid complexity for word '{word}', defaulting to 'Intermediate'")
+            # Parse the JSON response and return the word data; response_mime_type is
+            # application/json, so the model returns bare JSON without markdown fences
+            result = orjson.loads(full_response) if orjson else json.loads(full_response)
             
-            # Validate and ensure phonetic respelling field is properly set
-            if "phonetic_respelling" not in result or not result["phonetic_respelling"]:
-                # Default to empty string if phonetic respelling is missing
-                result["phonetic_respelling"] = ""
-                logging.warning(f"Missing phonetic respelling for word '{word}', setting to empty")
+            # Validate and ensure the required fields are properly set
+            validate_word_details(word, result)
+            intern_word_details(result)
             
-            # Validate and ensure SSML phoneme field is properly set
-            if "ssml_phoneme" not in result or not result["ssml_phoneme"]:
-                # Default to empty string if SSML phoneme is missing
-                result["ssml_phoneme"] = ""
-                logging.warning(f"Missing SSML phoneme for word '{word}', setting to empty")
+            logging.info("Successfully processed word: %s (complexity: %s, phonetic: %s, ssml: %s)", word, result['complexity'], result.get('phonetic_respelling', 'N/A'), result.get('ssml_phoneme', 'N/A'))
             
-            logging.info(f"Successfully processed word: {word} (complexity: {result['complexity']}, phonetic: {result.get('phonetic_respelling', 'N/A')}, ssml: {result.get('ssml_phoneme', 'N/A')})")
+            if cache is not None:
+                try:
+                    cache.set(word, result)
+                except sqlite3.Error as e:
+                    logging.warning("Could not cache word '%s': %s", word, e)
             return result
 
         except json.JSONDecodeError as e:
-            logging.error(f"JSON parsing error for word {word} (attempt {attempt + 1}/{max_retries + 1}): {e}")
-            print(f"JSON parsing error for word {word} (attempt {attempt + 1}/{max_retries + 1}): {e}")
+            logging.error("JSON parsing error for word %s (attempt %s/%s): %s", word, attempt + 1, max_retries + 1, e)
             if attempt < max_retries:
-                delay = base_delay * (2 ** attempt) + random.uniform(0, 1)  # Exponential backoff with jitter
-                logging.info(f"Retrying in {delay:.1f} seconds...")
-                print(f"Retrying in {delay:.1f} seconds...")
+                # A malformed (usually truncated) response says nothing about API load,
+                # so ask again immediately the first time and shortly after that
+                delay = 0 if attempt == 0 else JSON_RETRY_DELAY_SECONDS
+                logging.info("Retrying in %.1f seconds...", delay)
                 time.sleep(delay)
             else:
-                logging.error(f"Failed to process word {word} after {max_retries + 1} attempts")
-                print(f"Failed to process word {word} after {max_retries + 1} attempts")
+                logging.error("Failed to process word %s after %s attempts", word, max_retries + 1)
                 return None
                 
         except Exception as e:
-            logging.error(f"API error for word {word} (attempt {attempt + 1}/{max_retries + 1}): {e}")
-            print(f"API error for word {word} (attempt {attempt + 1}/{max_retries + 1}): {e}")
+            retry_after = get_retry_after(e)
+            if getattr(e, "code", None) == 429:
+                # Rate limited: wait as long as the server asks and hold back the other
+                # workers too, or back off exponentially if it does not say
+                logging.error("Rate limited for word %s (attempt %s/%s): %s", word, attempt + 1, max_retries + 1, e)
+                delay = retry_after or min(MAX_RETRY_DELAY_SECONDS, base_delay * (2 ** attempt))
+                if limiter is not None:
+                    limiter.pause(delay)
+            else:
+                # Server error or network problem: capped exponential backoff with jitter
+                logging.error("API error for word %s (attempt %s/%s): %s", word, attempt + 1, max_retries + 1, e)
+                delay = min(MAX_RETRY_DELAY_SECONDS, base_delay * (2 ** attempt)) + random.uniform(0, 1)
+            
+            # Circuit breaker: after repeated failures this worker rests instead of retrying
+            worker_state.failures = getattr(worker_state, "failures", 0) + 1
+            if worker_state.failures >= CIRCUIT_BREAKER_THRESHOLD:
+                logging.warning("%s API calls failed in a row; worker pausing for %s seconds",
+                                worker_state.failures, CIRCUIT_BREAKER_PAUSE_SECONDS)
+                delay = max(delay, CIRCUIT_BREAKER_PAUSE_SECONDS)
+                worker_state.failures = 0
+            
             if attempt < max_retries:
-                delay = base_delay * (2 ** attempt) + random.uniform(0, 1)  # Exponential backoff with jitter
-                logging.info(f"Retrying in {delay:.1f} seconds...")
-                print(f"Retrying in {delay:.1f} seconds...")
+                logging.info("Retrying in %.1f seconds...", delay)
                 time.sleep(delay)
             else:
-                logging.error(f"Failed to process word {word} after {max_retries + 1} attempts")
-                print(f"Failed to process word {word} after {max_retries + 1} attempts")
+                logging.error("Failed to process word %s after %s attempts", word, max_retries + 1)
                 return None
 
 
-def load_existing_data():
+def load_existing_words():
     """
-    Load the existing word data from 99_01_English_Words.json.
+    Load the list of words for each letter from 99_01_English_Words.json.
+    
+    Only the words themselves are needed here, so the file is streamed with ijson and
+    their definitions and statistics are never built in memory.
     
     Returns:
-        dict: The loaded JSON data, or empty dict if file doesn't exist
+        dict: Letter -> list of words, or empty dict if the file doesn't exist
     """
+    existing_words = {}
     try:
-        with open("99_01_English_Words.json", "r", encoding="utf-8") as file:
-            return json.load(file)
+        with open("99_01_English_Words.json", "rb") as file:
+            for prefix, event, value in ijson.parse(file):
+                # Keys of a letter's "words" object have the prefix "<letter>.words"
+                letter, _, field = prefix.partition(".")
+                if field != "words":
+                    continue
+                if event == "start_map":
+                    existing_words[letter] = []
+                elif event == "map_key":
+                    existing_words[letter].append(value)
+        return existing_words
     except FileNotFoundError:
         print("Warning: 99_01_English_Words.json not found. Starting with empty data.")
         return {}
-    except json.JSONDecodeError as e:
+    except ijson.JSONError as e:
         print(f"Error reading 99_01_English_Words.json: {e}")
         return {}
 
@@ -327,18 +635,32 @@ def save_comprehensive_data(data, filename="99_02_comprehensive_english_dict.jso
     """
     Save the comprehensive word data to a JSON file.
     
+    The data is written to a temporary file that then replaces the target, so an
+    interrupted save never leaves a truncated file behind.
+    
     Args:
         data (dict): The comprehensive word data to save
         filename (str): The filename to save to (default: 99_02_comprehensive_english_dict.json)
+    
+    Returns:
+        bool: True if the data was saved, False otherwise
     """
+    temp_filename = filename + ".tmp"
     try:
-        with open(filename, "w", encoding="utf-8") as file:
-            json.dump(data, file, indent=2, ensure_ascii=False)
-        logging.info(f"Comprehensive data saved to {filename}")
+        if orjson:
+            with open(temp_filename, "wb") as file:
+                file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(temp_filename, "w", encoding="utf-8") as file:
+                json.dump(data, file, indent=2, ensure_ascii=False)
+        os.replace(temp_filename, filename)
+        logging.info("Comprehensive data saved to %s", filename)
         print(f"Comprehensive data saved to {filename}")
+        return True
     except Exception as e:
-        logging.error(f"Error saving comprehensive data: {e}")
+        logging.error("Error saving comprehensive data: %s", e)
         print(f"Error saving comprehensive data: {e}")
+        return False
 
 
 def load_comprehensive_data(filename="99_02_comprehensive_english_dict.json"):
@@ -352,52 +674,126 @@ def load_comprehensive_data(filename="99_02_comprehensive_english_dict.json"):
         dict: The loaded comprehensive data, or empty dict if file doesn't exist
     """
     try:
-        with open(filename, "r", encoding="utf-8") as file:
-            data = json.load(file)
-            logging.info(f"Loaded existing data from {filename}")
+        with open(filename, "rb") as file:
+            data = orjson.loads(file.read()) if orjson else json.load(file)
+            logging.info("Loaded existing data from %s", filename)
             return data
     except FileNotFoundError:
-        logging.warning(f"Warning: {filename} not found. Starting with empty data.")
+        logging.warning("Warning: %s not found. Starting with empty data.", filename)
         print(f"Warning: {filename} not found. Starting with empty data.")
         return {}
     except json.JSONDecodeError as e:
-        logging.error(f"Error reading {filename}: {e}")
+        logging.error("Error reading %s: %s", filename, e)
         print(f"Error reading {filename}: {e}")
         return {}
 
 
-def save_checkpoint(comprehensive_data, letter, word, filename="99_02_comprehensive_english_dict.json"):
+def save_checkpoint(checkpoint_file, letter, word, detailed_info):
     """
-    Save a checkpoint after processing each word.
+    Append a processed word to the JSONL checkpoint.
+    
+    Each word is one compact line, so a checkpoint costs the same however large the
+    dictionary has grown. Statistics are recalculated when a letter is completed.
     
     Args:
-        comprehensive_data (dict): The current comprehensive data
+        checkpoint_file (file): Checkpoint file opened in append mode
         letter (str): The current letter being processed
         word (str): The word that was just processed
-        filename (str): The filename to save to
+        detailed_info (dict): The detailed information fetched for the word
     """
     try:
-        # Update statistics for the current letter
-        if letter in comprehensive_data and "words" in comprehensive_data[letter]:
-            stats = calculate_detailed_statistics(comprehensive_data[letter]["words"], letter)
-            comprehensive_data[letter]["statistics"] = stats
-        
-        # Save the current state
-        save_comprehensive_data(comprehensive_data, filename)
-        logging.info(f"Checkpoint saved after processing '{word}'")
-        print(f"    ✓ Checkpoint saved after processing '{word}'")
+        record = {"letter": letter, "word": word, "data": detailed_info}
+        if orjson:
+            line = orjson.dumps(record).decode("utf-8")
+        else:
+            line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        checkpoint_file.write(line + "\n")
+        checkpoint_file.flush()
+        logging.info("Checkpoint saved after processing '%s'", word)
     except Exception as e:
-        logging.error(f"Error saving checkpoint: {e}")
-        print(f"    ✗ Error saving checkpoint: {e}")
+        logging.error("Error saving checkpoint: %s", e)
+
+
+def load_checkpoint(comprehensive_data, filename=CHECKPOINT_FILENAME):
+    """
+    Replay words saved in the JSONL checkpoint by an earlier, unfinished run.
+    
+    Args:
+        comprehensive_data (dict): The comprehensive data to add the words to
+        filename (str): The checkpoint file to read (default: CHECKPOINT_FILENAME)
+    
+    Returns:
+        int: Number of words restored from the checkpoint
+    """
+    restored_count = 0
+    try:
+        with open(filename, "r", encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                try:
+                    record = orjson.loads(line) if orjson else json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-write can leave a partial last line; skip it
+                    logging.warning("Skipping incomplete line in %s", filename)
+                    continue
+                letter = record["letter"]
+                letter_data = comprehensive_data.setdefault(letter, {
+                    "letter": letter,
+                    "description": f"Words starting with letter {letter}",
+                    "words": {},
+                    "statistics": {}
+                })
+                letter_data["words"][record["word"]] = record["data"]
+                restored_count += 1
+    except FileNotFoundError:
+        return 0
+    
+    if restored_count > 0:
+        logging.info("Restored %s words from checkpoint %s", restored_count, filename)
+        print(f"Restored {restored_count} words from checkpoint {filename}")
+    return restored_count
 
 
-def show_progress_summary(comprehensive_data, existing_data):
+class Progress:
+    """
+    Running per-letter counts of available and processed words.
+    
+    The counts are taken once at startup and updated as each word is stored, so a
+    progress summary never has to rescan the dictionaries.
+    """
+    
+    def __init__(self, comprehensive_data, existing_words):
+        """
+        Args:
+            comprehensive_data (dict): The comprehensive data loaded at startup
+            existing_words (dict): Letter -> list of words from the original word data
+        """
+        self.available_per_letter = Counter(
+            {letter: len(words) for letter, words in existing_words.items()}
+        )
+        self.processed_per_letter = Counter(
+            {letter: len(comprehensive_data.get(letter, {}).get("words", {})) for letter in existing_words}
+        )
+        # Words whose details were copied from another spelling or letter instead of fetched
+        self.duplicates = 0
+    
+    def record(self, letter):
+        """
+        Count one more processed word for a letter.
+        
+        Args:
+            letter (str): The letter the word belongs to
+        """
+        self.processed_per_letter[letter] += 1
+
+
+def show_progress_summary(progress):
     """
     Show a summary of progress across all letters.
     
     Args:
-        comprehensive_data (dict): The current comprehensive data
-        existing_data (dict): The original word data
+        progress (Progress): Running per-letter word counts
     """
     logging.info("Generating progress summary...")
     print("\nProgress Summary:")
@@ -407,24 +803,28 @@ def show_progress_summary(comprehensive_data, existing_data):
     total_available = 0
     
     for letter in string.ascii_uppercase:
-        if letter in existing_data and "words" in existing_data[letter]:
-            available = len(existing_data[letter]["words"])
-            processed = len(comprehensive_data.get(letter, {}).get("words", {}))
+        if letter in progress.available_per_letter:
+            available = progress.available_per_letter[letter]
+            processed = progress.processed_per_letter[letter]
             total_available += available
             total_processed += processed
             
             if available > 0:
                 percentage = (processed / available) * 100
-                logging.info(f"Letter {letter}: {processed}/{available} words ({percentage:.1f}%)")
+                logging.info("Letter %s: %s/%s words (%.1f%%)", letter, processed, available, percentage)
                 print(f"Letter {letter}: {processed}/{available} words ({percentage:.1f}%)")
     
     if total_available > 0:
         overall_percentage = (total_processed / total_available) * 100
-        logging.info(f"Overall Progress: {total_processed}/{total_available} words ({overall_percentage:.1f}%)")
+        logging.info("Overall Progress: %s/%s words (%.1f%%)", total_processed, total_available, overall_percentage)
         print(f"\nOverall Progress: {total_processed}/{total_available} words ({overall_percentage:.1f}%)")
     else:
         logging.info("No words found to process.")
         print("No words found to process.")
+    
+    if progress.duplicates > 0:
+        logging.info("Duplicate words reused without an API call: %s", progress.duplicates)
+        print(f"Duplicate words reused without an API call: {progress.duplicates}")
 
 
 def setup_logging():
@@ -434,15 +834,29 @@ def setup_logging():
     # Create logs directory if it doesn't exist
     os.makedirs("logs", exist_ok=True)
     
-    # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('logs/detailed_dictionary.log', encoding='utf-8'),
-            logging.StreamHandler()  # Also log to console
-        ]
-    )
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler('logs/detailed_dictionary.log', encoding='utf-8')
+    file_handler.setFormatter(formatter)
+    handlers = [file_handler]
+    
+    # Progress is printed separately, so the console only needs warnings and errors,
+    # and only when someone is watching
+    if sys.stdout.isatty():
+        stream_handler = logging.StreamHandler()
+        stream_handler.setLevel(logging.WARNING)
+        stream_handler.setFormatter(formatter)
+        handlers.append(stream_handler)
+    
+    # Configure logging: callers only put records on a queue, and a background thread
+    # writes them out, so worker threads never wait on the log file or the console
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
 
 def main():
@@ -472,13 +886,14 @@ def main():
             print("\nOperation cancelled by user.")
             return
     
-    # Load existing data
-    existing_data = load_existing_data()
+    # Load the existing word list (words only)
+    existing_words = load_existing_words()
     
     # Load existing comprehensive data based on user choice
     if choice == '1':
         # Resume from existing checkpoint
         comprehensive_data = load_comprehensive_data()
+        load_checkpoint(comprehensive_data)
         print("Resuming from existing checkpoint...")
         logging.info("User chose to resume from existing checkpoint")
     else:
@@ -487,117 +902,160 @@ def main():
         print("Starting fresh - will overwrite existing checkpoint...")
         logging.info("User chose to start fresh and overwrite existing checkpoint")
         
-        # Optionally backup existing file if it exists
-        import shutil
+        # Optionally backup existing file if it exists; it is about to be replaced,
+        # so renaming it is enough and avoids copying the whole file
         backup_filename = "99_02_comprehensive_english_dict_backup.json"
         try:
-            if os.path.exists("99_02_comprehensive_english_dict.json"):
-                shutil.copy2("99_02_comprehensive_english_dict.json", backup_filename)
-                print(f"Existing file backed up as: {backup_filename}")
-                logging.info(f"Existing file backed up as: {backup_filename}")
+            os.replace("99_02_comprehensive_english_dict.json", backup_filename)
+            print(f"Existing file backed up as: {backup_filename}")
+            logging.info("Existing file backed up as: %s", backup_filename)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Warning: Could not create backup: {e}")
-            logging.warning(f"Could not create backup: {e}")
+            logging.warning("Could not create backup: %s", e)
+        
+        # Discard words checkpointed by an earlier, unfinished run
+        try:
+            os.remove(CHECKPOINT_FILENAME)
+        except FileNotFoundError:
+            pass
     
-    # Calculate total words to process
-    total_words_to_process = 0
-    for letter in string.ascii_uppercase:
-        if letter in existing_data and "words" in existing_data[letter]:
-            total_words_to_process += len(existing_data[letter]["words"])
+    letters = string.ascii_uppercase
+    
+    # Build the work list in one sweep: make sure every letter has an entry and
+    # collect the words that still need detailed information
+    pending_words = {}
+    for letter in letters:
+        done_words = comprehensive_data.setdefault(letter, {
+            "letter": letter,
+            "description": f"Words starting with letter {letter}",
+            "words": {},
+            "statistics": {}
+        })["words"]
+        words = existing_words.get(letter)
+        if words is not None:
+            pending_words[letter] = [word for word in words if word not in done_words]
+    total_words_to_process = sum(len(letter_words) for letter_words in pending_words.values())
+    
+    # Details already available, by lower-case word, so a word listed twice (another
+    # letter or another casing) is only fetched once
+    known_words = {}
+    for letter_data in comprehensive_data.values():
+        for word, detailed_info in letter_data["words"].items():
+            known_words.setdefault(word.lower(), detailed_info)
     
-    logging.info(f"Total words to process: {total_words_to_process}")
+    logging.info("Total words to process: %s", total_words_to_process)
     print(f"Total words to process: {total_words_to_process}")
     
     # Show initial progress summary
-    show_progress_summary(comprehensive_data, existing_data)
+    progress = Progress(comprehensive_data, existing_words)
+    show_progress_summary(progress)
+    
+    # Open the persistent cache of Gemini responses from earlier runs
+    cache = WordCache()
+    
+    # Worker threads fetch words concurrently while sharing one rate limit
+    limiter = RateLimiter()
+    executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+    submit = executor.submit
+    
+    # Each processed word is appended here until the final JSON file is written
+    checkpoint_file = open(CHECKPOINT_FILENAME, "a", encoding="utf-8")
+    # Start on a fresh line in case an earlier run stopped part-way through a write
+    if checkpoint_file.seek(0, os.SEEK_END) > 0:
+        checkpoint_file.write("\n")
     
     # Track progress
     words_processed = 0
     
     # Process each letter of the alphabet
-    for letter in string.ascii_uppercase:
-        logging.info(f"Processing letter: {letter}")
+    for letter in letters:
+        logging.info("Processing letter: %s", letter)
         print(f"\nProcessing letter: {letter}")
         print("-" * 40)
         
-        # Initialize letter data if not already present
-        if letter not in comprehensive_data:
-            comprehensive_data[letter] = {
-                "letter": letter,
-                "description": f"Words starting with letter {letter}",
-                "words": {},
-                "statistics": {}
-            }
+        letter_data = comprehensive_data[letter]
+        done_words = letter_data["words"]
         
         # Get words for this letter from existing data
-        if letter in existing_data and "words" in existing_data[letter]:
-            words = existing_data[letter]["words"]
-            logging.info(f"Found {len(words)} words for letter {letter}")
+        if letter in pending_words:
+            words = existing_words[letter]
+            logging.info("Found %s words for letter %s", len(words), letter)
             print(f"Found {len(words)} words for letter {letter}")
             
             # Check how many words are already processed
-            already_processed = len(comprehensive_data[letter]["words"])
+            already_processed = len(done_words)
             if already_processed > 0:
-                logging.info(f"Resuming: {already_processed} words already processed for letter {letter}")
+                logging.info("Resuming: %s words already processed for letter %s", already_processed, letter)
                 print(f"Resuming: {already_processed} words already processed for letter {letter}")
             
-            # Process each word
-            for word, word_data in words.items():
-                # Skip if already processed
-                if word in comprehensive_data[letter]["words"]:
-                    logging.info(f"Skipping already processed word: {word}")
-                    print(f"  Skipping already processed word: {word}")
+            # Submit every word not processed yet; the workers share the rate limiter,
+            # so there is no fixed delay between calls
+            futures = {}
+            duplicates = []
+            submitted = set()
+            for word in pending_words[letter]:
+                canonical = word.lower()
+                if canonical in known_words or canonical in submitted:
+                    # Same word as one already fetched; copy its details afterwards
+                    duplicates.append(word)
                     continue
-                
-                logging.info(f"Processing word: {word}")
-                print(f"  Processing word: {word}")
-                
-                # Get detailed information from Gemini
-                detailed_info = get_detailed_word_info(word, letter)
-                
+                submitted.add(canonical)
+                logging.info("Processing word: %s", word)
+                futures[submit(get_detailed_word_info, word, letter,
+                               cache=cache, limiter=limiter)] = (word, canonical)
+            
+            # Store results on the main thread as they finish, then fill in the
+            # duplicates (evaluated lazily, after every fetch has been stored)
+            fetched = ((*futures[future], future.result()) for future in as_completed(futures))
+            copied = ((word, word.lower(), known_words.get(word.lower())) for word in duplicates)
+            for word, canonical, detailed_info in itertools.chain(fetched, copied):
                 if detailed_info:
-                    comprehensive_data[letter]["words"][word] = detailed_info
+                    known_words.setdefault(canonical, detailed_info)
+                    done_words[word] = detailed_info
+                    progress.record(letter)
                     words_processed += 1
-                    logging.info(f"Successfully processed {word} ({words_processed}/{total_words_to_process})")
-                    print(f"    ✓ Successfully processed {word} ({words_processed}/{total_words_to_process})")
+                    logging.info("Successfully processed %s (%s/%s)", word, words_processed, total_words_to_process)
                     
                     # Save checkpoint after each word
-                    save_checkpoint(comprehensive_data, letter, word)
+                    save_checkpoint(checkpoint_file, letter, word, detailed_info)
                 else:
-                    logging.error(f"Failed to process {word}")
-                    print(f"    ✗ Failed to process {word}")
-                
-                # Add a 1-second delay to avoid rate limiting
-                logging.info(f"Waiting 1 second before next API call...")
-                time.sleep(1)
+                    logging.error("Failed to process %s", word)
+            
+            progress.duplicates += sum(1 for word in duplicates if word in done_words)
             
             # Calculate and store final statistics for this letter
-            stats = calculate_detailed_statistics(comprehensive_data[letter]["words"], letter)
-            comprehensive_data[letter]["statistics"] = stats
+            stats = update_letter_statistics(letter_data, letter)
             
-            logging.info(f"Completed letter {letter}: {len(comprehensive_data[letter]['words'])} words processed")
-            print(f"Completed letter {letter}: {len(comprehensive_data[letter]['words'])} words processed")
+            logging.info("Completed letter %s: %s words processed", letter, len(done_words))
+            print(f"Completed letter {letter}: {len(done_words)} words processed")
             print(f"Statistics: {stats['total_words']} total words")
             
         else:
-            logging.info(f"No words found for letter {letter}")
+            logging.info("No words found for letter %s", letter)
             print(f"No words found for letter {letter}")
-            if letter not in comprehensive_data:
-                comprehensive_data[letter]["words"] = {}
-                comprehensive_data[letter]["statistics"] = calculate_detailed_statistics({}, letter)
+            update_letter_statistics(letter_data, letter)
     
-    # Save the final comprehensive data
+    executor.shutdown()
+    cache.close()
+    checkpoint_file.close()
+    
+    # Save the final comprehensive data and drop the checkpoint it now contains
     logging.info("Saving final comprehensive data...")
     print("\n" + "=" * 60)
     print("Saving final comprehensive data...")
-    save_comprehensive_data(comprehensive_data)
+    if save_comprehensive_data(comprehensive_data):
+        os.remove(CHECKPOINT_FILENAME)
+    else:
+        print(f"Processed words are kept in {CHECKPOINT_FILENAME} for the next run.")
     
     # Show final progress summary
-    show_progress_summary(comprehensive_data, existing_data)
+    show_progress_summary(progress)
     
     # Print final summary
     total_words = sum(len(data["words"]) for data in comprehensive_data.values())
-    logging.info(f"Comprehensive dictionary generation completed! Total words processed: {total_words}")
+    logging.info("Comprehensive dictionary generation completed! Total words processed: %s", total_words)
     print(f"\nComprehensive dictionary generation completed!")
     print(f"Total words processed: {total_words}")
     print("Data saved to: 99_02_comprehensive_english_dict.json")
@@ -17,12 +17,97 @@ Author: AI Assistant
 Date: 2024
 """
 
-import json
+import hashlib
+import io
 import logging
-from typing import Dict, List, Set, Any
-from collections import defaultdict, Counter
+import pickle
+import sys
+from typing import Dict, List, Set, Any, Iterator, Optional, Tuple, TypedDict
+from collections import defaultdict, Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 import os
 
+import ijson
+
+# orjson parses a whole document several times faster than ijson can stream it;
+# it is used for dictionaries small enough to load at once (pip install orjson)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Dictionaries up to this size are parsed in one orjson call; larger ones are
+# streamed letter by letter so memory use stays bounded
+WHOLE_FILE_LOAD_MAX_BYTES = 64 * 1024 * 1024
+
+# Dictionaries at least this large are analyzed one letter per worker process;
+# below it, process start-up and pickling cost more than the analysis itself
+PARALLEL_ANALYSIS_MIN_BYTES = 32 * 1024 * 1024
+
+# Analysis results are cached here, keyed by the dictionary's path, size and
+# modification time; bump STATS_CACHE_VERSION whenever the statistics change
+STATS_CACHE_DIR = "cache"
+STATS_CACHE_VERSION = 2
+
+# Fields checked for presence in every word, in dashboard order; the flags
+# returned by analyze_word_completeness follow the same order
+HAS_FIELDS = (
+    'complexity',
+    'definition',
+    'example',
+    'pronunciation',
+    'phonetic_respelling',
+    'ssml_phoneme',
+    'meanings',
+    'part_of_speech',
+    'synonyms',
+    'antonyms',
+    'word_origin',
+    'word_roots',
+    'verb_forms'
+)
+
+# Position of the verb_forms flag, which only applies to verbs
+VERB_IDX = HAS_FIELDS.index('verb_forms')
+
+# Bit recorded in an incomplete word's missing-field mask for each field
+FIELD_BITS = {field: 1 << index for index, field in enumerate(HAS_FIELDS)}
+
+# Static dashboard blocks, built once at import
+DOUBLE_RULE = "=" * 80
+SECTION_RULE = "-" * 40
+DASHBOARD_HEADER = f"\n{DOUBLE_RULE}\nCOMPREHENSIVE DICTIONARY ANALYSIS DASHBOARD\n{DOUBLE_RULE}\n"
+DASHBOARD_FOOTER = f"\n{DOUBLE_RULE}\nANALYSIS COMPLETE\n{DOUBLE_RULE}\n"
+OVERALL_STATISTICS_HEADER = f"\n📊 OVERALL STATISTICS\n{SECTION_RULE}\n"
+COMPLETENESS_OVERVIEW_HEADER = (
+    f"\n📈 COMPLETENESS OVERVIEW\n{SECTION_RULE}\n"
+    f"{'Fields Present':<20} {'Count':<10} {'Percentage':<12}\n{'-' * 42}\n"
+)
+COMPLEXITY_DISTRIBUTION_HEADER = (
+    f"\n🎯 COMPLEXITY DISTRIBUTION\n{SECTION_RULE}\n"
+    f"{'Complexity':<15} {'Count':<10} {'Percentage':<12}\n{'-' * 37}\n"
+)
+PART_OF_SPEECH_DISTRIBUTION_HEADER = (
+    f"\n📝 PART OF SPEECH DISTRIBUTION\n{SECTION_RULE}\n"
+    f"{'Part of Speech':<20} {'Count':<10}\n{'-' * 30}\n"
+)
+LETTER_DISTRIBUTION_HEADER = (
+    f"\n🔤 LETTER DISTRIBUTION\n{SECTION_RULE}\n"
+    f"{'Letter':<8} {'Words':<10} {'Percentage':<12}\n{'-' * 30}\n"
+)
+WORD_LENGTH_STATISTICS_HEADER = (
+    f"\n📏 WORD LENGTH STATISTICS\n{SECTION_RULE}\n"
+    f"{'Length':<8} {'Count':<10} {'Percentage':<12}\n{'-' * 30}\n"
+)
+COMPLETENESS_DISTRIBUTION_HEADER = (
+    f"\n✅ COMPLETENESS DISTRIBUTION\n{SECTION_RULE}\n"
+    f"{'Fields Present':<15} {'Words':<10} {'Percentage':<12}\n{'-' * 37}\n"
+)
+INCOMPLETE_WORDS_HEADER = f"\n⚠️  INCOMPLETE WORDS SUMMARY\n{SECTION_RULE}\n"
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -34,6 +119,48 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class DefinitionData(TypedDict, total=False):
+    """One definition of a meaning, as written by 01_03_Detailed_Dictionary.py."""
+    definition: str
+    example: str
+    synonyms: List[str]
+    antonyms: List[str]
+
+class MeaningData(TypedDict, total=False):
+    """One meaning of a word entry."""
+    part_of_speech: str
+    definitions: List[DefinitionData]
+    verb_forms: Dict[str, str]
+
+class WordData(TypedDict, total=False):
+    """A word entry in the comprehensive dictionary."""
+    complexity: str
+    pronunciation: Dict[str, str]
+    phonetic_respelling: str
+    ssml_phoneme: str
+    meanings: List[MeaningData]
+    word_origin: str
+    word_roots: List[Dict[str, str]]
+
+class LetterColumns(TypedDict):
+    """Per-word values of one letter, one row per word (see flatten_letter)."""
+    complexity: List[Any]
+    has_flags: List[Tuple[bool, ...]]
+    is_verb: List[bool]
+    parts_of_speech: List[List[Any]]
+
+class LetterStats(TypedDict):
+    """Partial statistics of one letter (see analyze_letter)."""
+    letter: str
+    word_count: int
+    field_stats: Dict[str, int]
+    completeness_stats: Counter
+    complexity_distribution: Counter
+    part_of_speech_distribution: Counter
+    word_length_stats: Counter
+    missing_field_counts: Counter
+    incomplete_words: List[Tuple[str, int]]
+
 class DictionaryAnalyzer:
     """Analyzes the comprehensive dictionary and provides statistics."""
     
@@ -45,128 +172,357 @@ class DictionaryAnalyzer:
             filename (str): Path to the comprehensive dictionary JSON file
         """
         self.filename = filename
-        self.data = {}
         self.stats = {}
         
-    def load_data(self) -> bool:
+    def iter_letters(self) -> Iterator[Tuple[str, Any]]:
         """
-        Load the dictionary data from JSON file.
+        Stream the dictionary one top-level letter entry at a time.
         
-        Returns:
-            bool: True if successful, False otherwise
+        Large files are parsed incrementally so each letter can be discarded
+        once the caller has finished with it; files up to
+        WHOLE_FILE_LOAD_MAX_BYTES are parsed in one go with orjson when it is
+        installed, which is faster when the file fits comfortably in memory.
+        
+        Yields:
+            Tuple[str, Any]: (letter, letter_data) pairs in file order
+        """
+        with open(self.filename, 'rb') as file:
+            if orjson and os.fstat(file.fileno()).st_size <= WHOLE_FILE_LOAD_MAX_BYTES:
+                logger.info(f"Loading dictionary data from {self.filename} with orjson")
+                yield from orjson.loads(file.read()).items()
+                return
+            
+            logger.info(f"Streaming dictionary data from {self.filename} (ijson backend: {ijson.backend})")
+            yield from ijson.kvitems(file, '', use_float=True)
+    
+    def iter_letter_words(self) -> Iterator[Tuple[str, Dict[str, WordData]]]:
         """
-        logger.info(f"Loading dictionary data from {self.filename}")
+        Stream the words of every letter entry in the dictionary.
         
-        try:
-            with open(self.filename, 'r', encoding='utf-8') as file:
-                self.data = json.load(file)
-            logger.info("Successfully loaded dictionary data")
-            return True
-        except FileNotFoundError:
-            logger.error(f"File {self.filename} not found")
-            return False
-        except json.JSONDecodeError as e:
-            logger.error(f"Error parsing JSON from {self.filename}: {e}")
-            return False
-        except Exception as e:
-            logger.error(f"Error loading file {self.filename}: {e}")
-            return False
+        Top-level values that are not letter entries are skipped.
+        
+        Yields:
+            Tuple[str, Dict[str, WordData]]: (letter, words) pairs in file order
+        """
+        for letter, letter_data in self.iter_letters():
+            # One subscript both finds the words and rejects values that are
+            # not letter entries (missing 'words', or not a dict at all)
+            try:
+                words = letter_data['words']
+            except (KeyError, TypeError):
+                continue
+            yield letter, words
     
-    def analyze_word_completeness(self, word_data: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def analyze_word_completeness(word_data: WordData) -> Tuple[Tuple[bool, ...], Tuple[int, int, int, int], bool, List[Any]]:
         """
         Analyze the completeness of a single word entry.
         
+        This is the per-word hot path; it depends only on word_data so it can
+        be called without an analyzer instance.
+        
         Args:
-            word_data (Dict[str, Any]): The word entry data
+            word_data (WordData): The word entry data
             
         Returns:
-            Dict[str, Any]: Analysis results for the word
+            Tuple: (has_flags, totals, is_verb, parts_of_speech) where has_flags
+            holds one bool per HAS_FIELDS entry, totals is (total_definitions,
+            total_synonyms, total_antonyms, total_meanings), is_verb tells whether
+            any meaning is a verb and parts_of_speech lists every part of speech
+            given for the word's meanings
         """
-        analysis = {
-            'has_complexity': False,
-            'has_definition': False,
-            'has_example': False,
-            'has_pronunciation': False,
-            'has_phonetic_respelling': False,
-            'has_ssml_phoneme': False,
-            'has_meanings': False,
-            'has_part_of_speech': False,
-            'has_synonyms': False,
-            'has_antonyms': False,
-            'has_word_origin': False,
-            'has_word_roots': False,
-            'has_verb_forms': False,
-            'total_definitions': 0,
-            'total_synonyms': 0,
-            'total_antonyms': 0,
-            'total_meanings': 0
-        }
-        
-        # Check basic fields
-        analysis['has_complexity'] = bool('complexity' in word_data and word_data['complexity'])
-        
-        # Check for definitions and examples in the nested structure
-        has_definition = False
-        has_example = False
-        if 'meanings' in word_data and word_data['meanings']:
-            for meaning in word_data['meanings']:
-                if 'definitions' in meaning and meaning['definitions']:
-                    for definition in meaning['definitions']:
-                        if 'definition' in definition and definition['definition']:
+        has_definition: bool = False
+        has_example: bool = False
+        has_meanings: bool = False
+        has_part_of_speech: bool = False
+        has_synonyms: bool = False
+        has_antonyms: bool = False
+        has_verb_forms: bool = False
+        total_definitions: int = 0
+        total_synonyms: int = 0
+        total_antonyms: int = 0
+        total_meanings: int = 0
+        is_verb: bool = False
+        parts_of_speech: List[Any] = []
+        get = word_data.get
+        
+        # Check meanings and related fields in a single traversal
+        meanings = get('meanings')
+        if meanings:
+            has_meanings = True
+            total_meanings = len(meanings)
+            
+            for meaning in meanings:
+                if 'part_of_speech' in meaning:
+                    part_of_speech = meaning['part_of_speech']
+                    parts_of_speech.append(part_of_speech)
+                    if part_of_speech:
+                        has_part_of_speech = True
+                    if part_of_speech == 'Verb':
+                        is_verb = True
+                
+                definitions = meaning.get('definitions')
+                if definitions:
+                    total_definitions += len(definitions)
+                    
+                    for definition in definitions:
+                        if definition.get('definition'):
                             has_definition = True
-                        if 'example' in definition and definition['example']:
+                        
+                        if definition.get('example'):
                             has_example = True
+                        
+                        synonyms = definition.get('synonyms')
+                        if synonyms:
+                            has_synonyms = True
+                            total_synonyms += len(synonyms)
+                        
+                        antonyms = definition.get('antonyms')
+                        if antonyms:
+                            has_antonyms = True
+                            total_antonyms += len(antonyms)
+                
+                # Check if verb_forms has actual content
+                verb_forms = meaning.get('verb_forms')
+                if verb_forms and isinstance(verb_forms, dict) and any(verb_forms.values()):
+                    has_verb_forms = True
+        
+        has_flags = (
+            bool(get('complexity')),
+            has_definition,
+            has_example,
+            bool(get('pronunciation')),
+            bool(get('phonetic_respelling')),
+            bool(get('ssml_phoneme')),
+            has_meanings,
+            has_part_of_speech,
+            has_synonyms,
+            has_antonyms,
+            bool(get('word_origin')),
+            bool(get('word_roots')),
+            has_verb_forms
+        )
+        totals = (total_definitions, total_synonyms, total_antonyms, total_meanings)
+        return has_flags, totals, is_verb, parts_of_speech
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def summarize_flags(has_flags: Tuple[bool, ...], is_verb: bool) -> Tuple[int, int, Tuple[str, ...]]:
+        """
+        Count the present fields and list the missing ones for a set of flags.
         
-        analysis['has_definition'] = has_definition
-        analysis['has_example'] = has_example
+        Dictionary entries are formulaic, so only a handful of distinct flag
+        combinations occur; the result is cached per combination instead of
+        being recomputed for every word.
         
-        # Check pronunciation fields
-        analysis['has_pronunciation'] = bool('pronunciation' in word_data and word_data['pronunciation'])
-        analysis['has_phonetic_respelling'] = bool('phonetic_respelling' in word_data and word_data['phonetic_respelling'])
-        analysis['has_ssml_phoneme'] = bool('ssml_phoneme' in word_data and word_data['ssml_phoneme'])
+        Args:
+            has_flags (Tuple[bool, ...]): One flag per HAS_FIELDS entry
+            is_verb (bool): Whether the word has a verb meaning
+            
+        Returns:
+            Tuple[int, int, Tuple[str, ...]]: (complete_fields, missing_mask,
+            missing_fields), where missing_mask combines the FIELD_BITS of the
+            missing fields
+        """
+        # verb_forms only applies to verbs; count it as complete otherwise
+        if not is_verb:
+            has_flags = has_flags[:VERB_IDX] + (True,) + has_flags[VERB_IDX + 1:]
+        
+        complete_fields = sum(has_flags)
+        missing_fields = tuple(field for field, has_field in zip(HAS_FIELDS, has_flags) if not has_field)
+        missing_mask = sum(FIELD_BITS[field] for field in missing_fields)
         
-        # Check advanced fields
-        analysis['has_word_origin'] = bool('word_origin' in word_data and word_data['word_origin'])
-        analysis['has_word_roots'] = bool('word_roots' in word_data and word_data['word_roots'])
+        return complete_fields, missing_mask, missing_fields
+    
+    @staticmethod
+    def decode_missing_fields(missing_mask: int) -> List[str]:
+        """
+        Expand a missing-field mask from the incomplete words statistics.
         
-        # Check meanings and related fields
-        if 'meanings' in word_data and word_data['meanings']:
-            analysis['has_meanings'] = True
-            analysis['total_meanings'] = len(word_data['meanings'])
+        Args:
+            missing_mask (int): Combined FIELD_BITS of the missing fields
             
-            for meaning in word_data['meanings']:
-                if 'part_of_speech' in meaning and meaning['part_of_speech']:
-                    analysis['has_part_of_speech'] = True
-                
-                if 'definitions' in meaning and meaning['definitions']:
-                    analysis['total_definitions'] += len(meaning['definitions'])
-                    
-                    for definition in meaning['definitions']:
-                        if 'synonyms' in definition and definition['synonyms']:
-                            analysis['has_synonyms'] = True
-                            analysis['total_synonyms'] += len(definition['synonyms'])
-                        
-                        if 'antonyms' in definition and definition['antonyms']:
-                            analysis['has_antonyms'] = True
-                            analysis['total_antonyms'] += len(definition['antonyms'])
-                
-                if 'verb_forms' in meaning and meaning['verb_forms']:
-                    # Check if verb_forms has actual content
-                    verb_forms = meaning['verb_forms']
-                    if isinstance(verb_forms, dict) and any(verb_forms.values()):
-                        analysis['has_verb_forms'] = True
+        Returns:
+            List[str]: The missing field names, in HAS_FIELDS order
+        """
+        return [field for field in HAS_FIELDS if missing_mask & FIELD_BITS[field]]
+    
+    @staticmethod
+    def flatten_letter(words: Dict[str, WordData]) -> LetterColumns:
+        """
+        Flatten one letter's nested word entries into parallel columns.
+        
+        Every per-word value the statistics need is extracted in a single
+        traversal, so the aggregation can work on flat lists instead of walking
+        the nested entries again.
+        
+        Args:
+            words (Dict[str, WordData]): The letter's words, keyed by word
+            
+        Returns:
+            LetterColumns: 'complexity', 'has_flags', 'is_verb' and
+            'parts_of_speech' columns, one row per word in the order of words
+        """
+        complexity_column: List[Any] = []
+        flags_column: List[Tuple[bool, ...]] = []
+        is_verb_column: List[bool] = []
+        parts_of_speech_column: List[List[Any]] = []
+        
+        # Bind everything the loop touches to locals once
+        analyze_word_completeness = DictionaryAnalyzer.analyze_word_completeness
+        add_complexity = complexity_column.append
+        add_flags = flags_column.append
+        add_is_verb = is_verb_column.append
+        add_parts_of_speech = parts_of_speech_column.append
+        
+        for word_data in words.values():
+            has_flags, totals, is_verb, parts_of_speech = analyze_word_completeness(word_data)
+            add_complexity(word_data.get('complexity'))
+            add_flags(has_flags)
+            add_is_verb(is_verb)
+            add_parts_of_speech(parts_of_speech)
+        
+        return {
+            'complexity': complexity_column,
+            'has_flags': flags_column,
+            'is_verb': is_verb_column,
+            'parts_of_speech': parts_of_speech_column
+        }
+    
+    @staticmethod
+    def analyze_letter(letter: str, words: Dict[str, WordData]) -> LetterStats:
+        """
+        Collect the statistics of a single letter.
+        
+        Letters are independent, so this can run in a worker process; the
+        partial results are merged by analyze_dictionary.
+        
+        Args:
+            letter (str): The letter being analyzed
+            words (Dict[str, WordData]): The letter's words, keyed by word
+            
+        Returns:
+            LetterStats: Partial statistics for the letter
+        """
+        field_stats: Dict[str, int] = {}
+        
+        # Flatten the letter once, then reduce each column
+        columns = DictionaryAnalyzer.flatten_letter(words)
+        flags_column = columns['has_flags']
+        is_verb_column = columns['is_verb']
+        
+        # Track field presence; verb_forms only counts for verbs
+        for index, (field, count) in enumerate(zip(HAS_FIELDS, map(sum, zip(*flags_column)))):
+            if index != VERB_IDX:
+                field_stats[field] = count
+        verb_forms_column = [has_flags[VERB_IDX] for has_flags, is_verb in zip(flags_column, is_verb_column) if is_verb]
+        if verb_forms_column:
+            field_stats['verb_forms'] = sum(verb_forms_column)
+        
+        # Summarize every word's flags, then count the summaries with C-level
+        # Counter construction rather than per-word increments
+        summaries = list(map(DictionaryAnalyzer.summarize_flags, flags_column, is_verb_column))
+        completeness_stats = Counter(map(itemgetter(0), summaries))
+        missing_field_counts = Counter(chain.from_iterable(map(itemgetter(2), summaries)))
+        
+        # Track incomplete words as compact (word, missing_mask) pairs
+        incomplete_words = [
+            (word, missing_mask)
+            for word, (complete_fields, missing_mask, missing_fields) in zip(words, summaries)
+            if missing_mask
+        ]
+        
+        return {
+            'letter': letter,
+            'word_count': len(words),
+            'field_stats': field_stats,
+            'completeness_stats': completeness_stats,
+            'complexity_distribution': Counter(filter(None, columns['complexity'])),
+            'part_of_speech_distribution': Counter(chain.from_iterable(filter(any, columns['parts_of_speech']))),
+            'word_length_stats': Counter(map(len, words)),
+            'missing_field_counts': missing_field_counts,
+            'incomplete_words': incomplete_words
+        }
+    
+    def stats_cache_path(self) -> Optional[str]:
+        """
+        Get the cache file for the current version of the dictionary file.
+        
+        Returns:
+            str: Path of the pickled statistics, or None if the dictionary
+            file cannot be found
+        """
+        try:
+            file_stat = os.stat(self.filename)
+        except OSError:
+            return None
+        
+        key = f"{STATS_CACHE_VERSION}:{os.path.abspath(self.filename)}:{file_stat.st_mtime_ns}:{file_stat.st_size}"
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(STATS_CACHE_DIR, f"dictionary_stats_{digest}.pkl")
+    
+    def load_cached_stats(self, cache_path: str) -> Dict[str, Any]:
+        """
+        Load previously computed statistics from the cache.
+        
+        Args:
+            cache_path (str): Path returned by stats_cache_path
+            
+        Returns:
+            Dict[str, Any]: The cached statistics, or an empty dict on a cache miss
+        """
+        try:
+            with open(cache_path, 'rb') as file:
+                stats = pickle.load(file)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable stats cache {cache_path}: {e}")
+            return {}
         
-        return analysis
+        logger.info(f"Loaded cached analysis from {cache_path}")
+        return stats
+    
+    def save_cached_stats(self, cache_path: str, stats: Dict[str, Any]):
+        """
+        Store computed statistics in the cache.
+        
+        Args:
+            cache_path (str): Path returned by stats_cache_path
+            stats (Dict[str, Any]): The statistics to store
+        """
+        temp_path = f"{cache_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(temp_path, 'wb') as file:
+                pickle.dump(stats, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write stats cache {cache_path}: {e}")
     
     def analyze_dictionary(self) -> Dict[str, Any]:
         """
         Analyze the entire dictionary and collect statistics.
         
+        Results are reused from the stats cache when the dictionary file has
+        not changed since the last analysis. Large dictionaries are analyzed
+        one letter per worker process, with only a bounded number of parsed
+        letters waiting at any time. The results include a word -> letter
+        index used by debug_word_analysis.
+        
         Returns:
-            Dict[str, Any]: Comprehensive analysis results
+            Dict[str, Any]: Comprehensive analysis results, or an empty dict
+            if the dictionary file could not be read
         """
         logger.info("Starting dictionary analysis")
         
+        cache_path = self.stats_cache_path()
+        if cache_path:
+            cached_stats = self.load_cached_stats(cache_path)
+            if cached_stats:
+                self.stats = cached_stats
+                return self.stats
+        
         total_words = 0
         completeness_stats = defaultdict(int)
         field_stats = defaultdict(int)
@@ -176,104 +532,68 @@ class DictionaryAnalyzer:
         letter_distribution = Counter()
         
         # Track words with missing fields
+        missing_field_counts = Counter()
         incomplete_words = defaultdict(list)
         
-        for letter, letter_data in self.data.items():
-            if isinstance(letter_data, dict) and 'words' in letter_data:
-                letter_distribution[letter] = len(letter_data['words'])
-                
-                for word, word_data in letter_data['words'].items():
-                    total_words += 1
-                    word_length_stats[len(word)] += 1
-                    
-                    # Analyze word completeness
-                    analysis = self.analyze_word_completeness(word_data)
-                    
-                    # Count completeness levels
-                    # Check if any meaning is a verb for verb_forms calculation
-                    is_verb = False
-                    if 'meanings' in word_data and word_data['meanings']:
-                        for meaning in word_data['meanings']:
-                            if meaning.get('part_of_speech') == 'Verb':
-                                is_verb = True
-                                break
-                    
-                    complete_fields = sum([
-                        int(analysis['has_complexity']),
-                        int(analysis['has_definition']),
-                        int(analysis['has_example']),
-                        int(analysis['has_pronunciation']),
-                        int(analysis['has_phonetic_respelling']),
-                        int(analysis['has_ssml_phoneme']),
-                        int(analysis['has_meanings']),
-                        int(analysis['has_part_of_speech']),
-                        int(analysis['has_synonyms']),
-                        int(analysis['has_antonyms']),
-                        int(analysis['has_word_origin']),
-                        int(analysis['has_word_roots']),
-                        int(analysis['has_verb_forms']) if is_verb else 1  # Count as complete if not a verb
-                    ])
-                    
-                    completeness_stats[complete_fields] += 1
-                    
-                    # Track field presence
-                    for field, has_field in analysis.items():
-                        if field.startswith('has_'):
-                            # Special handling for verb_forms - only count for verbs
-                            if field == 'has_verb_forms':
-                                # Check if any meaning is a verb
-                                is_verb = False
-                                if 'meanings' in word_data and word_data['meanings']:
-                                    for meaning in word_data['meanings']:
-                                        if meaning.get('part_of_speech') == 'Verb':
-                                            is_verb = True
-                                            break
-                                # Only count verb_forms if it's a verb
-                                if is_verb:
-                                    field_stats[field] += int(bool(has_field))
-                            else:
-                                field_stats[field] += int(bool(has_field))
-                    
-                    # Track complexity
-                    if analysis['has_complexity']:
-                        complexity_distribution[word_data['complexity']] += 1
-                    
-                    # Track part of speech
-                    if analysis['has_part_of_speech']:
-                        for meaning in word_data.get('meanings', []):
-                            if 'part_of_speech' in meaning:
-                                part_of_speech_distribution[meaning['part_of_speech']] += 1
-                    
-                    # Track incomplete words
-                    missing_fields = []
-                    for field, has_field in analysis.items():
-                        if field.startswith('has_') and not bool(has_field):
-                            # Special handling for verb_forms - only count as missing for verbs
-                            if field == 'has_verb_forms':
-                                # Check if any meaning is a verb
-                                is_verb = False
-                                if 'meanings' in word_data and word_data['meanings']:
-                                    for meaning in word_data['meanings']:
-                                        if meaning.get('part_of_speech') == 'Verb':
-                                            is_verb = True
-                                            break
-                                # Only count verb_forms as missing if it's actually a verb
-                                if is_verb:
-                                    missing_fields.append(field.replace('has_', ''))
-                            else:
-                                missing_fields.append(field.replace('has_', ''))
-                    
-                    if missing_fields:
-                        incomplete_words[letter].append({
-                            'word': word,
-                            'missing_fields': missing_fields
-                        })
+        # Word names of every letter, for the word -> letter index
+        letter_word_names = []
+        
+        def merge(partial: LetterStats):
+            nonlocal total_words
+            letter = partial['letter']
+            letter_distribution[letter] = partial['word_count']
+            total_words += partial['word_count']
+            for field, count in partial['field_stats'].items():
+                field_stats[field] += count
+            for complete_fields, count in partial['completeness_stats'].items():
+                completeness_stats[complete_fields] += count
+            complexity_distribution.update(partial['complexity_distribution'])
+            part_of_speech_distribution.update(partial['part_of_speech_distribution'])
+            word_length_stats.update(partial['word_length_stats'])
+            missing_field_counts.update(partial['missing_field_counts'])
+            if partial['incomplete_words']:
+                incomplete_words[letter].extend(partial['incomplete_words'])
+        
+        try:
+            letters = self.iter_letter_words()
+            
+            if os.path.getsize(self.filename) < PARALLEL_ANALYSIS_MIN_BYTES:
+                for letter, words in letters:
+                    letter_word_names.append((letter, list(words)))
+                    merge(self.analyze_letter(letter, words))
+            else:
+                max_workers = os.cpu_count() or 1
+                logger.info(f"Analyzing letters in parallel with {max_workers} worker processes")
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    # Merge in submission order so every distribution keeps file order
+                    pending = deque()
+                    for letter, words in letters:
+                        letter_word_names.append((letter, list(words)))
+                        pending.append(executor.submit(self.analyze_letter, letter, words))
+                        if len(pending) > max_workers:
+                            merge(pending.popleft().result())
+                    while pending:
+                        merge(pending.popleft().result())
+        except FileNotFoundError:
+            logger.error(f"File {self.filename} not found")
+            return {}
+        except (ijson.JSONError, ValueError) as e:
+            logger.error(f"Error parsing JSON from {self.filename}: {e}")
+            return {}
+        except Exception as e:
+            logger.error(f"Error loading file {self.filename}: {e}")
+            return {}
         
         # Calculate percentages
         field_percentages = {}
         for field, count in field_stats.items():
             field_percentages[field] = (count / total_words * 100) if total_words > 0 else 0
         
+        # Index every word by the first letter entry that contains it
+        word_letters = {}
+        for letter, word_names in reversed(letter_word_names):
+            word_letters.update(dict.fromkeys(word_names, letter))
+        
         self.stats = {
             'total_words': total_words,
             'completeness_stats': dict(completeness_stats),
@@ -283,36 +603,68 @@ class DictionaryAnalyzer:
             'part_of_speech_distribution': dict(part_of_speech_distribution),
             'word_length_stats': dict(word_length_stats),
             'letter_distribution': dict(letter_distribution),
-            'incomplete_words': dict(incomplete_words)
+            'missing_field_counts': missing_field_counts,
+            'incomplete_words': dict(incomplete_words),
+            'word_letters': word_letters
         }
         
+        if cache_path:
+            self.save_cached_stats(cache_path, self.stats)
+        
         logger.info(f"Analysis completed. Total words: {total_words}")
         return self.stats
     
+    def load_word(self, letter: str, word_name: str) -> Optional[WordData]:
+        """
+        Read a single word entry from the dictionary file.
+        
+        Only the given letter's words are built into Python objects; the rest
+        of the file is skipped by the ijson tokenizer.
+        
+        Args:
+            letter (str): The letter entry holding the word
+            word_name (str): The word to read
+            
+        Returns:
+            Optional[WordData]: The word entry, or None if it is not there
+        """
+        with open(self.filename, 'rb') as file:
+            for word, word_data in ijson.kvitems(file, f"{letter}.words", use_float=True):
+                if word == word_name:
+                    return word_data
+        return None
+    
     def debug_word_analysis(self, word_name: str):
         """
         Debug analysis for a specific word.
         
+        The word is found through the word index built by analyze_dictionary
+        instead of scanning every letter.
+        
         Args:
             word_name (str): The word to debug
         """
-        for letter, letter_data in self.data.items():
-            if isinstance(letter_data, dict) and 'words' in letter_data:
-                if word_name in letter_data['words']:
-                    word_data = letter_data['words'][word_name]
-                    analysis = self.analyze_word_completeness(word_data)
-                    print(f"\nDebug for word '{word_name}':")
-                    print(f"  Has verb_forms: {analysis['has_verb_forms']}")
-                    print(f"  Has meanings: {analysis['has_meanings']}")
-                    if 'meanings' in word_data:
-                        for i, meaning in enumerate(word_data['meanings']):
-                            print(f"  Meaning {i+1}:")
-                            print(f"    Part of speech: {meaning.get('part_of_speech', 'N/A')}")
-                            print(f"    Has verb_forms: {'verb_forms' in meaning}")
-                            if 'verb_forms' in meaning:
-                                print(f"    Verb forms: {meaning['verb_forms']}")
-                    return
-        print(f"Word '{word_name}' not found in dictionary")
+        if not self.stats:
+            logger.error("No analysis results available. Run analyze_dictionary() first.")
+            return
+        
+        letter = self.stats['word_letters'].get(word_name)
+        word_data = self.load_word(letter, word_name) if letter is not None else None
+        if word_data is None:
+            print(f"Word '{word_name}' not found in dictionary")
+            return
+        
+        has_flags = dict(zip(HAS_FIELDS, self.analyze_word_completeness(word_data)[0]))
+        print(f"\nDebug for word '{word_name}':")
+        print(f"  Has verb_forms: {has_flags['verb_forms']}")
+        print(f"  Has meanings: {has_flags['meanings']}")
+        if 'meanings' in word_data:
+            for i, meaning in enumerate(word_data['meanings']):
+                print(f"  Meaning {i+1}:")
+                print(f"    Part of speech: {meaning.get('part_of_speech', 'N/A')}")
+                print(f"    Has verb_forms: {'verb_forms' in meaning}")
+                if 'verb_forms' in meaning:
+                    print(f"    Verb forms: {meaning['verb_forms']}")
 
     def print_tabular_dashboard(self):
         """Print a comprehensive tabular dashboard of the analysis results."""
@@ -320,101 +672,69 @@ class DictionaryAnalyzer:
             logger.error("No analysis results available. Run analyze_dictionary() first.")
             return
         
-        print("\n" + "="*80)
-        print("COMPREHENSIVE DICTIONARY ANALYSIS DASHBOARD")
-        print("="*80)
+        # Build the whole dashboard in memory and write it with a single call
+        buffer = io.StringIO()
+        write = buffer.write
+        stats = self.stats
+        total_words = stats['total_words']
+        
+        write(DASHBOARD_HEADER)
         
         # Overall Statistics
-        print(f"\n📊 OVERALL STATISTICS")
-        print("-" * 40)
-        print(f"Total Words: {self.stats['total_words']:,}")
-        print(f"Letters Covered: {len(self.stats['letter_distribution'])}")
+        write(OVERALL_STATISTICS_HEADER)
+        write(f"Total Words: {total_words:,}\n")
+        write(f"Letters Covered: {len(stats['letter_distribution'])}\n")
         
         # Completeness Overview
-        print(f"\n📈 COMPLETENESS OVERVIEW")
-        print("-" * 40)
-        print(f"{'Fields Present':<20} {'Count':<10} {'Percentage':<12}")
-        print("-" * 42)
-        
-        for field, count in self.stats['field_stats'].items():
-            percentage = self.stats['field_percentages'][field]
-            field_name = field.replace('has_', '').replace('_', ' ').title()
-            print(f"{field_name:<20} {count:<10} {percentage:>8.1f}%")
+        write(COMPLETENESS_OVERVIEW_HEADER)
+        field_percentages = stats['field_percentages']
+        for field, count in stats['field_stats'].items():
+            percentage = field_percentages[field]
+            field_name = field.replace('_', ' ').title()
+            write(f"{field_name:<20} {count:<10} {percentage:>8.1f}%\n")
         
         # Complexity Distribution
-        print(f"\n🎯 COMPLEXITY DISTRIBUTION")
-        print("-" * 40)
-        print(f"{'Complexity':<15} {'Count':<10} {'Percentage':<12}")
-        print("-" * 37)
-        
-        total_words = self.stats['total_words']
-        for complexity, count in self.stats['complexity_distribution'].items():
+        write(COMPLEXITY_DISTRIBUTION_HEADER)
+        for complexity, count in stats['complexity_distribution'].items():
             percentage = (count / total_words * 100) if total_words > 0 else 0
-            print(f"{complexity:<15} {count:<10} {percentage:>8.1f}%")
+            write(f"{complexity:<15} {count:<10} {percentage:>8.1f}%\n")
         
         # Part of Speech Distribution
-        print(f"\n📝 PART OF SPEECH DISTRIBUTION")
-        print("-" * 40)
-        print(f"{'Part of Speech':<20} {'Count':<10}")
-        print("-" * 30)
-        
-        for pos, count in self.stats['part_of_speech_distribution'].items():
-            print(f"{pos:<20} {count:<10}")
+        write(PART_OF_SPEECH_DISTRIBUTION_HEADER)
+        for pos, count in stats['part_of_speech_distribution'].items():
+            write(f"{pos:<20} {count:<10}\n")
         
         # Letter Distribution
-        print(f"\n🔤 LETTER DISTRIBUTION")
-        print("-" * 40)
-        print(f"{'Letter':<8} {'Words':<10} {'Percentage':<12}")
-        print("-" * 30)
-        
-        for letter in sorted(self.stats['letter_distribution'].keys()):
-            count = self.stats['letter_distribution'][letter]
+        write(LETTER_DISTRIBUTION_HEADER)
+        for letter, count in sorted(stats['letter_distribution'].items()):
             percentage = (count / total_words * 100) if total_words > 0 else 0
-            print(f"{letter:<8} {count:<10} {percentage:>8.1f}%")
+            write(f"{letter:<8} {count:<10} {percentage:>8.1f}%\n")
         
         # Word Length Statistics
-        print(f"\n📏 WORD LENGTH STATISTICS")
-        print("-" * 40)
-        print(f"{'Length':<8} {'Count':<10} {'Percentage':<12}")
-        print("-" * 30)
-        
-        for length in sorted(self.stats['word_length_stats'].keys()):
-            count = self.stats['word_length_stats'][length]
+        write(WORD_LENGTH_STATISTICS_HEADER)
+        for length, count in sorted(stats['word_length_stats'].items()):
             percentage = (count / total_words * 100) if total_words > 0 else 0
-            print(f"{length:<8} {count:<10} {percentage:>8.1f}%")
+            write(f"{length:<8} {count:<10} {percentage:>8.1f}%\n")
         
         # Completeness Distribution
-        print(f"\n✅ COMPLETENESS DISTRIBUTION")
-        print("-" * 40)
-        print(f"{'Fields Present':<15} {'Words':<10} {'Percentage':<12}")
-        print("-" * 37)
-        
-        for fields_present, count in sorted(self.stats['completeness_stats'].items()):
+        write(COMPLETENESS_DISTRIBUTION_HEADER)
+        for fields_present, count in sorted(stats['completeness_stats'].items()):
             percentage = (count / total_words * 100) if total_words > 0 else 0
-            print(f"{fields_present:<15} {count:<10} {percentage:>8.1f}%")
+            write(f"{fields_present:<15} {count:<10} {percentage:>8.1f}%\n")
         
         # Incomplete Words Summary
-        print(f"\n⚠️  INCOMPLETE WORDS SUMMARY")
-        print("-" * 40)
-        
-        total_incomplete = sum(len(words) for words in self.stats['incomplete_words'].values())
-        print(f"Total Incomplete Words: {total_incomplete}")
+        write(INCOMPLETE_WORDS_HEADER)
+        total_incomplete = sum(len(words) for words in stats['incomplete_words'].values())
+        write(f"Total Incomplete Words: {total_incomplete}\n")
         
         if total_incomplete > 0:
-            print(f"\nTop Missing Fields:")
-            missing_field_counts = Counter()
-            for letter_words in self.stats['incomplete_words'].values():
-                for word_info in letter_words:
-                    for field in word_info['missing_fields']:
-                        missing_field_counts[field] += 1
-            
-            for field, count in missing_field_counts.most_common(5):
+            write("\nTop Missing Fields:\n")
+            for field, count in stats['missing_field_counts'].most_common(5):
                 percentage = (count / total_incomplete * 100) if total_incomplete > 0 else 0
-                print(f"  {field.replace('_', ' ').title()}: {count} ({percentage:.1f}%)")
+                write(f"  {field.replace('_', ' ').title()}: {count} ({percentage:.1f}%)\n")
         
-        print("\n" + "="*80)
-        print("ANALYSIS COMPLETE")
-        print("="*80)
+        write(DASHBOARD_FOOTER)
+        sys.stdout.write(buffer.getvalue())
 
 def main():
     """
@@ -425,14 +745,12 @@ def main():
     # Initialize analyzer
     analyzer = DictionaryAnalyzer("99_02_comprehensive_english_dict.json")
     
-    # Load data
-    if not analyzer.load_data():
+    # Analyze dictionary, streaming it from disk
+    stats = analyzer.analyze_dictionary()
+    if not stats:
         logger.error("Failed to load dictionary data. Exiting.")
         return
     
-    # Analyze dictionary
-    stats = analyzer.analyze_dictionary()
-    
     # Debug a few words to check verb forms detection
     print("\n🔍 DEBUGGING VERB FORMS DETECTION:")
     analyzer.debug_word_analysis("Abate")  # Should have verb forms
@@ -22,27 +22,156 @@ Author: AI Assistant
 Date: 2024
 """
 
+import atexit
+import importlib.util
 import json
 import os
 import logging
+import logging.handlers
+import queue
+import threading
 import time
-import requests
-import subprocess
-from typing import Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter
+from typing import Dict, List, Any, Iterator, NamedTuple, Optional, Tuple
 import re
-import base64
 
-# Setup comprehensive logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
+import ijson
+
+from tts_client import (
+    AUDIO_STREAM_CHUNK_BYTES,
+    RateLimiter,
+    cache_key,
+    create_grpc_client,
+    create_session,
+    link_cached_audio,
+    load_project_id,
+    locate_gcloud,
+    read_gcloud_project,
+    stream_audio_content
+)
+
+# Faster JSON for the dictionary file and TTS request bodies (pip install orjson)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def setup_logging():
+    """
+    Setup comprehensive logging to the log file and the console.
+    
+    Callers only put records on a queue, and a background thread writes them out,
+    so worker threads never wait on the log file or the console.
+    """
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handlers = [
         logging.FileHandler('audio_generation.log'),
         logging.StreamHandler()
     ]
-)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
+setup_logging()
 logger = logging.getLogger(__name__)
 
+# Dictionaries up to this size are loaded in one go; larger ones are streamed letter
+# by letter so the whole dictionary is never held in memory
+WHOLE_FILE_LOAD_MAX_BYTES = 64 * 1024 * 1024
+
+# Progress is logged once per this many finished words instead of once per word
+PROGRESS_LOG_INTERVAL = 100
+
+# Number of words synthesized at the same time
+MAX_CONCURRENT_REQUESTS = 8
+
+# Combined request rate allowed across all worker threads (Text-to-Speech per-minute quota)
+REQUESTS_PER_MINUTE = 300
+
+# Transient server errors retried by the HTTP session, with exponential backoff; 429 is
+# left out because quota errors are handled by pausing the shared rate limiter below
+HTTP_MAX_RETRIES = 5
+HTTP_RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+# Quota errors (HTTP 429) pause every worker for the server's Retry-After delay, or
+# RATE_LIMIT_DELAY_SECONDS when none is given, before the request is tried again
+MAX_RATE_LIMIT_RETRIES = 5
+RATE_LIMIT_DELAY_SECONDS = 10
+
+# Text-to-Speech REST endpoint used for the Chirp3 HD voices
+TTS_SYNTHESIZE_URL = "https://texttospeech.googleapis.com/v1/text:synthesize"
+
+# Encoding requested from the Text-to-Speech API (part of the audio cache key)
+AUDIO_ENCODING = "MP3"
+
+# audioConfig sent with every synthesize request; never modified
+TTS_AUDIO_CONFIG = {"audioEncoding": AUDIO_ENCODING}
+
+# Filename label for each audio type: "{word}-{label}-{voice}.mp3"
+AUDIO_FILE_LABELS = {
+    "example": "example_and_sample",
+    "pronunciation": "pronunciation"
+}
+
+# Subfolder of the audio folder holding synthesized audio named by a hash of its
+# text, voice and encoding, so identical requests are never sent twice
+AUDIO_CACHE_FOLDER = "cache"
+
+# Number of locks shared out among audio cache entries by hash; far more than the
+# worker count, so unrelated requests rarely wait on each other
+SYNTHESIS_LOCK_STRIPES = 64
+
+
+def get_retry_after(response) -> Optional[float]:
+    """
+    Extract the server-requested retry delay from an HTTP response, if any.
+    
+    Args:
+        response (requests.Response): The rate-limited response
+    
+    Returns:
+        float: Seconds to wait, or None if the response carries no usable Retry-After header
+    """
+    try:
+        return float(response.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+def is_module_available(module_name: str) -> bool:
+    """
+    Check whether a module can be imported, without importing it.
+    
+    Args:
+        module_name (str): Dotted module name
+    
+    Returns:
+        bool: True if the module is installed
+    """
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except ImportError:
+        # A parent package of a dotted name is missing
+        return False
+
+
+class WordJob(NamedTuple):
+    """A word queued for audio generation, with its extracted data."""
+    word_name: str
+    word_data: Dict[str, str]
+
+
 class AudioGenerator:
     def __init__(self, json_file_path: str = "99_02_comprehensive_english_dict.json"):
         """
@@ -59,6 +188,21 @@ class AudioGenerator:
             os.makedirs(self.audio_folder)
             logger.info(f"Created audio folder: {self.audio_folder}")
         
+        # Content-addressed cache shared by every word and run
+        self.cache_folder = os.path.join(self.audio_folder, AUDIO_CACHE_FOLDER)
+        os.makedirs(self.cache_folder, exist_ok=True)
+        
+        # Locks guarding synthesis of cache entries, so identical requests from different
+        # threads are sent only once; a fixed set keeps memory flat however many words run
+        self.synthesis_locks = [threading.Lock() for _ in range(SYNTHESIS_LOCK_STRIPES)]
+        
+        # pyttsx3 engine, created on first use and shared by every call
+        self.pyttsx3_engine = None
+        self.pyttsx3_lock = threading.Lock()
+        
+        # Names of files already generated, so existence checks need no filesystem calls
+        self.scan_audio_files()
+        
         # Load all available voices
         self.available_voices = [
             "en-US-Chirp3-HD-Umbriel",
@@ -66,33 +210,45 @@ class AudioGenerator:
             "en-US-Chirp3-HD-Puck"
         ]
         
+        # Shared by all worker threads so together they stay within the API quota
+        self.limiter = RateLimiter(REQUESTS_PER_MINUTE)
+        
+        # One HTTP session for every request, so connections are kept alive and reused
+        self.session = create_session(HTTP_MAX_RETRIES, HTTP_RETRY_STATUS_CODES, MAX_CONCURRENT_REQUESTS)
+        
         # Initialize gcloud path
-        self.gcloud_path = self.find_gcloud()
+        self.gcloud_path = locate_gcloud()
+        
+        # Google Cloud project billed for TTS requests; looked up once, not per request
+        self.project_id = load_project_id()
+        if not self.project_id and self.gcloud_path:
+            self.project_id = read_gcloud_project(self.gcloud_path)
+        
+        # Request headers are the same for every synthesize call
+        self.tts_headers = {
+            "Content-Type": "application/json",
+            "X-Goog-User-Project": self.project_id
+        }
         
         # Test TTS availability
         self.test_tts_availability()
-    
-    def find_gcloud(self):
-        """Try to find gcloud in common locations"""
-        possible_paths = [
-            "gcloud",
-            r"C:\Program Files\Google\Cloud SDK\google-cloud-sdk\bin\gcloud.cmd",
-            r"C:\Program Files (x86)\Google\Cloud SDK\google-cloud-sdk\bin\gcloud.cmd",
-            os.path.expanduser("~/AppData/Local/Google/Cloud SDK/google-cloud-sdk/bin/gcloud.cmd"),
-            os.path.expanduser("~/google-cloud-sdk/bin/gcloud.cmd")
-        ]
         
-        for path in possible_paths:
-            try:
-                result = subprocess.run([path, '--version'], 
-                                      capture_output=True, text=True, timeout=10)
-                if result.returncode == 0:
-                    logger.info(f"Found gcloud at: {path}")
-                    return path
-            except:
-                continue
+        # Prefer the gRPC client for HD voices when google-cloud-texttospeech is installed
+        self.tts_client = self.tts_audio_config = None
+        if self.modern_google_available and self.google_cloud_available:
+            self.tts_client, self.tts_audio_config = create_grpc_client(self.project_id, AUDIO_ENCODING)
+    
+    def scan_audio_files(self):
+        """
+        Record the names of the files in the audio and cache folders.
         
-        return None
+        Generators add each file they write, so the sets stay current during a run;
+        call this again only if files are changed by another process.
+        """
+        with os.scandir(self.audio_folder) as entries:
+            self.existing_files = {entry.name for entry in entries if entry.is_file()}
+        with os.scandir(self.cache_folder) as entries:
+            self.cached_files = {entry.name for entry in entries if entry.is_file()}
     
     def load_selected_voice(self) -> str:
         """
@@ -103,8 +259,8 @@ class AudioGenerator:
         """
         try:
             if os.path.exists("selected_voice.json"):
-                with open("selected_voice.json", "r") as f:
-                    voice_data = json.load(f)
+                with open("selected_voice.json", "rb") as f:
+                    voice_data = orjson.loads(f.read()) if orjson else json.load(f)
                 
                 selected_voice_name = voice_data["voice_info"]["name"]
                 logger.info(f"Loaded selected voice: {selected_voice_name}")
@@ -127,46 +283,47 @@ class AudioGenerator:
         
         # Test modern Google TTS API
         try:
-            if self.gcloud_path:
-                logger.info("OK - Modern Google TTS API is available")
-                self.modern_google_available = True
-            else:
+            if not self.gcloud_path:
                 logger.warning("X - gcloud not found. Install Google Cloud SDK")
                 self.modern_google_available = False
+            elif not self.project_id:
+                logger.warning("X - No Google Cloud project configured. Set GOOGLE_CLOUD_PROJECT "
+                               "or run: gcloud config set project <PROJECT_ID>")
+                self.modern_google_available = False
+            else:
+                logger.info(f"OK - Modern Google TTS API is available (project: {self.project_id})")
+                self.modern_google_available = True
         except Exception as e:
             logger.warning(f"X - Error testing gcloud: {e}")
             self.modern_google_available = False
         
+        # The optional backends are only located here; each is imported by its
+        # generate_audio_* method the first time it is actually used
+        
         # Test gTTS (Google Text-to-Speech)
-        try:
-            from gtts import gTTS
+        self.gtts_available = is_module_available("gtts")
+        if self.gtts_available:
             logger.info("OK - gTTS (Google Text-to-Speech) is available")
-            self.gtts_available = True
-        except ImportError:
+        else:
             logger.warning("X - gTTS not available. Install with: pip install gTTS")
-            self.gtts_available = False
         
         # Test pyttsx3 (offline TTS)
-        try:
-            import pyttsx3
+        self.pyttsx3_available = is_module_available("pyttsx3")
+        if self.pyttsx3_available:
             logger.info("OK - pyttsx3 (offline TTS) is available")
-            self.pyttsx3_available = True
-        except ImportError:
+        else:
             logger.warning("X - pyttsx3 not available. Install with: pip install pyttsx3")
-            self.pyttsx3_available = False
         
         # Test Google Cloud TTS
-        try:
-            from google.cloud import texttospeech
+        self.google_cloud_available = is_module_available("google.cloud.texttospeech")
+        if self.google_cloud_available:
             logger.info("OK - Google Cloud TTS is available")
-            self.google_cloud_available = True
-        except ImportError:
+        else:
             logger.warning("X - Google Cloud TTS not available. Install with: pip install google-cloud-texttospeech")
-            self.google_cloud_available = False
         
         # Test internet connectivity
         try:
-            response = requests.get("https://www.google.com", timeout=5)
+            response = self.session.get("https://www.google.com", timeout=5)
             logger.info("OK - Internet connectivity available")
             self.internet_available = True
         except:
@@ -191,8 +348,9 @@ class AudioGenerator:
                         logger.info(f"  - {file}")
                 raise FileNotFoundError(f"Dictionary file not found: {self.json_file_path}")
             
-            with open(self.json_file_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so both are handled below
+            with open(self.json_file_path, 'rb') as file:
+                data = orjson.loads(file.read()) if orjson else json.load(file)
             
             logger.info(f"Successfully loaded dictionary from {self.json_file_path}")
             logger.info(f"Dictionary structure: {list(data.keys())}")
@@ -208,6 +366,25 @@ class AudioGenerator:
             logger.error(f"Unexpected error loading dictionary: {e}")
             raise
     
+    def iter_letters(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Read the dictionary one top-level letter entry at a time.
+        
+        Files up to WHOLE_FILE_LOAD_MAX_BYTES are loaded whole with load_dictionary;
+        larger files are parsed incrementally with ijson, so each letter can be
+        discarded once its words have been extracted.
+        
+        Yields:
+            Tuple[str, Any]: (letter, letter_data) pairs in file order
+        """
+        if not os.path.exists(self.json_file_path) or os.path.getsize(self.json_file_path) <= WHOLE_FILE_LOAD_MAX_BYTES:
+            yield from self.load_dictionary().items()
+            return
+        
+        logger.info(f"Streaming dictionary from {self.json_file_path} (ijson backend: {ijson.backend})")
+        with open(self.json_file_path, 'rb') as file:
+            yield from ijson.kvitems(file, '', use_float=True)
+    
     def extract_word_data(self, word_name: str, word_data: Dict[str, Any]) -> Dict[str, str]:
         """
         Extract the required fields from a word's data.
@@ -219,49 +396,45 @@ class AudioGenerator:
         Returns:
             Dict[str, str]: Extracted word data with required fields
         """
-        logger.debug(f"Extracting data for word: {word_name}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"Extracting data for word: {word_name}")
+        
+        # Definition and example come from the first meaning's first definition;
+        # a missing level anywhere along the way leaves both empty
+        try:
+            first_definition = word_data['meanings'][0]['definitions'][0]
+            definition = first_definition.get('definition', "")
+            example = first_definition.get('example', "")
+        except (KeyError, IndexError, TypeError):
+            definition = example = ""
         
         extracted_data = {
             "word": word_name,
-            "phonetic_respelling": "",
-            "ssml_phoneme": "",
-            "definition": "",
-            "example": ""
+            "phonetic_respelling": word_data.get('phonetic_respelling', ""),
+            "ssml_phoneme": word_data.get('ssml_phoneme', ""),
+            "definition": definition,
+            "example": example
         }
         
-        # Extract phonetic respelling
-        if 'phonetic_respelling' in word_data:
-            extracted_data['phonetic_respelling'] = word_data['phonetic_respelling']
+        # Format and slice the debug output only when it will actually be logged
+        if debug:
             logger.debug(f"Found phonetic respelling: {extracted_data['phonetic_respelling']}")
-        
-        # Extract SSML phoneme
-        if 'ssml_phoneme' in word_data:
-            extracted_data['ssml_phoneme'] = word_data['ssml_phoneme']
             logger.debug(f"Found SSML phoneme: {extracted_data['ssml_phoneme']}")
-        
-        # Extract definition and example from meanings
-        if 'meanings' in word_data and word_data['meanings']:
-            logger.debug(f"Found {len(word_data['meanings'])} meanings")
-            
-            # Get the first meaning's first definition
-            first_meaning = word_data['meanings'][0]
-            if 'definitions' in first_meaning and first_meaning['definitions']:
-                logger.debug(f"Found {len(first_meaning['definitions'])} definitions")
-                
-                first_definition = first_meaning['definitions'][0]
-                if 'definition' in first_definition:
-                    extracted_data['definition'] = first_definition['definition']
-                    logger.debug(f"Found definition: {extracted_data['definition'][:50]}...")
-                
-                if 'example' in first_definition:
-                    extracted_data['example'] = first_definition['example']
-                    logger.debug(f"Found example: {extracted_data['example'][:50]}...")
+            logger.debug(f"Found definition: {definition[:50]}...")
+            logger.debug(f"Found example: {example[:50]}...")
         
         # Log extraction results
         missing_fields = [field for field, value in extracted_data.items() if not value and field != 'word']
         if missing_fields:
             logger.warning(f"Missing fields for {word_name}: {missing_fields}")
         
+        # Build the TTS texts once per word; every voice reuses them
+        extracted_data['tts_text_example'] = self.create_text_for_tts(extracted_data)
+        extracted_data['tts_text_pronunciation'] = f"..{word_name}.."
+        #if extracted_data['phonetic_respelling']:
+            # extracted_data['tts_text_pronunciation'] += f" It's pronounced {extracted_data['phonetic_respelling']}."
+        
         return extracted_data
     
     def create_text_for_tts(self, word_data: Dict[str, str]) -> str:
@@ -290,9 +463,135 @@ class AudioGenerator:
         if example:
             text += f" Example: {example}"
         
-        logger.debug(f"Generated TTS text for {word}: {text[:100]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Generated TTS text for {word}: {text[:100]}...")
         return text
     
+    def synthesis_lock(self, cache_name: str) -> threading.Lock:
+        """
+        Get the lock guarding synthesis of one audio cache entry.
+        
+        Args:
+            cache_name (str): Cache file name of the request
+            
+        Returns:
+            threading.Lock: The lock shared by every thread requesting the same audio
+        """
+        # Cache names start with a hex digest, so its leading digits spread entries evenly
+        return self.synthesis_locks[int(cache_name[:8], 16) % SYNTHESIS_LOCK_STRIPES]
+    
+    def synthesize_grpc(self, text: str, voice_name: str) -> bytes:
+        """
+        Synthesize speech with the gRPC Text-to-Speech client.
+        
+        Args:
+            text (str): Text to synthesize
+            voice_name (str): The voice to use for generation
+            
+        Returns:
+            bytes: The audio content
+        """
+        from google.api_core.exceptions import ResourceExhausted
+        from google.cloud import texttospeech
+        
+        synthesis_input = texttospeech.SynthesisInput(text=text)
+        voice = texttospeech.VoiceSelectionParams(language_code="en-US", name=voice_name)
+        
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            # Wait for a free slot in the shared per-minute quota
+            self.limiter.acquire()
+            try:
+                response = self.tts_client.synthesize_speech(
+                    input=synthesis_input,
+                    voice=voice,
+                    audio_config=self.tts_audio_config,
+                    timeout=30
+                )
+                return response.audio_content
+            except ResourceExhausted:
+                if attempt == MAX_RATE_LIMIT_RETRIES:
+                    raise
+                # Quota exceeded: hold back every worker, not just this one, then retry
+                logger.warning(f"TTS quota exceeded, pausing requests for {RATE_LIMIT_DELAY_SECONDS}s")
+                self.limiter.pause(RATE_LIMIT_DELAY_SECONDS)
+    
+    def synthesize_rest(self, text: str, voice_name: str, out) -> bool:
+        """
+        Synthesize speech with the Text-to-Speech REST API, streaming the decoded
+        audio into an open file.
+        
+        Args:
+            text (str): Text to synthesize
+            voice_name (str): The voice to use for generation
+            out: Binary file the audio is written to
+            
+        Returns:
+            bool: True if the audio was written, False if the request failed
+        """
+        # Only the text and voice change between requests
+        payload = {
+            "input": {"text": text},
+            "voice": {"languageCode": "en-US", "name": voice_name},
+            "audioConfig": TTS_AUDIO_CONFIG
+        }
+        body = orjson.dumps(payload) if orjson else json.dumps(payload).encode("utf-8")
+        
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            # Wait for a free slot in the shared per-minute quota
+            self.limiter.acquire()
+            with self.session.post(
+                TTS_SYNTHESIZE_URL,
+                headers=self.tts_headers,
+                data=body,
+                timeout=30,
+                stream=True
+            ) as response:
+                if response.status_code == 200:
+                    # Decode the audio content as it arrives
+                    stream_audio_content(response.iter_content(chunk_size=AUDIO_STREAM_CHUNK_BYTES), out)
+                    return True
+                if response.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                    logger.error(f"API request failed: {response.status_code} - {response.text}")
+                    return False
+                
+                # Quota exceeded: hold back every worker, not just this one, then retry
+                retry_after = get_retry_after(response) or RATE_LIMIT_DELAY_SECONDS
+            logger.warning(f"TTS quota exceeded, pausing requests for {retry_after}s")
+            self.limiter.pause(retry_after)
+        return False
+    
+    @staticmethod
+    def audio_filename(word_name: str, voice_name: str, audio_type: str) -> str:
+        """
+        Build the file name of one HD voice audio file.
+        
+        Args:
+            word_name (str): The name of the word
+            voice_name (str): The voice used for generation
+            audio_type (str): Type of audio ("example" or "pronunciation")
+            
+        Returns:
+            str: File name inside the audio folder
+        """
+        voice_short_name = voice_name.split('-')[-1]
+        return f"{word_name}-{AUDIO_FILE_LABELS[audio_type]}-{voice_short_name}.mp3"
+    
+    def is_word_complete(self, word_name: str) -> bool:
+        """
+        Check whether every voice's audio files for a word already exist.
+        
+        Args:
+            word_name (str): The name of the word
+            
+        Returns:
+            bool: True if nothing is left to generate for the word
+        """
+        return all(
+            self.audio_filename(word_name, voice_name, audio_type) in self.existing_files
+            for voice_name in self.available_voices
+            for audio_type in AUDIO_FILE_LABELS
+        )
+    
     def generate_audio_modern_google(self, word_data: Dict[str, str], voice_name: str, audio_type: str = "example") -> bool:
         """
         Generate MP3 audio file using modern Google TTS API with HD voice.
@@ -307,79 +606,50 @@ class AudioGenerator:
         """
         try:
             word_name = word_data['word']
-            voice_short_name = voice_name.split('-')[-1]
             
             # Create appropriate filename based on audio type
-            if audio_type == "pronunciation":
-                filename = f"{word_name}-pronunciation-{voice_short_name}.mp3"
-            else:
-                filename = f"{word_name}-example_and_sample-{voice_short_name}.mp3"
-            
+            filename = self.audio_filename(word_name, voice_name, audio_type)
             filepath = os.path.join(self.audio_folder, filename)
             
             # Check if file already exists
-            if os.path.exists(filepath):
-                logger.info(f"Audio file already exists: {filename}")
+            if filename in self.existing_files:
+                logger.debug("Audio file already exists: %s", filename)
                 return True
             
-            # Create text for TTS based on audio type
-            if audio_type == "pronunciation":
-                text = f"..{word_name}.."
-                #if word_data['phonetic_respelling']:
-                   # text += f" It's pronounced {word_data['phonetic_respelling']}."
-            else:
-                text = self.create_text_for_tts(word_data)
-            
-            # Get project ID
-            project_result = subprocess.run([self.gcloud_path, 'config', 'list', '--format=value(core.project)'], 
-                                          capture_output=True, text=True, timeout=10)
-            if project_result.returncode != 0:
-                logger.error("Failed to get project ID")
-                return False
-            
-            project_id = os.environ.get("GOOGLE_CLOUD_PROJECT")
-            
-            # Prepare the request payload
-            payload = {
-                "input": {
-                    "text": text
-                },
-                "voice": {
-                    "languageCode": "en-US",
-                    "name": voice_name,
-                    "voiceClone": {}
-                },
-                "audioConfig": {
-                    "audioEncoding": "MP3"
-                }
-            }
+            # TTS text for this audio type, prepared by extract_word_data
+            text = word_data[f"tts_text_{audio_type}"]
             
-            # Make the API request
-            headers = {
-                "Content-Type": "application/json",
-                "X-Goog-User-Project": project_id
-            }
+            # Reuse audio already synthesized for the same text and voice; a worker that
+            # finds the same request in flight on another thread waits for its result
+            cache_name = cache_key(text, voice_name, AUDIO_ENCODING) + ".mp3"
+            cache_path = os.path.join(self.cache_folder, cache_name)
+            with self.synthesis_lock(cache_name):
+                reused = cache_name in self.cached_files
+                if not reused:
+                    # Make the API request, saving the audio in the cache first (write to a
+                    # temp file, then rename, so an interrupted write never leaves a
+                    # truncated cache entry)
+                    temp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+                    try:
+                        with open(temp_path, "wb") as out:
+                            if self.tts_client is not None:
+                                out.write(self.synthesize_grpc(text, voice_name))
+                            elif not self.synthesize_rest(text, voice_name, out):
+                                return False
+                        os.replace(temp_path, cache_path)
+                    finally:
+                        if os.path.exists(temp_path):
+                            os.remove(temp_path)
+                    self.cached_files.add(cache_name)
             
-            response = requests.post(
-                "https://texttospeech.googleapis.com/v1/text:synthesize",
-                headers=headers,
-                json=payload,
-                timeout=30
-            )
+            link_cached_audio(cache_path, filepath)
+            self.existing_files.add(filename)
             
-            if response.status_code == 200:
-                # Decode the audio content
-                audio_content = base64.b64decode(response.json()['audioContent'])
-                
-                # Save the audio file
-                with open(filepath, "wb") as out:
-                    out.write(audio_content)
-                
-                logger.info(f"Generated audio file using Modern Google TTS HD: {filename}")
-                return True
+            if reused:
+                logger.debug("Reused cached audio for: %s", filename)
             else:
-                logger.error(f"API request failed: {response.status_code} - {response.text}")
-                return False
+                logger.info(f"Generated audio file using Modern Google TTS HD: {filename}")
+            return True
             
         except Exception as e:
             logger.error(f"Error generating audio with Modern Google TTS for {word_data['word']}: {e}")
@@ -403,16 +673,17 @@ class AudioGenerator:
             filepath = os.path.join(self.audio_folder, filename)
             
             # Check if file already exists
-            if os.path.exists(filepath):
-                logger.info(f"Audio file already exists: {filename}")
+            if filename in self.existing_files:
+                logger.debug("Audio file already exists: %s", filename)
                 return True
             
-            # Create text for TTS
-            text = self.create_text_for_tts(word_data)
+            # TTS text prepared by extract_word_data
+            text = word_data['tts_text_example']
             
             # Generate audio using gTTS
             tts = gTTS(text=text, lang='en', slow=False)
             tts.save(filepath)
+            self.existing_files.add(filename)
             
             logger.info(f"Generated audio file using gTTS: {filename}")
             return True
@@ -421,6 +692,25 @@ class AudioGenerator:
             logger.error(f"Error generating audio with gTTS for {word_data['word']}: {e}")
             return False
     
+    def get_pyttsx3_engine(self):
+        """
+        Get the shared pyttsx3 engine, initializing it on first use.
+        
+        Starting the speech driver is slow, so one engine is reused for every file.
+        
+        Returns:
+            pyttsx3.Engine: The configured engine
+        """
+        if self.pyttsx3_engine is None:
+            import pyttsx3
+            
+            # Initialize pyttsx3
+            engine = pyttsx3.init()
+            engine.setProperty('rate', 150)  # Speed of speech
+            engine.setProperty('volume', 0.9)  # Volume level
+            self.pyttsx3_engine = engine
+        return self.pyttsx3_engine
+    
     def generate_audio_pyttsx3(self, word_data: Dict[str, str]) -> bool:
         """
         Generate MP3 audio file using pyttsx3 (offline TTS).
@@ -432,28 +722,33 @@ class AudioGenerator:
             bool: True if successful, False otherwise
         """
         try:
-            import pyttsx3
-            
             word_name = word_data['word']
             filename = f"{word_name}_example.mp3"
             filepath = os.path.join(self.audio_folder, filename)
             
             # Check if file already exists
-            if os.path.exists(filepath):
-                logger.info(f"Audio file already exists: {filename}")
+            if filename in self.existing_files:
+                logger.debug("Audio file already exists: %s", filename)
                 return True
             
-            # Create text for TTS
-            text = self.create_text_for_tts(word_data)
+            # TTS text prepared by extract_word_data
+            text = word_data['tts_text_example']
             
-            # Initialize pyttsx3
-            engine = pyttsx3.init()
-            engine.setProperty('rate', 150)  # Speed of speech
-            engine.setProperty('volume', 0.9)  # Volume level
-            
-            # Save to file
-            engine.save_to_file(text, filepath)
-            engine.runAndWait()
+            # The engine is not thread-safe, so only one file is generated at a time
+            with self.pyttsx3_lock:
+                for attempt in range(2):
+                    engine = self.get_pyttsx3_engine()
+                    try:
+                        # Save to file
+                        engine.save_to_file(text, filepath)
+                        engine.runAndWait()
+                        break
+                    except Exception:
+                        # Discard the failed engine and retry once with a fresh one
+                        self.pyttsx3_engine = None
+                        if attempt:
+                            raise
+            self.existing_files.add(filename)
             
             logger.info(f"Generated audio file using pyttsx3: {filename}")
             return True
@@ -481,11 +776,11 @@ class AudioGenerator:
                 "pronunciation": False
             }
             
-            logger.info(f"Generating audio for word '{word_data['word']}' using voice '{voice_name}'")
+            logger.debug("Generating audio for word '%s' using voice '%s'", word_data['word'], voice_name)
             
             # Try Modern Google TTS API first (HD voice)
             if self.modern_google_available:
-                logger.debug(f"Attempting Modern Google TTS HD for {word_data['word']} with {voice_name}")
+                logger.debug("Attempting Modern Google TTS HD for %s with %s", word_data['word'], voice_name)
                 
                 # Generate example audio
                 if self.generate_audio_modern_google(word_data, voice_name, "example"):
@@ -494,9 +789,6 @@ class AudioGenerator:
                 # Generate pronunciation audio
                 if self.generate_audio_modern_google(word_data, voice_name, "pronunciation"):
                     results[voice_name]["pronunciation"] = True
-                
-                # Add delay between requests
-                time.sleep(1)
         
         return results
     
@@ -573,12 +865,12 @@ class AudioGenerator:
             filepath = os.path.join(self.audio_folder, filename)
             
             # Check if file already exists
-            if os.path.exists(filepath):
-                logger.info(f"Audio file already exists: {filename}")
+            if filename in self.existing_files:
+                logger.debug("Audio file already exists: %s", filename)
                 return True
             
-            # Create text for TTS
-            text = self.create_text_for_tts(word_data)
+            # TTS text prepared by extract_word_data
+            text = word_data['tts_text_example']
             
             # Initialize client
             client = texttospeech.TextToSpeechClient()
@@ -610,6 +902,7 @@ class AudioGenerator:
             # Save the audio file
             with open(filepath, "wb") as out:
                 out.write(response.audio_content)
+            self.existing_files.add(filename)
             
             logger.info(f"Generated audio file using Google Cloud TTS: {filename}")
             return True
@@ -618,6 +911,86 @@ class AudioGenerator:
             logger.error(f"Error generating audio with Google Cloud TTS for {word_data['word']}: {e}")
             return False
     
+    def build_word_jobs(self, letters: Iterator[Tuple[str, Any]], stats: Dict[str, Any]) -> List[WordJob]:
+        """
+        Extract every word with enough data for audio into a flat list of jobs.
+        
+        Words missing a definition or example are skipped here, and words whose files
+        all exist from an earlier run are counted as done, so workers only receive
+        words with audio left to synthesize.
+        
+        Args:
+            letters (Iterator[Tuple[str, Any]]): (letter, letter_data) pairs from iter_letters
+            stats (Dict[str, Any]): Processing statistics; total, skipped, failed and already
+                generated words are counted
+            
+        Returns:
+            List[WordJob]: One job per word to generate audio for
+        """
+        jobs = []
+        already_generated = 0
+        
+        # Process each letter
+        for letter, letter_data in letters:
+            if isinstance(letter_data, dict) and 'words' in letter_data:
+                words = letter_data['words']
+                logger.info(f"Processing letter {letter} with {len(words)} words")
+                
+                for word_name, word_data in words.items():
+                    stats["total_words"] += 1
+                    
+                    try:
+                        # Extract word data
+                        extracted_data = self.extract_word_data(word_name, word_data)
+                    except Exception as e:
+                        logger.error(f"Error processing word {word_name}: {e}")
+                        stats["failed_generations"] += 1
+                        continue
+                    
+                    # Check if we have enough data to generate audio
+                    if not extracted_data['definition'] or not extracted_data['example']:
+                        logger.warning(f"Skipping {word_name}: Missing definition or example")
+                        stats["skipped_words"] += 1
+                        continue
+                    
+                    # Resuming: a word finished in an earlier run needs no worker at all
+                    if self.is_word_complete(word_name):
+                        already_generated += 1
+                        stats["successful_examples"] += len(self.available_voices)
+                        stats["successful_pronunciations"] += len(self.available_voices)
+                        continue
+                    
+                    jobs.append(WordJob(word_name, extracted_data))
+        
+        if already_generated:
+            logger.info(f"Resuming: {already_generated} words already have all audio files")
+        
+        return jobs
+    
+    def count_results(self, audio_results: Dict[str, Dict[str, bool]]) -> Counter:
+        """
+        Count the files generated for one word.
+        
+        Args:
+            audio_results (Dict[str, Dict[str, bool]]): Results for each voice and audio type
+            
+        Returns:
+            Counter: successful_examples, successful_pronunciations and failed_generations counts
+        """
+        counts = Counter()
+        
+        # Count successful generations for all voices
+        for voice_results in audio_results.values():
+            counts["successful_examples"] += voice_results["example"]
+            counts["successful_pronunciations"] += voice_results["pronunciation"]
+        
+        # Check if any generation failed
+        total_expected = len(self.available_voices) * 2  # 2 files per voice
+        if counts["successful_examples"] + counts["successful_pronunciations"] < total_expected:
+            counts["failed_generations"] += 1
+        
+        return counts
+    
     def process_all_words(self) -> Dict[str, Any]:
         """
         Process all words in the dictionary and generate audio files.
@@ -627,8 +1000,8 @@ class AudioGenerator:
         """
         logger.info("Starting audio generation process...")
         
-        # Load dictionary
-        dictionary_data = self.load_dictionary()
+        # Pick up files added since the generator was created
+        self.scan_audio_files()
         
         stats = {
             "total_words": 0,
@@ -642,53 +1015,29 @@ class AudioGenerator:
         
         start_time = time.time()
         
-        # Process each letter
-        for letter, letter_data in dictionary_data.items():
-            if isinstance(letter_data, dict) and 'words' in letter_data:
-                words = letter_data['words']
-                logger.info(f"Processing letter {letter} with {len(words)} words")
+        # Read the dictionary and keep only the fields needed for audio
+        jobs = self.build_word_jobs(self.iter_letters(), stats)
+        
+        # Worker threads synthesize several words at once while sharing one rate limit,
+        # so there is no fixed delay between words
+        totals = Counter()
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            futures = {executor.submit(self.generate_audio_for_all_voices, job.word_data): job
+                       for job in jobs}
+            
+            # Count results on the main thread as words finish
+            for finished, future in enumerate(as_completed(futures), 1):
+                try:
+                    totals.update(self.count_results(future.result()))
+                except Exception as e:
+                    logger.error(f"Error processing word {futures[future].word_name}: {e}")
+                    totals["failed_generations"] += 1
                 
-                for word_name, word_data in words.items():
-                    stats["total_words"] += 1
-                    
-                    try:
-                        logger.info(f"Processing word {stats['total_words']}: {word_name}")
-                        
-                        # Extract word data
-                        extracted_data = self.extract_word_data(word_name, word_data)
-                        
-                        # Check if we have enough data to generate audio
-                        if not extracted_data['definition'] or not extracted_data['example']:
-                            logger.warning(f"Skipping {word_name}: Missing definition or example")
-                            stats["skipped_words"] += 1
-                            continue
-                        
-                        # Generate audio for all voices
-                        audio_results = self.generate_audio_for_all_voices(extracted_data)
-                        
-                        # Count successful generations for all voices
-                        for voice_name, voice_results in audio_results.items():
-                            if voice_results["example"]:
-                                stats["successful_examples"] += 1
-                            if voice_results["pronunciation"]:
-                                stats["successful_pronunciations"] += 1
-                        
-                        # Check if any generation failed
-                        total_expected = len(self.available_voices) * 2  # 2 files per voice
-                        total_generated = sum(
-                            sum(1 for result in voice_results.values() if result)
-                            for voice_results in audio_results.values()
-                        )
-                        
-                        if total_generated < total_expected:
-                            stats["failed_generations"] += 1
-                        
-                        # Add delay to avoid rate limiting
-                        time.sleep(2)
-                        
-                    except Exception as e:
-                        logger.error(f"Error processing word {word_name}: {e}")
-                        stats["failed_generations"] += 1
+                if finished % PROGRESS_LOG_INTERVAL == 0 or finished == len(futures):
+                    logger.info("Processed %d/%d words", finished, len(futures))
+        
+        for key, count in totals.items():
+            stats[key] += count
         
         stats["processing_time"] = time.time() - start_time
         
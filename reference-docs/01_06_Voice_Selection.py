@@ -13,19 +13,18 @@ import json
 import os
 import logging
 import time
-import requests
-import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Any
-import base64
+from tts_client import MAX_CONCURRENT_REQUESTS, get_tts_client
 
-# Setup logging
+# Setup logging (set VOICE_SELECTOR_LOG=off to log to the console only, without a log file)
+log_handlers = [logging.StreamHandler()]
+if os.environ.get("VOICE_SELECTOR_LOG", "").lower() != "off":
+    log_handlers.insert(0, logging.FileHandler('voice_selection.log', encoding='utf-8'))
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('voice_selection.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
+    handlers=log_handlers
 )
 logger = logging.getLogger(__name__)
 
@@ -36,10 +35,17 @@ class VoiceSelector:
         """
         self.voice_samples_folder = "voice_samples"
         
-        # Create voice samples folder if it doesn't exist
-        if not os.path.exists(self.voice_samples_folder):
+        # Text-to-Speech session, project and sample cache, shared with the other voice
+        # sample script when both run in one process
+        self.client = get_tts_client()
+        
+        # Create voice samples folder if it doesn't exist (a single mkdir, with no separate
+        # existence check that could race another process creating it)
+        try:
             os.makedirs(self.voice_samples_folder)
-            logger.info(f"Created voice samples folder: {self.voice_samples_folder}")
+            logger.info("Created voice samples folder: %s", self.voice_samples_folder)
+        except FileExistsError:
+            pass
         
         # Recommended US English Male Chirp3 voices
         self.recommended_voices = {
@@ -72,29 +78,30 @@ class VoiceSelector:
         
         # Test text for voice samples
         self.sample_text = "Hello! I'm a sample of this voice. I can pronounce words clearly and help you learn English vocabulary. This voice is designed to be natural and easy to understand."
+        
+        # Accepted answers to the voice selection prompt
+        self.valid_choices = frozenset(str(voice_number) for voice_number in self.recommended_voices)
+        
+        # Short name, sample filename and path of each voice, worked out once
+        self.voice_meta = {}
+        for voice_number, voice_info in self.recommended_voices.items():
+            short_name = voice_info['name'].rsplit('-', 1)[-1]
+            filename = f"voice_sample_{voice_number}_{short_name}.mp3"
+            self.voice_meta[voice_number] = {
+                **voice_info,
+                "short": short_name,
+                "filename": filename,
+                "filepath": os.path.join(self.voice_samples_folder, filename)
+            }
     
     def test_gcloud_availability(self) -> bool:
         """
-        Test if gcloud is available and configured.
+        Test if gcloud is available and configured, and resolve the project ID.
         
         Returns:
             bool: True if gcloud is available, False otherwise
         """
-        try:
-            result = subprocess.run(['gcloud', 'config', 'list'], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                logger.info("OK - gcloud is available and configured")
-                return True
-            else:
-                logger.error("X - gcloud not configured. Run: gcloud auth login")
-                return False
-        except FileNotFoundError:
-            logger.error("X - gcloud not installed. Install Google Cloud SDK")
-            return False
-        except Exception as e:
-            logger.error(f"X - Error testing gcloud: {e}")
-            return False
+        return self.client.test_gcloud_availability()
     
     def generate_voice_sample(self, voice_name: str, voice_number: int) -> bool:
         """
@@ -108,67 +115,23 @@ class VoiceSelector:
             bool: True if successful, False otherwise
         """
         try:
-            filename = f"voice_sample_{voice_number}_{voice_name.split('-')[-1]}.mp3"
-            filepath = os.path.join(self.voice_samples_folder, filename)
+            filename = self.voice_meta[voice_number]["filename"]
+            filepath = self.voice_meta[voice_number]["filepath"]
             
             # Check if file already exists
             if os.path.exists(filepath):
-                logger.info(f"Voice sample already exists: {filename}")
+                logger.info("Voice sample already exists: %s", filename)
                 return True
             
-            # Get project ID
-            project_result = subprocess.run(['gcloud', 'config', 'list', '--format=value(core.project)'], 
-                                          capture_output=True, text=True, timeout=10)
-            if project_result.returncode != 0:
-                logger.error("Failed to get project ID")
+            # Request the audio, or take it from the sample cache
+            if not self.client.synthesize(voice_name, self.sample_text, filepath):
                 return False
             
-            project_id = os.environ.get("GOOGLE_CLOUD_PROJECT")
-            
-            # Prepare the request payload
-            payload = {
-                "input": {
-                    "text": self.sample_text
-                },
-                "voice": {
-                    "languageCode": "en-US",
-                    "name": voice_name,
-                    "voiceClone": {}
-                },
-                "audioConfig": {
-                    "audioEncoding": "MP3"
-                }
-            }
-            
-            # Make the API request
-            headers = {
-                "Content-Type": "application/json",
-                "X-Goog-User-Project": project_id
-            }
-            
-            response = requests.post(
-                "https://texttospeech.googleapis.com/v1/text:synthesize",
-                headers=headers,
-                json=payload,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                # Decode the audio content
-                audio_content = base64.b64decode(response.json()['audioContent'])
-                
-                # Save the audio file
-                with open(filepath, "wb") as out:
-                    out.write(audio_content)
-                
-                logger.info(f"Generated voice sample: {filename}")
-                return True
-            else:
-                logger.error(f"API request failed for {voice_name}: {response.status_code} - {response.text}")
-                return False
+            logger.info("Generated voice sample: %s", filename)
+            return True
             
         except Exception as e:
-            logger.error(f"Error generating voice sample for {voice_name}: {e}")
+            logger.error("Error generating voice sample for %s: %s", voice_name, e)
             return False
     
     def generate_all_samples(self) -> Dict[str, Any]:
@@ -189,21 +152,37 @@ class VoiceSelector:
         
         start_time = time.time()
         
-        for voice_number, voice_info in self.recommended_voices.items():
-            logger.info(f"Generating sample for Voice {voice_number}: {voice_info['name']}")
-            
-            if self.generate_voice_sample(voice_info['name'], voice_number):
-                stats["successful_samples"] += 1
-            else:
-                stats["failed_samples"] += 1
+        # Request every voice at once; the samples are independent, so the total time is
+        # that of the slowest request rather than the sum of all of them
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            futures = []
+            for voice_number, voice_info in self.recommended_voices.items():
+                logger.info("Generating sample for Voice %s: %s", voice_number, voice_info['name'])
+                futures.append(executor.submit(self.generate_voice_sample, voice_info['name'], voice_number))
             
-            # Add delay between requests
-            time.sleep(2)
+            for future in as_completed(futures):
+                if future.result():
+                    stats["successful_samples"] += 1
+                else:
+                    stats["failed_samples"] += 1
         
         stats["processing_time"] = time.time() - start_time
         
         return stats
     
+    def scan_voice_samples(self) -> Dict[str, int]:
+        """
+        List the voice samples folder once.
+        
+        Returns:
+            Dict[str, int]: Size in bytes of each file in the folder, by filename
+        """
+        try:
+            with os.scandir(self.voice_samples_folder) as entries:
+                return {entry.name: entry.stat().st_size for entry in entries if entry.is_file()}
+        except OSError:
+            return {}
+    
     def display_voice_options(self):
         """
         Display all voice options with descriptions.
@@ -212,14 +191,15 @@ class VoiceSelector:
         print("US ENGLISH MALE CHIRP3 VOICE OPTIONS")
         print("="*80)
         
-        for voice_number, voice_info in self.recommended_voices.items():
-            print(f"\n{voice_number}. {voice_info['name']}")
-            print(f"   Description: {voice_info['description']}")
-            print(f"   Characteristics: {voice_info['characteristics']}")
-            if os.path.exists(os.path.join(self.voice_samples_folder, f"voice_sample_{voice_number}_{voice_info['name'].split('-')[-1]}.mp3")):
-                print(f"   Sample File: voice_samples/voice_sample_{voice_number}_{voice_info['name'].split('-')[-1]}.mp3 (Available)")
+        existing_files = self.scan_voice_samples()
+        for voice_number, meta in self.voice_meta.items():
+            print(f"\n{voice_number}. {meta['name']}")
+            print(f"   Description: {meta['description']}")
+            print(f"   Characteristics: {meta['characteristics']}")
+            if meta["filename"] in existing_files:
+                print(f"   Sample File: voice_samples/{meta['filename']} (Available)")
             else:
-                print(f"   Sample File: voice_samples/voice_sample_{voice_number}_{voice_info['name'].split('-')[-1]}.mp3 (Not generated)")
+                print(f"   Sample File: voice_samples/{meta['filename']} (Not generated)")
         
         print("\n" + "="*80)
         print("INSTRUCTIONS:")
@@ -239,18 +219,18 @@ class VoiceSelector:
         while True:
             try:
                 selection = input("\nEnter your voice choice (1-5): ").strip()
-                voice_number = int(selection)
                 
-                if voice_number in self.recommended_voices:
+                if selection in self.valid_choices:
+                    voice_number = int(selection)
                     selected_voice = self.recommended_voices[voice_number]
                     print(f"\nOK - You selected: {selected_voice['name']}")
                     print(f"   Description: {selected_voice['description']}")
                     return voice_number
-                else:
+                elif selection.lstrip('+-').isdigit():
                     print("X - Invalid choice. Please enter a number between 1 and 5.")
+                else:
+                    print("X - Invalid input. Please enter a number between 1 and 5.")
                     
-            except ValueError:
-                print("X - Invalid input. Please enter a number between 1 and 5.")
             except KeyboardInterrupt:
                 print("\n\nExiting...")
                 exit(0)
@@ -330,7 +310,7 @@ def main():
         logger.info("Voice selection process completed successfully")
         
     except Exception as e:
-        logger.error(f"Error in main process: {e}")
+        logger.error("Error in main process: %s", e)
         raise
 
 if __name__ == "__main__":
@@ -13,19 +13,18 @@ import json
 import os
 import logging
 import time
-import requests
-import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Any
-import base64
+from tts_client import MAX_CONCURRENT_REQUESTS, get_tts_client
 
-# Setup logging
+# Setup logging (set VOICE_SELECTOR_LOG=off to log to the console only, without a log file)
+log_handlers = [logging.StreamHandler()]
+if os.environ.get("VOICE_SELECTOR_LOG", "").lower() != "off":
+    log_handlers.insert(0, logging.FileHandler('voice_samples_download.log', encoding='utf-8'))
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('voice_samples_download.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
+    handlers=log_handlers
 )
 logger = logging.getLogger(__name__)
 
@@ -36,10 +35,17 @@ class VoiceSampleDownloader:
         """
         self.voice_samples_folder = "voice_samples"
         
-        # Create voice samples folder if it doesn't exist
-        if not os.path.exists(self.voice_samples_folder):
+        # Text-to-Speech session, project and sample cache, shared with the other voice
+        # sample script when both run in one process
+        self.client = get_tts_client()
+        
+        # Create voice samples folder if it doesn't exist (a single mkdir, with no separate
+        # existence check that could race another process creating it)
+        try:
             os.makedirs(self.voice_samples_folder)
-            logger.info(f"Created voice samples folder: {self.voice_samples_folder}")
+            logger.info("Created voice samples folder: %s", self.voice_samples_folder)
+        except FileExistsError:
+            pass
         
         # Recommended US English Chirp3 voices (newer HD models)
         self.recommended_voices = {
@@ -89,54 +95,27 @@ class VoiceSampleDownloader:
         
         # Custom test text
         self.sample_text = "Hello World, I am Vijay. Nice to Meet you. \"Abase\" is pronounced as \"uh-BAYS\". \"Aberration\" is pronounced as \"ab-uh-RAY-shun\". \"Affidavit\" is pronounced as \"af-uh-DAY-vit\"."
-    
-    def find_gcloud(self):
-        """Try to find gcloud in common locations"""
-        possible_paths = [
-            "gcloud",
-            r"C:\Program Files\Google\Cloud SDK\google-cloud-sdk\bin\gcloud.cmd",
-            r"C:\Program Files (x86)\Google\Cloud SDK\google-cloud-sdk\bin\gcloud.cmd",
-            os.path.expanduser("~/AppData/Local/Google/Cloud SDK/google-cloud-sdk/bin/gcloud.cmd"),
-            os.path.expanduser("~/google-cloud-sdk/bin/gcloud.cmd")
-        ]
         
-        for path in possible_paths:
-            try:
-                result = subprocess.run([path, '--version'], 
-                                      capture_output=True, text=True, timeout=10)
-                if result.returncode == 0:
-                    logger.info(f"Found gcloud at: {path}")
-                    return path
-            except:
-                continue
-        
-        return None
+        # Short name, sample filename and path of each voice, worked out once
+        self.voice_meta = {}
+        for voice_number, voice_info in self.recommended_voices.items():
+            short_name = voice_info['name'].rsplit('-', 1)[-1]
+            filename = f"voice_sample_{voice_number}_{short_name}_vijay.mp3"
+            self.voice_meta[voice_number] = {
+                **voice_info,
+                "short": short_name,
+                "filename": filename,
+                "filepath": os.path.join(self.voice_samples_folder, filename)
+            }
     
     def test_gcloud_availability(self) -> bool:
         """
-        Test if gcloud is available and configured.
+        Test if gcloud is available and configured, and resolve the project ID.
         
         Returns:
             bool: True if gcloud is available, False otherwise
         """
-        gcloud_path = self.find_gcloud()
-        if not gcloud_path:
-            logger.error("X - gcloud not found in common locations")
-            return False
-        
-        try:
-            result = subprocess.run([gcloud_path, 'config', 'list'], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                logger.info("OK - gcloud is available and configured")
-                self.gcloud_path = gcloud_path
-                return True
-            else:
-                logger.error("X - gcloud not configured. Run: gcloud auth login")
-                return False
-        except Exception as e:
-            logger.error(f"X - Error testing gcloud: {e}")
-            return False
+        return self.client.test_gcloud_availability()
     
     def download_voice_sample(self, voice_name: str, voice_number: int) -> bool:
         """
@@ -150,67 +129,23 @@ class VoiceSampleDownloader:
             bool: True if successful, False otherwise
         """
         try:
-            filename = f"voice_sample_{voice_number}_{voice_name.split('-')[-1]}_vijay.mp3"
-            filepath = os.path.join(self.voice_samples_folder, filename)
+            filename = self.voice_meta[voice_number]["filename"]
+            filepath = self.voice_meta[voice_number]["filepath"]
             
             # Check if file already exists
             if os.path.exists(filepath):
-                logger.info(f"Voice sample already exists: {filename}")
+                logger.info("Voice sample already exists: %s", filename)
                 return True
             
-            # Get project ID
-            project_result = subprocess.run([self.gcloud_path, 'config', 'list', '--format=value(core.project)'], 
-                                          capture_output=True, text=True, timeout=10)
-            if project_result.returncode != 0:
-                logger.error("Failed to get project ID")
+            # Request the audio, or take it from the sample cache
+            if not self.client.synthesize(voice_name, self.sample_text, filepath):
                 return False
             
-            project_id = os.environ.get("GOOGLE_CLOUD_PROJECT")
-            
-            # Prepare the request payload
-            payload = {
-                "input": {
-                    "text": self.sample_text
-                },
-                "voice": {
-                    "languageCode": "en-US",
-                    "name": voice_name,
-                    "voiceClone": {}
-                },
-                "audioConfig": {
-                    "audioEncoding": "MP3"
-                }
-            }
-            
-            # Make the API request
-            headers = {
-                "Content-Type": "application/json",
-                "X-Goog-User-Project": project_id
-            }
-            
-            response = requests.post(
-                "https://texttospeech.googleapis.com/v1/text:synthesize",
-                headers=headers,
-                json=payload,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                # Decode the audio content
-                audio_content = base64.b64decode(response.json()['audioContent'])
-                
-                # Save the audio file
-                with open(filepath, "wb") as out:
-                    out.write(audio_content)
-                
-                logger.info(f"Downloaded voice sample: {filename}")
-                return True
-            else:
-                logger.error(f"API request failed for {voice_name}: {response.status_code} - {response.text}")
-                return False
+            logger.info("Downloaded voice sample: %s", filename)
+            return True
             
         except Exception as e:
-            logger.error(f"Error downloading voice sample for {voice_name}: {e}")
+            logger.error("Error downloading voice sample for %s: %s", voice_name, e)
             return False
     
     def download_all_samples(self) -> Dict[str, Any]:
@@ -221,7 +156,7 @@ class VoiceSampleDownloader:
             Dict[str, Any]: Statistics about the download process
         """
         logger.info("Downloading voice samples for all recommended US English Chirp3 HD voices...")
-        logger.info(f"Sample text: '{self.sample_text}'")
+        logger.info("Sample text: '%s'", self.sample_text)
         
         stats = {
             "total_voices": len(self.recommended_voices),
@@ -232,21 +167,37 @@ class VoiceSampleDownloader:
         
         start_time = time.time()
         
-        for voice_number, voice_info in self.recommended_voices.items():
-            logger.info(f"Downloading sample for Voice {voice_number}: {voice_info['name']}")
-            
-            if self.download_voice_sample(voice_info['name'], voice_number):
-                stats["successful_downloads"] += 1
-            else:
-                stats["failed_downloads"] += 1
+        # Request every voice at once; the samples are independent, so the total time is
+        # that of the slowest request rather than the sum of all of them
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            futures = []
+            for voice_number, voice_info in self.recommended_voices.items():
+                logger.info("Downloading sample for Voice %s: %s", voice_number, voice_info['name'])
+                futures.append(executor.submit(self.download_voice_sample, voice_info['name'], voice_number))
             
-            # Add delay between requests
-            time.sleep(2)
+            for future in as_completed(futures):
+                if future.result():
+                    stats["successful_downloads"] += 1
+                else:
+                    stats["failed_downloads"] += 1
         
         stats["processing_time"] = time.time() - start_time
         
         return stats
     
+    def scan_voice_samples(self) -> Dict[str, int]:
+        """
+        List the voice samples folder once.
+        
+        Returns:
+            Dict[str, int]: Size in bytes of each file in the folder, by filename
+        """
+        try:
+            with os.scandir(self.voice_samples_folder) as entries:
+                return {entry.name: entry.stat().st_size for entry in entries if entry.is_file()}
+        except OSError:
+            return {}
+    
     def display_download_summary(self):
         """
         Display summary of downloaded files.
@@ -258,13 +209,12 @@ class VoiceSampleDownloader:
         print(f"Files saved in: {self.voice_samples_folder}/")
         print("\nDownloaded files:")
         
-        for voice_number, voice_info in self.recommended_voices.items():
-            filename = f"voice_sample_{voice_number}_{voice_info['name'].split('-')[-1]}_vijay.mp3"
-            filepath = os.path.join(self.voice_samples_folder, filename)
+        existing_files = self.scan_voice_samples()
+        for meta in self.voice_meta.values():
+            filename = meta["filename"]
             
-            if os.path.exists(filepath):
-                file_size = os.path.getsize(filepath)
-                print(f"✓ {filename} ({file_size} bytes)")
+            if filename in existing_files:
+                print(f"✓ {filename} ({existing_files[filename]} bytes)")
             else:
                 print(f"✗ {filename} (Failed to download)")
         
@@ -331,7 +281,7 @@ def main():
         logger.info("Voice sample download process completed successfully")
         
     except Exception as e:
-        logger.error(f"Error in main process: {e}")
+        logger.error("Error in main process: %s", e)
         raise
 
 if __name__ == "__main__":
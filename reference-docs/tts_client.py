@@ -0,0 +1,588 @@
+#!/usr/bin/env python3
+"""
+tts_client.py
+
+Google Cloud Text-to-Speech access shared by the voice sample scripts
+(01_06_Voice_Selection.py and 01_07_Download_Voice_Samples.py): gcloud lookup,
+project ID, HTTP session, rate limiting and the content-addressed sample cache.
+01_05_Generate_Audio_Files.py builds on the same helpers for its word audio.
+
+Author: AI Assistant
+Date: 2024
+"""
+
+import functools
+import hashlib
+import json
+import os
+import shutil
+import threading
+import logging
+import time
+import requests
+import subprocess
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from urllib3.util.retry import Retry
+from typing import Iterator, Optional
+import base64
+import binascii
+
+# Faster serialization of the REST request bodies (pip install orjson)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# google-auth reads the project from Application Default Credentials (pip install google-auth)
+try:
+    from google.auth import default as google_auth_default
+    from google.auth.exceptions import DefaultCredentialsError
+except ImportError:
+    google_auth_default = None
+
+logger = logging.getLogger(__name__)
+
+# Number of voice samples requested from the Text-to-Speech API at the same time
+MAX_CONCURRENT_REQUESTS = 8
+
+# Combined request rate allowed across all worker threads (Text-to-Speech per-minute quota)
+REQUESTS_PER_MINUTE = 300
+
+# Rate-limit and transient server errors retried by the HTTP session, with exponential
+# backoff (a Retry-After header from the server is honoured)
+HTTP_MAX_RETRIES = 3
+HTTP_RETRY_BACKOFF_FACTOR = 0.5
+HTTP_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Text-to-Speech REST endpoint, used when google-cloud-texttospeech is not installed
+TTS_SYNTHESIZE_URL = "https://texttospeech.googleapis.com/v1/text:synthesize"
+
+# Subfolder of the voice samples folder holding synthesized audio named by a hash of its
+# text, voice, encoding and language, so an unchanged sample is never requested twice
+SAMPLE_CACHE_FOLDER = ".cache"
+
+# Size of the response chunks read from the REST API and of the audio file write buffer,
+# so memory per request stays bounded however long the audio is
+AUDIO_STREAM_CHUNK_BYTES = 64 * 1024
+AUDIO_WRITE_BUFFER_BYTES = 1 << 20
+
+# Remembers where gcloud was found, so later runs skip probing the install locations
+GCLOUD_PATH_CACHE_FILE = os.path.expanduser("~/.voice_selector_cache.json")
+
+# Common gcloud install locations, probed in order
+GCLOUD_CANDIDATE_PATHS = (
+    "gcloud",
+    r"C:\Program Files\Google\Cloud SDK\google-cloud-sdk\bin\gcloud.cmd",
+    r"C:\Program Files (x86)\Google\Cloud SDK\google-cloud-sdk\bin\gcloud.cmd",
+    os.path.expanduser("~/AppData/Local/Google/Cloud SDK/google-cloud-sdk/bin/gcloud.cmd"),
+    os.path.expanduser("~/google-cloud-sdk/bin/gcloud.cmd")
+)
+
+# Credentials file written by 'gcloud auth application-default login'
+ADC_CREDENTIALS_FILE = os.path.join(
+    os.environ.get("CLOUDSDK_CONFIG")
+    or (os.path.join(os.environ["APPDATA"], "gcloud") if os.name == "nt" and "APPDATA" in os.environ
+        else os.path.expanduser("~/.config/gcloud")),
+    "application_default_credentials.json"
+)
+
+# Time allowed for each 'gcloud --version' probe; the candidates are probed in parallel
+GCLOUD_PROBE_TIMEOUT_SECONDS = 5
+
+class RateLimiter:
+    """
+    Thread-safe limiter that spaces API calls evenly to stay within a per-minute quota.
+    
+    Each call to acquire() reserves the next free time slot and sleeps until it arrives,
+    so concurrent workers share the quota instead of each sleeping a fixed amount.
+    """
+    
+    def __init__(self, requests_per_minute: int = REQUESTS_PER_MINUTE):
+        """
+        Args:
+            requests_per_minute (int): Maximum number of requests started per minute
+        """
+        self.interval = 60.0 / requests_per_minute
+        self.lock = threading.Lock()
+        self.next_slot = time.monotonic()
+    
+    def acquire(self):
+        """
+        Block until the caller may start its next request.
+        """
+        with self.lock:
+            now = time.monotonic()
+            slot = max(self.next_slot, now)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+    
+    def pause(self, seconds: float):
+        """
+        Hold back every worker's next request for the given number of seconds.
+        
+        Args:
+            seconds (float): How long the Text-to-Speech API asked us to wait
+        """
+        with self.lock:
+            self.next_slot = max(self.next_slot, time.monotonic() + seconds)
+
+def create_session(max_retries: int = HTTP_MAX_RETRIES,
+                   status_codes: tuple = HTTP_RETRY_STATUS_CODES,
+                   pool_size: int = MAX_CONCURRENT_REQUESTS) -> requests.Session:
+    """
+    Create an HTTP session to be shared by all worker threads.
+    
+    The connection pool holds one connection per worker, and the given server errors
+    are retried (honouring any Retry-After header) before a request is reported as failed.
+    
+    Args:
+        max_retries (int): Retries per request before the error response is returned
+        status_codes (tuple): HTTP status codes that are retried
+        pool_size (int): Number of connections kept open, one per worker thread
+    
+    Returns:
+        requests.Session: Session with a pooled, retrying HTTPS adapter
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=HTTP_RETRY_BACKOFF_FACTOR,
+        status_forcelist=status_codes,
+        # synthesize requests have no side effects, so POST is safe to retry
+        allowed_methods=frozenset({"GET", "POST"}),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+def link_cached_audio(cache_path: str, filepath: str):
+    """
+    Make a cached audio file available under its output file name.
+    
+    A hard link shares the cached data without using more disk space; the file is
+    copied instead where hard links are not supported.
+    
+    Args:
+        cache_path (str): Path of the file in the audio cache
+        filepath (str): Path of the audio file to create
+    """
+    try:
+        os.link(cache_path, filepath)
+    except FileExistsError:
+        pass
+    except OSError:
+        shutil.copyfile(cache_path, filepath)
+
+def probe_gcloud(path: str) -> bool:
+    """
+    Check whether a gcloud candidate path runs.
+    
+    Args:
+        path (str): Candidate gcloud executable
+        
+    Returns:
+        bool: True if 'gcloud --version' succeeded
+    """
+    try:
+        result = subprocess.run([path, '--version'],
+                              capture_output=True, text=True, timeout=GCLOUD_PROBE_TIMEOUT_SECONDS)
+        return result.returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+@functools.lru_cache(maxsize=1)
+def locate_gcloud() -> Optional[str]:
+    """
+    Find a working gcloud executable, once per process.
+    
+    The path found by an earlier run is reused while it still resolves to an
+    executable; otherwise the candidates that exist are resolved to full paths, probed
+    with 'gcloud --version' at the same time, and the first one to answer is used.
+    
+    Returns:
+        Optional[str]: The gcloud path, or None if gcloud could not be found
+    """
+    try:
+        with open(GCLOUD_PATH_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cached_path = json.load(f).get("gcloud_path")
+        if cached_path and shutil.which(cached_path):
+            return cached_path
+    except (OSError, ValueError, AttributeError):
+        pass
+    
+    # Probe the resolved path: on Windows a bare "gcloud" cannot be started without its
+    # .cmd extension, so the PATH entry must be expanded to the full file name
+    candidates = []
+    for candidate in GCLOUD_CANDIDATE_PATHS:
+        resolved = shutil.which(candidate)
+        if resolved and resolved not in candidates:
+            candidates.append(resolved)
+    if not candidates:
+        return None
+    
+    executor = ThreadPoolExecutor(max_workers=len(candidates))
+    try:
+        pending = {executor.submit(probe_gcloud, path): path for path in candidates}
+        path = None
+        while pending and path is None:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.result() and path is None:
+                    path = pending[future]
+                del pending[future]
+    finally:
+        # Don't wait for slower probes once one has answered
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    if path is None:
+        return None
+    logger.info("Found gcloud at: %s", path)
+    
+    try:
+        with open(GCLOUD_PATH_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({"gcloud_path": path}, f)
+    except OSError as e:
+        logger.debug("Could not save gcloud path to %s: %s", GCLOUD_PATH_CACHE_FILE, e)
+    return path
+
+def read_gcloud_project(gcloud_path: str) -> Optional[str]:
+    """
+    Read the active project from the gcloud configuration.
+    
+    Args:
+        gcloud_path (str): The gcloud executable found by locate_gcloud
+    
+    Returns:
+        Optional[str]: The configured project ID, or None if it cannot be determined
+    """
+    try:
+        result = subprocess.run([gcloud_path, 'config', 'list', '--format=value(core.project)'],
+                                capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.warning("Failed to get project ID from gcloud: %s", e)
+        return None
+    
+    if result.returncode != 0:
+        logger.warning("Failed to get project ID from gcloud: %s", result.stderr.strip())
+        return None
+    
+    return result.stdout.strip() or None
+
+def load_project_id() -> Optional[str]:
+    """
+    Find the Google Cloud project from the environment or Application Default Credentials.
+    
+    GOOGLE_CLOUD_PROJECT takes precedence. The Application Default Credentials are
+    only consulted when a credentials file exists, since without one google-auth
+    first probes the Compute Engine metadata server, which can take seconds. For
+    user credentials google-auth may itself ask gcloud for the project.
+    
+    Returns:
+        Optional[str]: The project ID, or None to fall back to the gcloud configuration
+    """
+    project_id = os.environ.get("GOOGLE_CLOUD_PROJECT")
+    if project_id or google_auth_default is None:
+        return project_id
+    if not (os.environ.get("GOOGLE_APPLICATION_CREDENTIALS") or os.path.isfile(ADC_CREDENTIALS_FILE)):
+        return None
+    
+    try:
+        _, project_id = google_auth_default()
+    except DefaultCredentialsError as e:
+        logger.debug("No Application Default Credentials: %s", e)
+        return None
+    return project_id
+
+def cache_key(text: str, voice_name: str, encoding: str = "MP3") -> str:
+    """
+    Build the audio cache key for a synthesis request.
+    
+    Args:
+        text (str): Text sent to the TTS API
+        voice_name (str): The Chirp3 voice name
+        encoding (str): Requested audio encoding
+    
+    Returns:
+        str: SHA-256 hex digest of the text, voice, encoding and language
+    """
+    request = {"text": text, "voice": voice_name, "enc": encoding, "lang": "en-US"}
+    return hashlib.sha256(json.dumps(request, sort_keys=True).encode("utf-8")).hexdigest()
+
+def create_grpc_client(project_id: str, encoding: str = "MP3") -> tuple:
+    """
+    Create the gRPC Text-to-Speech client, if google-cloud-texttospeech is installed.
+    
+    gRPC returns the audio as raw bytes (no base64) and multiplexes all worker
+    threads' requests over one HTTP/2 connection.
+    
+    Args:
+        project_id (str): Google Cloud project billed for the requests
+        encoding (str): Audio encoding requested with every call
+    
+    Returns:
+        tuple: The shared client and its texttospeech.AudioConfig, or (None, None) to
+            use the REST API
+    """
+    try:
+        from google.cloud import texttospeech
+    except ImportError:
+        logger.info("google-cloud-texttospeech not installed, using the REST API")
+        return None, None
+    
+    try:
+        client = texttospeech.TextToSpeechClient(
+            client_options={"quota_project_id": project_id}
+        )
+    except Exception as e:
+        logger.warning("gRPC Text-to-Speech client unavailable, using the REST API: %s", e)
+        return None, None
+    
+    audio_config = texttospeech.AudioConfig(
+        audio_encoding=texttospeech.AudioEncoding[encoding]
+    )
+    logger.info("Using gRPC Text-to-Speech client")
+    return client, audio_config
+
+def stream_audio_content(chunks: Iterator[bytes], out) -> None:
+    """
+    Decode the base64 audio from a streamed synthesize response body into a file.
+    
+    The response is a small JSON object whose only large value is the audio, so the body
+    is buffered only up to the start of that value; the base64 text after it is decoded in
+    4-byte-aligned pieces and written as it arrives.
+    
+    Args:
+        chunks (Iterator[bytes]): Raw response body chunks
+        out: Binary file the audio is written to
+    """
+    chunks = iter(chunks)
+    head = b""
+    start = 0
+    for chunk in chunks:
+        head += chunk
+        key = head.find(b'"audioContent"')
+        colon = head.find(b':', key) if key != -1 else -1
+        start = head.find(b'"', colon) + 1 if colon != -1 else 0
+        if start:
+            break
+    else:
+        # Unexpected layout; fall back to a full JSON parse
+        out.write(base64.b64decode(json.loads(head)['audioContent']))
+        return
+    
+    pending = head[start:]
+    while True:
+        end = pending.find(b'"')
+        if end != -1:
+            out.write(binascii.a2b_base64(pending[:end]))
+            return
+        aligned = len(pending) - len(pending) % 4
+        out.write(binascii.a2b_base64(pending[:aligned]))
+        pending = pending[aligned:]
+        chunk = next(chunks, None)
+        if chunk is None:
+            raise ValueError("Synthesize response ended inside the audio content")
+        pending += chunk
+
+class TTSClient:
+    def __init__(self):
+        """
+        Initialize the TTSClient; the project and gRPC client are set up by
+        test_gcloud_availability.
+        """
+        # One HTTP session for every request, so connections are kept alive and reused
+        self.session = create_session()
+        
+        # Shared by all worker threads so together they stay within the API quota
+        self.limiter = RateLimiter()
+        
+        # Set by test_gcloud_availability
+        self.project_id = None
+        self.grpc_client = None
+        self.tts_audio_config = None
+        
+        # REST request bodies serialized once per text, keyed by text
+        self.payload_templates = {}
+    
+    def test_gcloud_availability(self) -> bool:
+        """
+        Test if gcloud is available and configured, and resolve the project ID.
+        
+        Returns:
+            bool: True if gcloud is available, False otherwise
+        """
+        # Already checked successfully in this process
+        if self.project_id:
+            return True
+        
+        # A project from the environment or the credentials file makes the gcloud check unnecessary
+        self.project_id = load_project_id()
+        if self.project_id:
+            logger.info("OK - Using Google Cloud project %s", self.project_id)
+            self.grpc_client, self.tts_audio_config = create_grpc_client(self.project_id)
+            return True
+        
+        gcloud_path = locate_gcloud()
+        if not gcloud_path:
+            logger.error("X - gcloud not found in common locations")
+            return False
+        
+        # Project billed for TTS requests, looked up once here rather than per request
+        self.project_id = read_gcloud_project(gcloud_path)
+        if not self.project_id:
+            logger.error("X - No Google Cloud project configured. Run: gcloud auth login, "
+                         "then gcloud config set project YOUR_PROJECT_ID")
+            return False
+        logger.info("OK - gcloud is available and configured")
+        
+        # gRPC Text-to-Speech client, used instead of the REST API when installed
+        self.grpc_client, self.tts_audio_config = create_grpc_client(self.project_id)
+        return True
+    
+    def synthesize_grpc(self, voice_name: str, text: str) -> bytes:
+        """
+        Synthesize text with the gRPC Text-to-Speech client.
+        
+        Args:
+            voice_name (str): The Chirp3 voice name
+            text (str): Text to synthesize
+        
+        Returns:
+            bytes: The audio content
+        """
+        from google.cloud import texttospeech
+        
+        response = self.grpc_client.synthesize_speech(
+            input=texttospeech.SynthesisInput(text=text),
+            voice=texttospeech.VoiceSelectionParams(language_code="en-US", name=voice_name),
+            audio_config=self.tts_audio_config,
+            timeout=30
+        )
+        return response.audio_content
+    
+    def payload_template(self, text: str) -> bytes:
+        """
+        Get the serialized REST request body for a text, with a placeholder voice name.
+        
+        Args:
+            text (str): Text to synthesize
+        
+        Returns:
+            bytes: JSON request body whose voice name is "__VOICE__"
+        """
+        template = self.payload_templates.get(text)
+        if template is None:
+            payload = {
+                "input": {
+                    "text": text
+                },
+                "voice": {
+                    "languageCode": "en-US",
+                    "name": "__VOICE__",
+                    "voiceClone": {}
+                },
+                "audioConfig": {
+                    "audioEncoding": "MP3"
+                }
+            }
+            template = orjson.dumps(payload) if orjson else json.dumps(payload).encode("utf-8")
+            self.payload_templates[text] = template
+        return template
+    
+    def synthesize_rest(self, voice_name: str, text: str, out) -> bool:
+        """
+        Synthesize text with the Text-to-Speech REST API, streaming the decoded
+        audio into an open file.
+        
+        Args:
+            voice_name (str): The Chirp3 voice name
+            text (str): Text to synthesize
+            out: Binary file the audio is written to
+        
+        Returns:
+            bool: True if the audio was written, False if the request failed
+        """
+        # Prepare the request payload; only the voice name changes between requests
+        body = self.payload_template(text).replace(b'"__VOICE__"', json.dumps(voice_name).encode("utf-8"))
+        
+        # Make the API request
+        headers = {
+            "Content-Type": "application/json",
+            "X-Goog-User-Project": self.project_id
+        }
+        
+        with self.session.post(
+            TTS_SYNTHESIZE_URL,
+            headers=headers,
+            data=body,
+            timeout=30,
+            stream=True
+        ) as response:
+            if response.status_code != 200:
+                logger.error("API request failed for %s: %s - %s", voice_name, response.status_code, response.text)
+                return False
+            
+            # Decode the audio content as it arrives
+            stream_audio_content(response.iter_content(chunk_size=AUDIO_STREAM_CHUNK_BYTES), out)
+        return True
+    
+    def synthesize(self, voice_name: str, text: str, out_path: str) -> bool:
+        """
+        Save the audio for a text and voice as an MP3 file.
+        
+        The audio is taken from the sample cache next to out_path when the same text and
+        voice were synthesized before; otherwise it is requested from the API and cached.
+        
+        Args:
+            voice_name (str): The Chirp3 voice name
+            text (str): Text to synthesize
+            out_path (str): Path of the MP3 file to create
+        
+        Returns:
+            bool: True if the file was created, False if the request failed
+        """
+        cache_folder = os.path.join(os.path.dirname(out_path), SAMPLE_CACHE_FOLDER)
+        os.makedirs(cache_folder, exist_ok=True)
+        
+        # Reuse audio already synthesized for the same text and voice
+        cache_path = os.path.join(cache_folder, cache_key(text, voice_name) + ".mp3")
+        if os.path.exists(cache_path):
+            link_cached_audio(cache_path, out_path)
+            logger.info("Reused cached audio for %s", voice_name)
+            return True
+        
+        # Make the API request, saving the audio in the cache first (write to a temp file,
+        # then rename, so an interrupted write never leaves a truncated cache entry)
+        temp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+        self.limiter.acquire()
+        try:
+            with open(temp_path, "wb", buffering=AUDIO_WRITE_BUFFER_BYTES) as out:
+                if self.grpc_client is not None:
+                    out.write(self.synthesize_grpc(voice_name, text))
+                elif not self.synthesize_rest(voice_name, text, out):
+                    return False
+            os.replace(temp_path, cache_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        
+        # Then link it into place
+        link_cached_audio(cache_path, out_path)
+        return True
+
+@functools.lru_cache(maxsize=1)
+def get_tts_client() -> TTSClient:
+    """
+    Get the TTSClient shared by every script running in this process.
+    
+    Returns:
+        TTSClient: The shared client
+    """
+    return TTSClient()